@@ -0,0 +1,49 @@
+"""
+Lookups against a fake backend with simulated round-trip latency: one
+round-trip per element via `iter.fmap` compared to coalesced batches.
+"""
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+from common import best_of, report
+from ftoolz.functoolz import iter as fiter
+from ftoolz.functoolz.batch import Coalescer
+
+ROUND_TRIP = 0.001
+PER_KEY = 0.00001
+
+
+def fetch_many(keys: List[int]) -> Dict[int, int]:
+    time.sleep(ROUND_TRIP + PER_KEY * len(keys))
+    return {k: k * k for k in keys}
+
+
+def fetch_one(k: int) -> Optional[int]:
+    return fetch_many([k]).get(k)
+
+
+def main() -> None:
+    rows = []
+    for n in (100, 1_000):
+        keys = [i % (n // 2) for i in range(n)]
+        expected = list(fiter.fmap(fetch_one, keys))
+        loader = Coalescer(fetch_many, max_batch_size=100, max_wait=0.002)
+
+        def threaded() -> List[Optional[int]]:
+            with ThreadPoolExecutor(32) as pool:
+                return list(pool.map(loader, keys))
+
+        assert list(loader.map(keys)) == threaded() == expected
+        rows.append((
+            n,
+            best_of(lambda: list(fiter.fmap(fetch_one, keys)), repeat=3),
+            best_of(lambda: list(loader.map(keys)), repeat=3),
+            best_of(threaded, repeat=3),
+        ))
+
+    report('seconds', ('n', 'fmap(one)', 'map(batch)', 'threads(32)'), rows)
+
+
+if __name__ == '__main__':
+    main()
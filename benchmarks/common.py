@@ -0,0 +1,44 @@
+"""
+Shared helpers for benchmark scripts.
+
+Benchmarks are plain scripts that are not part of the test suite, run them
+from the repository root with installed `ftoolz`, e.g.::
+
+    python benchmarks/lookahead.py
+"""
+import timeit
+from typing import Callable, Iterable, Sequence
+
+
+def best_of(
+        stmt: Callable[[], object],
+        repeat: int = 5,
+        number: int = 1
+) -> float:
+    """
+    Return the best wall time (in seconds) of `number` calls of `stmt`.
+    """
+    return min(timeit.repeat(stmt, repeat=repeat, number=number)) / number
+
+
+def report(
+        title: str,
+        header: Sequence[str],
+        rows: Iterable[Sequence[object]]
+) -> None:
+    """
+    Print benchmark results as a simple aligned table.
+    """
+    cells = [
+        [f'{c:.4g}' if isinstance(c, float) else str(c) for c in row]
+        for row in rows
+    ]
+    widths = [
+        max([14, len(h)] + [len(row[i]) for row in cells])
+        for i, h in enumerate(header)
+    ]
+    print(f'\n{title}')
+    print(' | '.join(f'{h:>{w}}' for h, w in zip(header, widths)))
+    print('-+-'.join('-' * w for w in widths))
+    for row in cells:
+        print(' | '.join(f'{c:>{w}}' for c, w in zip(row, widths)))
@@ -0,0 +1,87 @@
+"""
+Per-call overhead of sequence-aware fast paths in `ftoolz.itertoolz` for
+small (and some larger) inputs compared to the generic iterable paths.
+"""
+from collections import deque
+from functools import reduce
+from itertools import islice
+from typing import Callable, Iterable, List, Reversible, TypeVar
+
+from cytoolz.itertoolz import peek
+
+from common import best_of, report
+from ftoolz.itertoolz import collect, empty, fold_right, take
+from ftoolz.typing import Seq
+
+A = TypeVar('A')
+B = TypeVar('B')
+E = TypeVar('E')
+
+NUMBER = 100_000
+
+
+def legacy_collect(items: Iterable[E]) -> Seq[E]:
+    return items if isinstance(items, Seq) else list(items)
+
+
+def legacy_empty(it: Iterable[E]) -> object:
+    try:
+        _, it = peek(it)
+        return False, it
+    except StopIteration:
+        return True, iter([])
+
+
+def legacy_fold_right(op: Callable[[A, B], B], xs: Iterable[A], z: B) -> B:
+    seq: Reversible[A] = xs if isinstance(xs, Reversible) else list(xs)
+    return reduce(lambda right, left: op(left, right), reversed(seq), z)
+
+
+def legacy_take(n: int, it: Iterable[E]) -> List[E]:
+    return list(islice(it, n))
+
+
+def per_call(f: Callable[[], object]) -> float:
+    return best_of(f, repeat=5, number=NUMBER) * 1e9
+
+
+def add(a: int, b: int) -> int:
+    return a + b
+
+
+def main() -> None:
+    inputs = {
+        'list[5]': [1, 2, 3, 4, 5],
+        'tuple[5]': (1, 2, 3, 4, 5),
+        'deque[5]': deque([1, 2, 3, 4, 5]),
+        'range[10k]': range(10_000),
+    }
+    rows = []
+    for name, xs in inputs.items():
+        cases = (
+            ('collect', legacy_collect, collect),
+            ('empty', legacy_empty, empty),
+        )
+        for fn, legacy, current in cases:
+            rows.append((
+                f'{fn}({name})',
+                per_call(lambda: legacy(xs)),
+                per_call(lambda: current(xs)),
+            ))
+        rows.append((
+            f'take({name})',
+            per_call(lambda: legacy_take(3, xs)),
+            per_call(lambda: take(3, xs)),
+        ))
+        if len(xs) <= 5:
+            rows.append((
+                f'fold_right({name})',
+                per_call(lambda: legacy_fold_right(add, xs, 0)),
+                per_call(lambda: fold_right(add, xs, 0)),
+            ))
+
+    report('ns per call', ('case', 'legacy', 'current'), rows)
+
+
+if __name__ == '__main__':
+    main()
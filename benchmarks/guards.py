@@ -0,0 +1,51 @@
+"""
+Per-call overhead of functions guarded by `silenced` / `guarded` compared to
+the former implementation going through `attempt` and `try_except`.
+"""
+import functools
+from typing import Any, Callable, Optional, TypeVar
+
+from common import best_of, report
+from ftoolz.functoolz import guarded, silenced, try_except
+
+A = TypeVar('A')
+
+NUMBER = 200_000
+
+
+def legacy_attempt(e: Any, f: Callable[..., A], *args: Any) -> Optional[A]:
+    def none(*_args: Any) -> Optional[A]:
+        return None
+
+    return try_except(e, f, none, *args)
+
+
+def legacy_silenced(f: Callable[..., A]) -> Callable[..., Optional[A]]:
+    @functools.wraps(f)
+    def wrapper(*args: Any) -> Optional[A]:
+        return legacy_attempt(Exception, f, *args)
+
+    return wrapper
+
+
+def per_call(f: Callable[..., object], arg: str) -> float:
+    return best_of(lambda: f(arg), repeat=5, number=NUMBER) * 1e9
+
+
+def main() -> None:
+    variants = (
+        ('bare int', int),
+        ('legacy silenced', legacy_silenced(int)),
+        ('silenced', silenced(int)),
+        ('guarded(stats)', guarded(int, stats=True)),
+    )
+    rows = [
+        (name, per_call(f, '42'), per_call(f, 'x') if name != 'bare int'
+         else float('nan'))
+        for name, f in variants
+    ]
+    report('ns per call', ('variant', 'success', 'failure'), rows)
+
+
+if __name__ == '__main__':
+    main()
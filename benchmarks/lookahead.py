@@ -0,0 +1,65 @@
+"""
+Per-item cost of `iter_with_final` / `enumerate_with_final` as the stream
+length grows. The legacy implementation allocated a new list per item, the
+`Lookahead` based one runs in constant memory.
+"""
+from collections import deque
+from typing import Iterable, List, Tuple, TypeVar
+
+from cytoolz.itertoolz import drop, peek
+
+from common import best_of, report
+from ftoolz.adt.lookahead import Lookahead
+from ftoolz.itertoolz import enumerate_with_final, iter_with_final
+
+E = TypeVar('E')
+
+
+def legacy_iter_with_final(it: Iterable[E]) -> Iterable[Tuple[E, bool]]:
+    try:
+        _, it = peek(it)
+    except StopIteration:
+        return
+    it = iter(it)
+    buffer: List[E] = [next(it)]
+    for i in it:
+        buffer.append(i)
+        head, tail = peek(buffer)
+        item, buffer = head, list(drop(1, tail))
+        yield item, False
+    yield buffer[0], True
+
+
+def consume(it: Iterable[object]) -> None:
+    deque(it, maxlen=0)
+
+
+def main() -> None:
+    rows = []
+    for n in (10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6):
+        repeat = 3 if n >= 10 ** 6 else 5
+        legacy = best_of(
+            lambda: consume(legacy_iter_with_final(range(n))), repeat
+        )
+        final = best_of(lambda: consume(iter_with_final(range(n))), repeat)
+        enum = best_of(
+            lambda: consume(enumerate_with_final(range(n))), repeat
+        )
+        raw = best_of(lambda: consume(Lookahead(range(n))), repeat)
+        rows.append((
+            n,
+            legacy / n * 1e9,
+            final / n * 1e9,
+            enum / n * 1e9,
+            raw / n * 1e9,
+        ))
+
+    report(
+        'ns per item',
+        ('n', 'legacy', 'iter_w_final', 'enum_w_final', 'Lookahead'),
+        rows,
+    )
+
+
+if __name__ == '__main__':
+    main()
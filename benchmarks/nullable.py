@@ -0,0 +1,47 @@
+"""
+`ftoolz.functoolz.nullable` compared to row-wise `opt.fmap2` over lists of
+optionals, for plain Python columns and NumPy-backed columns.
+"""
+import random
+
+import numpy as np  # type: ignore
+
+from common import best_of, report
+from ftoolz.adt.column import Column
+from ftoolz.functoolz import nullable, opt
+
+
+def add(a: float, b: float) -> float:
+    return a + b
+
+
+def main() -> None:
+    rows = []
+    for n in (1_000, 100_000):
+        xs = [None if random.random() < 0.1 else random.random()
+              for _ in range(n)]
+        ys = [None if random.random() < 0.1 else random.random()
+              for _ in range(n)]
+        cx, cy = Column.of(xs), Column.of(ys)
+        nx = Column(np.array([x or 0.0 for x in xs]), cx.validity)
+        ny = Column(np.array([y or 0.0 for y in ys]), cy.validity)
+        mx = np.ma.masked_array(nx.values, mask=[x is None for x in xs])
+        my = np.ma.masked_array(ny.values, mask=[y is None for y in ys])
+
+        t_rows = best_of(
+            lambda: [opt.fmap2(add, x, y) for x, y in zip(xs, ys)], repeat=3
+        )
+        cases = (
+            ('column', lambda: nullable.fmap2(add, cx, cy)),
+            ('ndarray column', lambda: nullable.fmap2(np.add, nx, ny)),
+            ('masked array', lambda: nullable.fmap2(np.add, mx, my)),
+        )
+        for name, run in cases:
+            t = best_of(run, repeat=3)
+            rows.append((name, n, t_rows, t, t_rows / t))
+
+    report('seconds', ('case', 'n', 'opt.fmap2', 'nullable', 'speedup'), rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+"""
+Record normalization with nested `opt.*` calls compared to the same steps
+compiled by `OptionalPipeline.compile`.
+
+Records are dictionaries of raw strings, a fraction of them has missing or
+invalid fields, so both early exit and the full path are exercised.
+"""
+import random
+from typing import Any, Dict, Optional, Tuple
+
+from common import best_of, report
+from ftoolz.functoolz import opt
+from ftoolz.functoolz.optpipeline import OptionalPipeline
+
+Record = Dict[str, Any]
+User = Tuple[str, int, str]
+
+
+def non_empty(s: str) -> Optional[str]:
+    return s or None
+
+
+def parse_age(s: str) -> Optional[int]:
+    return int(s) if s.isdigit() and int(s) < 150 else None
+
+
+def valid_email(s: str) -> Optional[str]:
+    return s if '@' in s else None
+
+
+def make_user(name: str, age: int, email: str) -> User:
+    return name, age, email
+
+
+def nested(r: Optional[Record]) -> Optional[User]:
+    def user(rec: Record) -> Optional[User]:
+        name = opt.fmap(str.title, opt.flatmap(
+            non_empty, opt.fmap(str.strip, rec.get('name'))
+        ))
+        age = opt.flatmap(parse_age, opt.fmap(str.strip, rec.get('age')))
+        email = opt.flatmap(valid_email, opt.fmap(
+            str.lower, opt.fmap(str.strip, rec.get('email'))
+        ))
+        return opt.fmap3(make_user, name, age, email)
+
+    return opt.flatmap(user, r)
+
+
+def compiled() -> Any:
+    name = OptionalPipeline(lambda r: r.get('name')).map(str.strip) \
+        .flatmap(non_empty).map(str.title).compile()
+    age = OptionalPipeline(lambda r: r.get('age')).map(str.strip) \
+        .flatmap(parse_age).compile()
+    email = OptionalPipeline(lambda r: r.get('email')).map(str.strip) \
+        .map(str.lower).flatmap(valid_email).compile()
+    return OptionalPipeline().fmapN(make_user, name, age, email).compile()
+
+
+def record(rnd: random.Random) -> Record:
+    r = {
+        'name': rnd.choice([' jane doe ', 'JOHN', '  ', 'ann lee']),
+        'age': rnd.choice([' 42', '7', 'x', '300']),
+        'email': rnd.choice(['A@X.COM ', 'b@y.org', 'nope']),
+    }
+    if rnd.random() < 0.1:
+        del r['email']
+    return r
+
+
+def main() -> None:
+    rnd = random.Random(0)
+    f = compiled()
+    rows = []
+    for n in (1_000, 100_000):
+        records = [record(rnd) for _ in range(n)]
+        assert [nested(r) for r in records] == [f(r) for r in records]
+        t_nested = best_of(lambda: [nested(r) for r in records], repeat=3)
+        t_compiled = best_of(lambda: [f(r) for r in records], repeat=3)
+        rows.append((n, t_nested, t_compiled, t_nested / t_compiled))
+
+    report('seconds', ('n', 'nested opt', 'compiled', 'speedup'), rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+"""
+Scaling of parallel `ftoolz.functoolz.par.fmap` across worker counts for
+a CPU-bound function compared to sequential `iter.fmap`.
+"""
+import os
+from typing import List
+
+from common import best_of, report
+from ftoolz.functoolz import iter as fiter
+from ftoolz.functoolz import par
+
+N = 2_000
+
+
+def busy(x: int) -> int:
+    acc = 0
+    for i in range(2_000):
+        acc = (acc + i * x) % 1_000_003
+    return acc
+
+
+def main() -> None:
+    xs = list(range(N))
+    expected: List[int] = list(fiter.fmap(busy, xs))
+    baseline = best_of(lambda: list(fiter.fmap(busy, xs)), repeat=3)
+
+    rows = [('iter.fmap', 1, baseline, 1.0)]
+    cpus = os.cpu_count() or 1
+    workers = sorted({1, 2, cpus} | {w for w in (4, 8, 16, 32) if w <= cpus})
+    for executor in ('thread', 'process'):
+        for n in workers:
+            def run() -> List[int]:
+                return list(par.fmap(busy, xs, executor, workers=n))
+
+            assert run() == expected
+            t = best_of(run, repeat=3)
+            rows.append((f'par.fmap({executor})', n, t, baseline / t))
+
+    report(f'seconds for {N} items ({cpus} cpus)',
+           ('variant', 'workers', 'time', 'speedup'), rows)
+
+
+if __name__ == '__main__':
+    main()
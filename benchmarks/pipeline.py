@@ -0,0 +1,73 @@
+"""
+Throughput of a 10-stage map/filter/flatmap pipeline built from nested
+generators compared to the same pipeline fused by `Pipeline.compile`.
+"""
+from itertools import chain
+from typing import Callable, Iterable, List, Tuple
+
+from common import best_of, report
+from ftoolz.functoolz import iter as fiter
+from ftoolz.functoolz.pipeline import Pipeline, StageKind
+
+STAGES: List[Tuple[StageKind, Callable]] = [
+    (StageKind.MAP, lambda x: x + 1),
+    (StageKind.FILTER, lambda x: x % 3 != 0),
+    (StageKind.MAP, lambda x: x * 2),
+    (StageKind.FLATMAP, lambda x: (x, x + 1)),
+    (StageKind.MAP, lambda x: x - 1),
+    (StageKind.FILTER, lambda x: x % 5 != 0),
+    (StageKind.MAP, lambda x: x // 2),
+    (StageKind.MAP, abs),
+    (StageKind.FILTER, lambda x: x > 10),
+    (StageKind.MAP, lambda x: x & 0xFFFF),
+]
+
+
+def nested_builtins(it: Iterable[int]) -> Iterable[int]:
+    for kind, f in STAGES:
+        if kind is StageKind.MAP:
+            it = map(f, it)
+        elif kind is StageKind.FILTER:
+            it = filter(f, it)
+        else:
+            it = chain.from_iterable(map(f, it))
+    return it
+
+
+def nested_fmap(it: Iterable[int]) -> Iterable[int]:
+    for kind, f in STAGES:
+        if kind is StageKind.MAP:
+            it = fiter.fmap(f, it)
+        elif kind is StageKind.FILTER:
+            it = filter(f, it)
+        else:
+            it = fiter.flatmap(f, it)
+    return it
+
+
+def fused() -> Callable[[Iterable[int]], Iterable[int]]:
+    p = Pipeline()
+    for kind, f in STAGES:
+        p = getattr(p, kind.value)(f)
+    return p.compile()
+
+
+def main() -> None:
+    compiled = fused()
+    rows = []
+    for n in (1_000, 100_000, 1_000_000):
+        xs = range(n)
+        expected = list(nested_builtins(xs))
+        assert list(nested_fmap(xs)) == list(compiled(xs)) == expected
+        rows.append((
+            n,
+            best_of(lambda: sum(nested_builtins(xs))),
+            best_of(lambda: sum(nested_fmap(xs))),
+            best_of(lambda: sum(compiled(xs))),
+        ))
+
+    report('seconds', ('n', 'builtins', 'fmap', 'fused'), rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+"""
+`ftoolz.functoolz.seq` on NumPy arrays: per-item `tuple` path (plain
+function) compared to the vectorized path (ufunc or `vectorizable`).
+"""
+import math
+
+import numpy as np  # type: ignore
+
+from common import best_of, report
+from ftoolz.functoolz import seq, vectorizable
+
+
+def affine(x: float) -> float:
+    return 2.0 * x + 1.0
+
+
+def add(a: float, b: float) -> float:
+    return a + b
+
+
+def main() -> None:
+    vaffine = vectorizable(lambda x: 2.0 * x + 1.0)
+    rows = []
+    for n in (1_000, 100_000):
+        xs = np.random.rand(n)
+        ys = np.random.rand(n)
+        small = xs[:300]
+        cases = (
+            ('fmap', lambda: seq.fmap(affine, xs),
+             lambda: seq.fmap(vaffine, xs)),
+            ('zip_map', lambda: seq.zip_map(add, xs, ys),
+             lambda: seq.zip_map(np.add, xs, ys)),
+            ('fmap2[300x300]', lambda: seq.fmap2(add, small, small),
+             lambda: seq.fmap2(np.add, small, small)),
+            ('generate/arange', lambda: seq.generate(math.sqrt, n),
+             lambda: seq.fmap(np.sqrt, np.arange(n))),
+        )
+        for name, scalar, vector in cases:
+            t_scalar = best_of(scalar, repeat=3)
+            t_vector = best_of(vector, repeat=3)
+            rows.append((name, n, t_scalar, t_vector, t_scalar / t_vector))
+
+    report('seconds', ('case', 'n', 'tuple', 'vectorized', 'speedup'), rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+"""
+Optional traverse/sequence: legacy `fold_right` + `cons` implementation vs.
+the short-circuiting single forward pass.
+
+The best case has `None` at the very beginning of the input, the worst case
+has no `None` at all (every element has to be visited). The legacy
+implementation builds nested `cons` chains, so its worst case is quadratic.
+"""
+from functools import reduce
+from typing import Callable, Iterable, Optional, TypeVar
+
+from cytoolz.itertoolz import cons
+
+from common import best_of, report
+from ftoolz.functoolz.opt import fmap, fmap2
+from ftoolz.functoolz.traverse.opt import traverse_seq
+
+A = TypeVar('A')
+B = TypeVar('B')
+
+
+def legacy_traverse_seq(
+        f: Callable[[A], Optional[B]],
+        fa: Iterable[A]
+) -> Optional[Iterable[B]]:
+    def op(a: A, acc: Optional[Iterable[B]]) -> Optional[Iterable[B]]:
+        return fmap2(cons, f(a), acc)
+
+    empty: Optional[Iterable[B]] = iter([])
+    xs = list(fa)
+    result = reduce(lambda right, left: op(left, right), reversed(xs), empty)
+    return fmap(tuple, result)
+
+
+def positive(x: int) -> Optional[int]:
+    return x if x > 0 else None
+
+
+def main() -> None:
+    rows = []
+    for n in (10 ** 2, 10 ** 3, 5 * 10 ** 3, 10 ** 4):
+        best = (0,) + tuple(range(1, n))
+        worst = tuple(range(1, n + 1))
+        repeat = 3 if n >= 5 * 10 ** 3 else 5
+        rows.append((n, *(
+            best_of(lambda: traverse(positive, xs), repeat) * 1e6
+            for xs in (best, worst)
+            for traverse in (legacy_traverse_seq, traverse_seq)
+        )))
+
+    report(
+        'traverse_seq, us per call',
+        ('n', 'legacy best', 'new best', 'legacy worst', 'new worst'),
+        rows,
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,231 @@
+import sys
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Generic, Hashable, KeysView, Optional, \
+    Sized, Tuple, TypeVar, cast
+
+_V = TypeVar('_V')
+
+MISSING: Any = object()
+
+
+class CacheStats:
+    """
+    Counters of a :class:`Cache`. Evictions count entries dropped to satisfy
+    `maxsize` or `maxweight`, expirations count entries dropped due to `ttl`.
+
+    >>> CacheStats()
+    CacheStats(hits=0, misses=0, evictions=0, expirations=0)
+    """
+
+    __slots__ = ('hits', 'misses', 'evictions', 'expirations')
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        Fraction of lookups that were hits, `0.0` if there were none yet.
+
+        >>> CacheStats().hit_rate
+        0.0
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def reset(self) -> None:
+        self.hits = self.misses = self.evictions = self.expirations = 0
+
+    def __repr__(self) -> str:
+        return f'CacheStats(hits={self.hits}, misses={self.misses}, ' \
+               f'evictions={self.evictions}, ' \
+               f'expirations={self.expirations})'
+
+
+class Cache(Generic[_V], Sized):
+    """
+    Key-value cache with least recently used (LRU) eviction bounded by number
+    of entries (`maxsize`) and/or total weight of values (`maxweight`, e.g.
+    bytes measured by `weigh`). Entries older than `ttl` seconds (measured by
+    `clock`) are treated as missing.
+
+    >>> cache = Cache(maxsize=2)
+    >>> cache.put('a', 1)
+    >>> cache.put('b', 2)
+    >>> cache.get('a')
+    1
+    >>> cache.put('c', 3)
+    >>> cache.get('b') is MISSING, cache.get('c')
+    (True, 3)
+    >>> cache.stats
+    CacheStats(hits=2, misses=1, evictions=1, expirations=0)
+
+    Values weighing more than `maxweight` on their own are not cached at all.
+
+    >>> cache = Cache(maxweight=10, weigh=len)
+    >>> cache.put('a', 'abcdef')
+    >>> cache.put('b', 'ghijkl')
+    >>> cache.put('c', 'x' * 11)
+    >>> list(cache.keys()), cache.weight
+    (['b'], 6)
+
+    Expiration is checked lazily on lookup.
+
+    >>> now = [0.0]
+    >>> cache = Cache(ttl=10, clock=lambda: now[0])
+    >>> cache.put('a', 1)
+    >>> now[0] = 10.5
+    >>> cache.get('a') is MISSING, cache.stats.expirations
+    (True, 1)
+
+    **Warn**: This implementation is **not** thread-safe.
+    """
+
+    __slots__ = (
+        '_entries', '_maxsize', '_ttl', '_maxweight', '_weigh', '_clock',
+        '_weight', 'stats',
+    )
+
+    def __init__(
+            self,
+            maxsize: Optional[int] = None,
+            ttl: Optional[float] = None,
+            maxweight: Optional[int] = None,
+            weigh: Callable[[_V], int] = sys.getsizeof,
+            clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        """
+        >>> Cache()
+        Cache(size=0, weight=0)
+        >>> Cache(maxsize=0)
+        Traceback (most recent call last):
+        ...
+        ValueError: maxsize must be positive integer
+        """
+        if maxsize is not None and maxsize < 1:
+            raise ValueError('maxsize must be positive integer')
+        if ttl is not None and ttl <= 0:
+            raise ValueError('ttl must be positive number')
+        if maxweight is not None and maxweight < 1:
+            raise ValueError('maxweight must be positive integer')
+        super().__init__()
+        self._entries: 'OrderedDict[Hashable, Tuple[_V, float, int]]' = \
+            OrderedDict()
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._maxweight = maxweight
+        self._weigh = weigh
+        self._clock = clock
+        self._weight = 0
+        self.stats = CacheStats()
+
+    @property
+    def weight(self) -> int:
+        """
+        Total weight of cached values, always `0` without `maxweight`.
+        """
+        return self._weight
+
+    def get(self, k: Hashable) -> _V:
+        """
+        Return value cached under `k` or :data:`MISSING`.
+        """
+        entry = self._entries.get(k)
+        if entry is None:
+            self.stats.misses += 1
+            return cast(_V, MISSING)
+        value, expires, _ = entry
+        if self._ttl is not None and self._clock() >= expires:
+            self._drop(k)
+            self.stats.expirations += 1
+            self.stats.misses += 1
+            return cast(_V, MISSING)
+        self._entries.move_to_end(k)
+        self.stats.hits += 1
+        return value
+
+    def put(self, k: Hashable, v: _V) -> None:
+        """
+        Cache value `v` under key `k` and evict least recently used entries
+        that do not fit.
+        """
+        weight = 0
+        if self._maxweight is not None:
+            weight = self._weigh(v)
+            if weight > self._maxweight:
+                return
+        if k in self._entries:
+            self._drop(k)
+        expires = 0.0 if self._ttl is None else self._clock() + self._ttl
+        self._entries[k] = (v, expires, weight)
+        self._weight += weight
+        self._evict()
+
+    def _evict(self) -> None:
+        entries = self._entries
+        maxsize, maxweight = self._maxsize, self._maxweight
+        while (maxsize is not None and len(entries) > maxsize) or (
+                maxweight is not None and self._weight > maxweight
+        ):
+            _, (_, _, weight) = entries.popitem(last=False)
+            self._weight -= weight
+            self.stats.evictions += 1
+
+    def _drop(self, k: Hashable) -> None:
+        _, _, weight = self._entries.pop(k)
+        self._weight -= weight
+
+    def expire(self) -> int:
+        """
+        Eagerly drop all expired entries and return their number.
+
+        >>> now = [0.0]
+        >>> cache = Cache(ttl=1, clock=lambda: now[0])
+        >>> cache.put('a', 1)
+        >>> now[0] = 0.5
+        >>> cache.put('b', 2)
+        >>> now[0] = 1.0
+        >>> cache.expire(), len(cache)
+        (1, 1)
+        """
+        if self._ttl is None:
+            return 0
+        now = self._clock()
+        expired = [k for k, (_, t, _) in self._entries.items() if now >= t]
+        for k in expired:
+            self._drop(k)
+        self.stats.expirations += len(expired)
+        return len(expired)
+
+    def keys(self) -> KeysView[Hashable]:
+        """
+        Cached keys from least to most recently used (including expired
+        entries that were not dropped yet).
+        """
+        return self._entries.keys()
+
+    def clear(self) -> None:
+        """
+        Drop all entries, statistics are kept.
+
+        >>> cache = Cache()
+        >>> cache.put('a', 1)
+        >>> cache.clear()
+        >>> len(cache)
+        0
+        """
+        self._entries.clear()
+        self._weight = 0
+
+    def __contains__(self, k: object) -> bool:
+        return k in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return f'Cache(size={len(self._entries)}, weight={self._weight})'
@@ -0,0 +1,152 @@
+from typing import Any, Iterable, Iterator, List, Optional, Sequence, \
+    TypeVar, Union, overload
+
+from ftoolz.adt.seqview import sequence_eq
+from ftoolz.typing import Seq
+
+_E = TypeVar('_E')
+
+# Values of a column are a sequence or a NumPy array. Arrays are not typed
+# as sequences and NumPy is optional, so they are accepted as `Any`.
+ColumnValues = Union[Seq[_E], Any]
+
+
+def bitmap_and(bitmaps: Iterable[Optional[bytes]], n: int) -> Optional[bytes]:
+    """
+    Intersection of validity bitmaps of `n` rows, `None` stands for all rows
+    being valid.
+
+    >>> bitmap_and([b'\\x05', None, b'\\x0c'], 4)
+    b'\\x04'
+    >>> bitmap_and([None, None], 4)
+    """
+    size = (n + 7) // 8
+    result: Optional[int] = None
+    for bitmap in bitmaps:
+        if bitmap is None:
+            continue
+        bits = int.from_bytes(bitmap[:size], 'little')
+        result = bits if result is None else result & bits
+    return None if result is None else result.to_bytes(size, 'little')
+
+
+class Column(Sequence[Optional[_E]]):
+    """
+    Nullable column of `values` with validity bitmap, i.e. bit `i` (least
+    significant bit first) of `validity` is set iff row `i` is present.
+    Values of null rows are arbitrary placeholders. Missing `validity` means
+    that all rows are present.
+
+    >>> col = Column([1, 0, 3], validity=b'\\x05')
+    >>> col
+    Column([1, None, 3])
+    >>> col[1], col.is_valid(2), col.null_count
+    (None, True, 1)
+
+    Columns are equal to sequences of optional items.
+
+    >>> col == [1, None, 3]
+    True
+
+    Values can be any sequence, e.g. a NumPy array enabling vectorized
+    operations of :mod:`ftoolz.functoolz.nullable`.
+    """
+
+    __slots__ = ('values', 'validity')
+
+    def __init__(
+            self,
+            values: ColumnValues[_E],
+            validity: Optional[bytes] = None
+    ) -> None:
+        """
+        >>> Column([1, 2], validity=b'')
+        Traceback (most recent call last):
+        ...
+        ValueError: validity bitmap too short for 2 rows
+        """
+        if validity is not None and len(validity) * 8 < len(values):
+            raise ValueError(
+                f'validity bitmap too short for {len(values)} rows'
+            )
+        self.values = values
+        self.validity = validity
+
+    @staticmethod
+    def of(items: Iterable[Optional[_E]]) -> 'Column[_E]':
+        """
+        Build column from optional items, `None` marks a null row.
+
+        >>> col = Column.of([None, 'a', None, 'b'])
+        >>> col.values, col.validity
+        ([None, 'a', None, 'b'], b'\\n')
+        >>> Column.of([1, 2]).validity
+        """
+        values: List[Any] = list(items)
+        bits = 0
+        for i, v in enumerate(values):
+            if v is not None:
+                bits |= 1 << i
+        if bits == (1 << len(values)) - 1:
+            return Column(values)
+        return Column(values, bits.to_bytes((len(values) + 7) // 8, 'little'))
+
+    @property
+    def null_count(self) -> int:
+        """
+        Number of null rows.
+
+        >>> Column.of([1, None, None]).null_count
+        2
+        """
+        validity = self.validity
+        if validity is None:
+            return 0
+        n = len(self.values)
+        valid = int.from_bytes(validity, 'little') & ((1 << n) - 1)
+        return n - bin(valid).count('1')
+
+    def is_valid(self, i: int) -> bool:
+        """
+        Check whether row `i` is present.
+        """
+        validity = self.validity
+        if i < 0:
+            i += len(self.values)
+        return validity is None or bool(validity[i >> 3] >> (i & 7) & 1)
+
+    @overload
+    def __getitem__(self, i: int) -> Optional[_E]: ...
+
+    @overload
+    def __getitem__(self, s: slice) -> 'Column[_E]': ...
+
+    def __getitem__(self, i: Union[int, slice]) -> Any:
+        """
+        >>> col = Column.of([1, None, 3, 4])
+        >>> col[-1], col[1:3], col[::-2]
+        (4, Column([None, 3]), Column([4, None]))
+        """
+        if isinstance(i, slice):
+            return Column.of(self[j] for j in range(len(self.values))[i])
+        v = self.values[i]
+        return v if self.is_valid(i) else None
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __iter__(self) -> Iterator[Optional[_E]]:
+        validity = self.validity
+        if validity is None:
+            return iter(self.values)
+        return (
+            v if validity[i >> 3] >> (i & 7) & 1 else None
+            for i, v in enumerate(self.values)
+        )
+
+    __eq__ = sequence_eq
+
+    __hash__ = None  # type: ignore
+
+    def __repr__(self) -> str:
+        return f'Column({list(self)!r})'
@@ -0,0 +1,76 @@
+from typing import Dict, Type
+
+
+class GuardStats:
+    """
+    Counters of a function guarded against errors, i.e. how often it was
+    called, which errors were silenced and how much time the failed calls
+    took (including the fallback).
+
+    >>> stats = GuardStats()
+    >>> stats.record_call()
+    >>> stats.record_call()
+    >>> stats.record_error(ValueError, 0.5)
+    >>> stats
+    GuardStats(calls=2, errors={'ValueError': 1}, failure_time=0.5)
+    >>> stats.silenced, stats.error_rate
+    (1, 0.5)
+
+    **Warn**: This implementation is **not** thread-safe, counts might be
+    inaccurate if guarded function is called from multiple threads.
+    """
+
+    __slots__ = ('calls', 'errors', 'failure_time')
+
+    def __init__(self) -> None:
+        """
+        >>> GuardStats()
+        GuardStats(calls=0, errors={}, failure_time=0.0)
+        """
+        self.calls = 0
+        self.errors: Dict[Type[BaseException], int] = {}
+        self.failure_time = 0.0
+
+    @property
+    def silenced(self) -> int:
+        """
+        Total number of silenced errors.
+        """
+        return sum(self.errors.values())
+
+    @property
+    def error_rate(self) -> float:
+        """
+        Fraction of calls that failed, `0.0` if there were no calls yet.
+
+        >>> GuardStats().error_rate
+        0.0
+        """
+        return self.silenced / self.calls if self.calls else 0.0
+
+    def record_call(self) -> None:
+        self.calls += 1
+
+    def record_error(self, error: Type[BaseException], time: float) -> None:
+        errors = self.errors
+        errors[error] = errors.get(error, 0) + 1
+        self.failure_time += time
+
+    def reset(self) -> None:
+        """
+        Set all counters to zero.
+
+        >>> stats = GuardStats()
+        >>> stats.record_call()
+        >>> stats.reset()
+        >>> stats.calls
+        0
+        """
+        self.calls = 0
+        self.errors.clear()
+        self.failure_time = 0.0
+
+    def __repr__(self) -> str:
+        errors = {e.__name__: n for e, n in self.errors.items()}
+        return f'GuardStats(calls={self.calls}, errors={errors}, ' \
+               f'failure_time={self.failure_time})'
@@ -0,0 +1,177 @@
+from typing import Callable, Dict, Generic, Hashable, Iterable, List, \
+    Optional, Sized, TypeVar
+
+from cytoolz.itertoolz import identity
+
+from ftoolz.typing import Seq
+
+_E = TypeVar('_E')
+_K = TypeVar('_K', bound=Hashable)
+
+
+class KeyIndex(Generic[_K, _E], Sized):
+    """
+    Index of entities grouped by a key that can answer many `order_by`
+    queries without being rebuilt. Entities with the same key keep their
+    original order.
+
+    >>> index = KeyIndex(['a1', 'b1', 'a2'], key=lambda e: e[0])
+    >>> index
+    KeyIndex(keys=2, size=3)
+
+    Each query orders entities by given keys, missing entries are indicated by
+    `None` and duplicate keys yield subsequent entities with that key.
+
+    >>> index.order_by(['b', 'c', 'a', 'a', 'a'])
+    ['b1', None, 'a1', 'a2', None]
+
+    By default queries do not modify the index.
+
+    >>> index.order_by(['a', 'b'])
+    ['a1', 'b1']
+
+    In the *consuming* mode returned entities are removed from the index,
+    so that subsequent queries continue where the previous ones stopped.
+
+    >>> index.order_by(['a'], consume=True)
+    ['a1']
+    >>> index.order_by(['a', 'a'], consume=True)
+    ['a2', None]
+    >>> index.order_by(['a', 'b'])
+    [None, 'b1']
+
+    Consumed entities can be restored by :meth:`reset`.
+
+    >>> index.reset()
+    >>> index.order_by(['a', 'b'])
+    ['a1', 'b1']
+
+    **Warn**: This implementation is **not** thread-safe.
+    """
+
+    __slots__ = ('_groups', '_cursors', '_size')
+
+    def __init__(
+            self,
+            it: Iterable[_E],
+            key: Callable[[_E], Optional[_K]] = identity
+    ) -> None:
+        """
+        >>> KeyIndex([])
+        KeyIndex(keys=0, size=0)
+        >>> KeyIndex(iter('abca'))
+        KeyIndex(keys=3, size=4)
+        """
+        super().__init__()
+        groups: Dict[Optional[_K], List[_E]] = {}
+        get = groups.get
+        size = 0
+        for size, e in enumerate(it, 1):
+            k = key(e)
+            group = get(k)
+            if group is None:
+                groups[k] = [e]
+            else:
+                group.append(e)
+        self._groups = groups
+        self._cursors: Dict[Optional[_K], int] = {}
+        self._size = size
+
+    def get(self, k: Optional[_K]) -> Seq[_E]:
+        """
+        Get all not yet consumed entities with key `k`.
+
+        >>> index = KeyIndex(['a1', 'b1', 'a2'], key=lambda e: e[0])
+        >>> index.get('a')
+        ('a1', 'a2')
+        >>> index.get('c')
+        ()
+        >>> _ = index.order_by(['a'], consume=True)
+        >>> index.get('a')
+        ('a2',)
+        """
+        group = self._groups.get(k)
+        if group is None:
+            return ()
+        return tuple(group[self._cursors.get(k, 0):])
+
+    def order_by(
+            self,
+            by: Iterable[Optional[_K]],
+            consume: bool = False
+    ) -> Seq[Optional[_E]]:
+        """
+        Order indexed entities in order given by keys `by`.
+
+        >>> entities = [{'id': 'a'}, {'id_x': 'c'}]
+        >>> index = KeyIndex(entities, key=lambda e: e.get('id'))
+        >>> index.order_by(['c', 'b', 'a'])
+        [None, None, {'id': 'a'}]
+
+        Entities without a key are indexed under `None`.
+
+        >>> index.order_by([None])
+        [{'id_x': 'c'}]
+        """
+        groups = self._groups
+        cursors = self._cursors
+        offsets = cursors if consume else {}
+
+        result: List[Optional[_E]] = []
+        append = result.append
+        for k in by:
+            group = groups.get(k)
+            if group is None:
+                append(None)
+                continue
+            i = offsets.get(k)
+            if i is None:
+                i = cursors.get(k, 0)
+            if i < len(group):
+                append(group[i])
+                offsets[k] = i + 1
+            else:
+                append(None)
+        return result
+
+    def order_by_all(
+            self,
+            bys: Iterable[Iterable[Optional[_K]]],
+            consume: bool = False
+    ) -> Iterable[Seq[Optional[_E]]]:
+        """
+        Lazily answer `order_by` query for each keys sequence in `bys`.
+
+        >>> index = KeyIndex(['a', 'b', 'a'])
+        >>> list(index.order_by_all([['a', 'b'], ['b', 'a', 'a']]))
+        [['a', 'b'], ['b', 'a', 'a']]
+        >>> list(index.order_by_all([['a', 'b'], ['b', 'a', 'a']], True))
+        [['a', 'b'], [None, 'a', None]]
+        """
+        for by in bys:
+            yield self.order_by(by, consume)
+
+    def reset(self) -> None:
+        """
+        Restore all entities consumed by previous queries.
+        """
+        self._cursors.clear()
+
+    def __len__(self) -> int:
+        """
+        Number of distinct keys in the index.
+
+        >>> len(KeyIndex('abca'))
+        3
+        """
+        return len(self._groups)
+
+    def __contains__(self, k: object) -> bool:
+        """
+        >>> 'a' in KeyIndex('ab'), 'c' in KeyIndex('ab')
+        (True, False)
+        """
+        return k in self._groups
+
+    def __repr__(self) -> str:
+        return f'KeyIndex(keys={len(self._groups)}, size={self._size})'
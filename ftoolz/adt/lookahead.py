@@ -0,0 +1,205 @@
+from typing import Iterable, Iterator, List, Optional, TypeVar
+
+_E = TypeVar('_E')
+
+
+class Lookahead(Iterator[_E]):  # pylint: disable=E0239
+    """
+    Iterator that sees up to `depth` items ahead of the current one and
+    remembers the previous one. Iteration yields the original items while
+    position related information is exposed via properties of the iterator.
+
+    Upcoming items are kept in a fixed size ring buffer, so the memory is
+    constant and no intermediate objects are allocated per item.
+
+    **Warn**: This implementation is **not** thread-safe.
+
+    Example behavior:
+
+    >>> it = Lookahead(iter('abc'))
+    >>> [(x, it.index, it.is_first, it.is_last) for x in it]
+    [('a', 0, True, False), ('b', 1, False, False), ('c', 2, False, True)]
+
+    >>> it = Lookahead(iter([1, 2, 3, 4]), depth=2)
+    >>> [(it.previous, x, it.peek(1), it.peek(2)) for x in it]
+    [(None, 1, 2, 3), (1, 2, 3, 4), (2, 3, 4, None), (3, 4, None, None)]
+
+    Missing neighbours are reported as `None` (or given `default`), use
+    `is_first` and `is_last` to tell them apart from `None` items.
+    """
+
+    __slots__ = (
+        '_source', '_buffer', '_depth', '_head', '_size', '_exhausted',
+        '_index', '_current', '_previous',
+    )
+
+    def __init__(self, it: Iterable[_E], depth: int = 1) -> None:
+        """
+        >>> Lookahead([1, 2, 3])
+        Lookahead(depth=1, index=-1)
+        >>> Lookahead([1, 2, 3], depth=0)
+        Traceback (most recent call last):
+        ...
+        ValueError: depth must be positive integer
+        """
+        if depth < 1:
+            raise ValueError('depth must be positive integer')
+        super().__init__()
+        self._source: Iterator[_E] = iter(it)
+        self._buffer: List[Optional[_E]] = [None] * depth
+        self._depth = depth
+        self._head = 0
+        self._size = 0
+        self._exhausted = False
+        self._index = -1
+        self._current: Optional[_E] = None
+        self._previous: Optional[_E] = None
+
+    @property
+    def current(self) -> Optional[_E]:
+        """
+        Last item returned by the iterator or `None` before iteration.
+
+        >>> it = Lookahead([1, 2])
+        >>> it.current
+        >>> next(it), it.current
+        (1, 1)
+        """
+        return self._current
+
+    @property
+    def index(self) -> int:
+        """
+        Zero-based position of the current item, `-1` before iteration.
+
+        >>> it = Lookahead('ab')
+        >>> it.index
+        -1
+        >>> _ = next(it)
+        >>> it.index
+        0
+        """
+        return self._index
+
+    @property
+    def is_first(self) -> bool:
+        """
+        Flag whether the current item is the first one.
+
+        >>> it = Lookahead('ab')
+        >>> it.is_first
+        False
+        >>> [it.is_first for _ in it]
+        [True, False]
+        """
+        return self._index == 0
+
+    @property
+    def is_last(self) -> bool:
+        """
+        Flag whether the current item is the last one.
+
+        >>> it = Lookahead('ab')
+        >>> [it.is_last for _ in it]
+        [False, True]
+        """
+        return self._index >= 0 and self._size == 0
+
+    @property
+    def previous(self) -> Optional[_E]:
+        """
+        Item returned before the current one or `None` if there is no such.
+
+        >>> it = Lookahead('ab')
+        >>> [it.previous for _ in it]
+        [None, 'a']
+        """
+        return self._previous
+
+    def peek(self, n: int = 1, default: Optional[_E] = None) -> Optional[_E]:
+        """
+        Return `n`-th upcoming item without consuming it or `default` if the
+        underlying iterable ends sooner.
+
+        >>> it = Lookahead([1, 2, 3], depth=2)
+        >>> it.peek(), it.peek(2)
+        (1, 2)
+        >>> next(it), it.peek(), it.peek(2, default=-1)
+        (1, 2, 3)
+        >>> next(it), it.peek(), it.peek(2, default=-1)
+        (2, 3, -1)
+
+        Only items up to the lookahead `depth` can be peeked.
+
+        >>> it.peek(3)
+        Traceback (most recent call last):
+        ...
+        IndexError: n must be in range [1, 2]
+        """
+        if not 0 < n <= self._depth:
+            raise IndexError(f'n must be in range [1, {self._depth}]')
+        self._fill()
+        if n > self._size:
+            return default
+        return self._buffer[(self._head + n - 1) % self._depth]
+
+    def _fill(self) -> None:
+        buffer = self._buffer
+        depth = self._depth
+        while self._size < depth and not self._exhausted:
+            try:
+                item = next(self._source)
+            except StopIteration:
+                self._exhausted = True
+                return
+            buffer[(self._head + self._size) % depth] = item
+            self._size += 1
+
+    def __iter__(self) -> 'Lookahead[_E]':
+        """
+        >>> it = Lookahead([])
+        >>> it is iter(it)
+        True
+        """
+        return self
+
+    def __next__(self) -> _E:
+        """
+        >>> next(Lookahead([]))
+        Traceback (most recent call last):
+        ...
+        StopIteration
+        >>> it = Lookahead([1, 2])
+        >>> next(it), next(it), next(it, None)
+        (1, 2, None)
+        """
+        if self._size < self._depth:
+            self._fill()
+            if not self._size:
+                raise StopIteration
+
+        head = self._head
+        buffer = self._buffer
+        item = buffer[head]
+
+        self._previous = self._current
+        self._current = item
+        self._index += 1
+
+        # The freed slot is exactly where the next upcoming item belongs,
+        # so the buffer is refilled in place to know `is_last` of the item.
+        if self._exhausted:
+            buffer[head] = None
+            self._size -= 1
+        else:
+            try:
+                buffer[head] = next(self._source)
+            except StopIteration:
+                buffer[head] = None
+                self._exhausted = True
+                self._size -= 1
+        self._head = (head + 1) % self._depth
+        return item  # type: ignore
+
+    def __repr__(self) -> str:
+        return f'Lookahead(depth={self._depth}, index={self._index})'
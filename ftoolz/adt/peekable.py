@@ -0,0 +1,134 @@
+from collections import deque
+from itertools import islice
+from typing import Deque, Iterable, Iterator, TypeVar
+
+from ftoolz.typing import Seq
+
+_E = TypeVar('_E')
+
+
+class Peekable(Iterator[_E]):  # pylint: disable=E0239
+    """
+    Iterator that allows to look at upcoming items without consuming them and
+    to push items back. Peeked and pushed items are kept in a single buffer,
+    so repeated peeking does not wrap the original iterator again and again.
+
+    >>> it = Peekable(iter([1, 2, 3]))
+    >>> it.peek()
+    1
+    >>> it.peek_n(2)
+    (1, 2)
+    >>> next(it)
+    1
+
+    >>> it.push(42)
+    >>> list(it)
+    [42, 2, 3]
+
+    **Warn**: This implementation is **not** thread-safe.
+    """
+
+    __slots__ = ('_source', '_buffer')
+
+    def __init__(self, it: Iterable[_E]) -> None:
+        """
+        >>> Peekable([1, 2])
+        Peekable(buffer=deque([]))
+        """
+        super().__init__()
+        self._source: Iterator[_E] = iter(it)
+        self._buffer: Deque[_E] = deque()
+
+    @staticmethod
+    def of(it: Iterable[_E]) -> 'Peekable[_E]':
+        """
+        Wrap given iterable unless it already is a :class:`Peekable`.
+
+        >>> it = Peekable.of([1, 2])
+        >>> Peekable.of(it) is it
+        True
+        """
+        return it if isinstance(it, Peekable) else Peekable(it)
+
+    def peek(self) -> _E:
+        """
+        Return next item without consuming it or raise :class:`StopIteration`
+        if there is none.
+
+        >>> it = Peekable([1])
+        >>> it.peek(), it.peek()
+        (1, 1)
+        >>> next(it)
+        1
+        >>> it.peek()
+        Traceback (most recent call last):
+        ...
+        StopIteration
+        """
+        buffer = self._buffer
+        if not buffer:
+            buffer.append(next(self._source))
+        return buffer[0]
+
+    def peek_n(self, n: int) -> Seq[_E]:
+        """
+        Return up to `n` upcoming items without consuming them.
+
+        >>> it = Peekable(iter([1, 2, 3]))
+        >>> it.peek_n(2), it.peek_n(5), it.peek_n(0)
+        ((1, 2), (1, 2, 3), ())
+        >>> list(it)
+        [1, 2, 3]
+        """
+        buffer = self._buffer
+        if len(buffer) < n:
+            buffer.extend(islice(self._source, n - len(buffer)))
+        return tuple(islice(buffer, n))
+
+    def push(self, e: _E) -> None:
+        """
+        Push `e` back so that it is returned by the next call of `next`.
+
+        >>> it = Peekable([])
+        >>> it.push(1)
+        >>> it.push(2)
+        >>> list(it)
+        [2, 1]
+        """
+        self._buffer.appendleft(e)
+
+    def __iter__(self) -> 'Peekable[_E]':
+        """
+        >>> it = Peekable([])
+        >>> it is iter(it)
+        True
+        """
+        return self
+
+    def __next__(self) -> _E:
+        """
+        >>> it = Peekable([1])
+        >>> next(it), next(it, None)
+        (1, None)
+        """
+        if self._buffer:
+            return self._buffer.popleft()
+        return next(self._source)
+
+    def __bool__(self) -> bool:
+        """
+        Check whether there is any upcoming item.
+
+        >>> bool(Peekable([])), bool(Peekable([None]))
+        (False, True)
+        """
+        if self._buffer:
+            return True
+        try:
+            self._buffer.append(next(self._source))
+        except StopIteration:
+            return False
+        return True
+
+    def __repr__(self) -> str:
+        return f'Peekable(buffer={repr(self._buffer)})'
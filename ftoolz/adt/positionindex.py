@@ -0,0 +1,122 @@
+from array import array
+from typing import Dict, Hashable, Iterable, Iterator, Mapping, Tuple, \
+    TypeVar
+
+from ftoolz.typing import Map, Seq
+
+_H = TypeVar('_H', bound=Hashable)
+
+
+class PositionIndex(Mapping[_H, Seq[int]]):  # pylint: disable=E0239
+    """
+    Immutable index of positions of (non-unique) items in an iterable.
+
+    The index is built in a single linear pass and positions of each item are
+    stored in a compact typed array (`array('q')`), i.e. 8 bytes per position.
+
+    >>> index = PositionIndex(['a', 'b', 'a'])
+    >>> index
+    PositionIndex(keys=2, size=3)
+
+    >>> index['a']
+    array('q', [0, 2])
+    >>> 'b' in index, 'c' in index
+    (True, False)
+    >>> len(index), index.size
+    (2, 3)
+
+    Index can be converted to a :class:`Map` of positions in `tuple`s.
+
+    >>> index.to_map()
+    {'a': (0, 2), 'b': (1,)}
+
+    **Warn**: Returned arrays are the internal state of the index and should
+    not be modified.
+    """
+
+    __slots__ = ('_index', '_size')
+
+    def __init__(self, it: Iterable[_H]) -> None:
+        """
+        >>> PositionIndex([])
+        PositionIndex(keys=0, size=0)
+        >>> PositionIndex(iter('abcab'))
+        PositionIndex(keys=3, size=5)
+        """
+        super().__init__()
+        index: Dict[_H, array] = {}
+        get = index.get
+        size = 0
+        for size, item in enumerate(it, 1):
+            positions = get(item)
+            if positions is None:
+                positions = index[item] = array('q')
+            positions.append(size - 1)
+        self._index = index
+        self._size = size
+
+    @property
+    def size(self) -> int:
+        """
+        Number of indexed positions (i.e. length of indexed iterable).
+
+        >>> PositionIndex('aab').size
+        3
+        """
+        return self._size
+
+    def nbytes(self) -> int:
+        """
+        Number of bytes occupied by stored positions (excluding keys and the
+        overhead of containers).
+
+        >>> PositionIndex('aab').nbytes()
+        24
+        """
+        return sum(a.itemsize * len(a) for a in self._index.values())
+
+    def to_map(self) -> Map[_H, Tuple[int, ...]]:
+        """
+        Convert this index into a :class:`Map` of `tuple`s of positions.
+
+        >>> PositionIndex([('a', True), ('b', False), ('a', True)]).to_map()
+        {('a', True): (0, 2), ('b', False): (1,)}
+        >>> PositionIndex([]).to_map()
+        {}
+        """
+        return {k: tuple(v) for k, v in self._index.items()}
+
+    def __contains__(self, key: object) -> bool:
+        """
+        >>> 'a' in PositionIndex('ab'), 'c' in PositionIndex('ab')
+        (True, False)
+        """
+        return key in self._index
+
+    def __getitem__(self, key: _H) -> Seq[int]:
+        """
+        >>> PositionIndex('aba')['b']
+        array('q', [1])
+        >>> PositionIndex('aba')['c']
+        Traceback (most recent call last):
+        ...
+        KeyError: 'c'
+        """
+        return self._index[key]
+
+    def __iter__(self) -> Iterator[_H]:
+        """
+        >>> list(PositionIndex('abca'))
+        ['a', 'b', 'c']
+        """
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        """
+        >>> len(PositionIndex('abca'))
+        3
+        """
+        return len(self._index)
+
+    def __repr__(self) -> str:
+        return f'PositionIndex(keys={len(self._index)}, size={self._size})'
@@ -0,0 +1,37 @@
+from typing import Callable, Iterable, Iterator, TypeVar
+
+_E = TypeVar('_E')
+
+
+class Reiterable(Iterable[_E]):
+    """
+    Iterable that can be iterated repeatedly because each iteration starts
+    a fresh iterator created by `factory`, e.g. a function re-opening a file.
+
+    >>> it = Reiterable(lambda: iter([1, 2]))
+    >>> list(it), list(it)
+    ([1, 2], [1, 2])
+
+    Functions of :mod:`ftoolz.functoolz.iter` that need to traverse an
+    argument multiple times use it as is instead of collecting it into
+    memory.
+
+    >>> from ftoolz.functoolz.iter import product
+    >>> list(product('ab', Reiterable(lambda: map(int, '12'))))
+    [('a', 1), ('a', 2), ('b', 1), ('b', 2)]
+    """
+
+    __slots__ = ('_factory',)
+
+    def __init__(self, factory: Callable[[], Iterable[_E]]) -> None:
+        """
+        >>> Reiterable(list)
+        Reiterable(factory=<class 'list'>)
+        """
+        self._factory = factory
+
+    def __iter__(self) -> Iterator[_E]:
+        return iter(self._factory())
+
+    def __repr__(self) -> str:
+        return f'Reiterable(factory={self._factory!r})'
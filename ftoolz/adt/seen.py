@@ -0,0 +1,270 @@
+import math
+import sys
+from abc import ABC, abstractmethod
+from array import array
+from collections import OrderedDict
+from typing import Hashable, Sized
+
+_MASK64 = (1 << 64) - 1
+_GOLDEN64 = 0x9E3779B97F4A7C15
+
+
+def _mix(x: Hashable) -> int:
+    # Spread bits of Python's hash (e.g. `hash(i) == i` for small ints) over
+    # the whole unsigned 64-bit range using Fibonacci hashing.
+    return (hash(x) * _GOLDEN64) & _MASK64
+
+
+class Seen(ABC, Sized):
+    """
+    Set-like record of already seen items used for de-duplication of streams.
+    Implementations trade exactness for bounded or compact memory.
+    """
+
+    __slots__ = ()
+
+    @abstractmethod
+    def add(self, x: Hashable) -> bool:
+        """
+        Record `x` and return `True` iff it has not been seen before.
+        """
+
+    @abstractmethod
+    def nbytes(self) -> int:
+        """
+        Approximate number of bytes occupied by the record.
+        """
+
+    @abstractmethod
+    def __contains__(self, x: object) -> bool:
+        pass
+
+
+class WindowSeen(Seen):
+    """
+    Exact record of `size` most recently seen items (LRU). Older items are
+    forgotten, so their repeated occurrences are reported as unseen.
+
+    >>> seen = WindowSeen(2)
+    >>> [seen.add(x) for x in 'abacb']
+    [True, True, False, True, True]
+
+    Seeing an item again makes it the most recent one.
+
+    >>> 'a' in seen, 'c' in seen, len(seen)
+    (False, True, 2)
+
+    Reported size covers the record structure but not the items themselves.
+
+    >>> seen.nbytes() > 0
+    True
+    """
+
+    __slots__ = ('_size', '_items')
+
+    def __init__(self, size: int) -> None:
+        """
+        >>> WindowSeen(0)
+        Traceback (most recent call last):
+        ...
+        ValueError: size must be positive integer
+        """
+        if size < 1:
+            raise ValueError('size must be positive integer')
+        self._size = size
+        self._items: 'OrderedDict[Hashable, None]' = OrderedDict()
+
+    def add(self, x: Hashable) -> bool:
+        items = self._items
+        if x in items:
+            items.move_to_end(x)
+            return False
+        items[x] = None
+        if len(items) > self._size:
+            items.popitem(last=False)
+        return True
+
+    def nbytes(self) -> int:
+        return sys.getsizeof(self._items)
+
+    def __contains__(self, x: object) -> bool:
+        return x in self._items
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __repr__(self) -> str:
+        return f'WindowSeen(size={self._size})'
+
+
+class HashSeen(Seen):
+    """
+    Record of 64-bit hashes of seen items kept in a compact open-addressing
+    table (`array('q')`), i.e. about 12-24 bytes per item regardless of the
+    item size. Items with colliding hashes are reported as seen.
+
+    >>> seen = HashSeen()
+    >>> [seen.add(x) for x in 'abacb']
+    [True, True, False, True, False]
+    >>> 'a' in seen, 'd' in seen, len(seen)
+    (True, False, 3)
+
+    Table grows as needed, initial `capacity` only avoids early resizing.
+
+    >>> seen = HashSeen(capacity=1)
+    >>> all(seen.add(i) for i in range(1000))
+    True
+    >>> len(seen), seen.nbytes()
+    (1000, 16384)
+
+    **Warn**: Hashes of `str` and `bytes` are randomized per process, so the
+    record must not be shared between processes.
+    """
+
+    __slots__ = ('_table', '_shift', '_used')
+
+    def __init__(self, capacity: int = 8) -> None:
+        """
+        >>> HashSeen()
+        HashSeen(size=0, slots=16)
+        """
+        bits = max(3, math.ceil(math.log2(max(capacity, 1) * 3 / 2 + 1)))
+        self._table = array('q', bytes(8 << bits))
+        self._shift = 64 - bits
+        self._used = 0
+
+    @staticmethod
+    def _key(h: int) -> int:
+        # Zero marks an empty slot, hashes are stored as signed 64-bit ints.
+        return h - (1 << 64) if h >= 1 << 63 else (h or 1)
+
+    def _slot(self, h: int) -> int:
+        key = self._key(h)
+        table = self._table
+        mask = len(table) - 1
+        i = h >> self._shift
+        while True:
+            current = table[i]
+            if current == key or current == 0:
+                return i
+            i = (i + 1) & mask
+
+    def add(self, x: Hashable) -> bool:
+        h = _mix(x)
+        i = self._slot(h)
+        if self._table[i]:
+            return False
+        self._table[i] = self._key(h)
+        self._used += 1
+        if self._used * 3 >= len(self._table) * 2:
+            self._grow()
+        return True
+
+    def _grow(self) -> None:
+        old = self._table
+        self._table = array('q', bytes(16 * len(old)))
+        self._shift -= 1
+        for key in old:
+            if key:
+                h = key & _MASK64
+                self._table[self._slot(h)] = key
+
+    def nbytes(self) -> int:
+        return self._table.itemsize * len(self._table)
+
+    def __contains__(self, x: object) -> bool:
+        try:
+            h = _mix(x)
+        except TypeError:
+            return False
+        return bool(self._table[self._slot(h)])
+
+    def __len__(self) -> int:
+        return self._used
+
+    def __repr__(self) -> str:
+        return f'HashSeen(size={self._used}, slots={len(self._table)})'
+
+
+class BloomSeen(Seen):
+    """
+    Probabilistic record of seen items backed by a Bloom filter sized for
+    `capacity` items with given false positive `error_rate`. False positives
+    mean that some unseen items are reported as seen (and thus dropped by
+    de-duplication), seen items are never reported as unseen.
+
+    >>> seen = BloomSeen(capacity=1000, error_rate=0.01)
+    >>> seen
+    BloomSeen(capacity=1000, error_rate=0.01, bits=9586, hashes=7)
+    >>> [seen.add(x) for x in 'abacb']
+    [True, True, False, True, False]
+    >>> 'a' in seen, len(seen), seen.nbytes()
+    (True, 3, 1199)
+
+    Inserting more than `capacity` items increases the false positive rate.
+    """
+
+    __slots__ = ('_capacity', '_error_rate', '_bits', '_m', '_k', '_count')
+
+    def __init__(self, capacity: int, error_rate: float = 0.01) -> None:
+        """
+        >>> BloomSeen(0)
+        Traceback (most recent call last):
+        ...
+        ValueError: capacity must be positive integer
+        >>> BloomSeen(10, error_rate=1.0)
+        Traceback (most recent call last):
+        ...
+        ValueError: error_rate must be in range (0, 1)
+        """
+        if capacity < 1:
+            raise ValueError('capacity must be positive integer')
+        if not 0 < error_rate < 1:
+            raise ValueError('error_rate must be in range (0, 1)')
+        m = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self._capacity = capacity
+        self._error_rate = error_rate
+        self._m = m
+        self._k = max(1, round(m / capacity * math.log(2)))
+        self._bits = bytearray((m + 7) // 8)
+        self._count = 0
+
+    def _positions(self, x: Hashable) -> range:
+        h = _mix(x)
+        # Double hashing, the increment is odd to cover more distinct bits.
+        h1, h2 = h & 0xFFFFFFFF, (h >> 32) | 1
+        return range(h1, h1 + self._k * h2, h2)
+
+    def add(self, x: Hashable) -> bool:
+        bits, m = self._bits, self._m
+        new = False
+        for p in self._positions(x):
+            p %= m
+            byte, bit = p >> 3, 1 << (p & 7)
+            if not bits[byte] & bit:
+                bits[byte] |= bit
+                new = True
+        self._count += new
+        return new
+
+    def nbytes(self) -> int:
+        return len(self._bits)
+
+    def __contains__(self, x: object) -> bool:
+        bits, m = self._bits, self._m
+        try:
+            positions = self._positions(x)
+        except TypeError:
+            return False
+        return all(bits[(p % m) >> 3] & 1 << ((p % m) & 7) for p in positions)
+
+    def __len__(self) -> int:
+        """
+        Number of items added as unseen (estimate of distinct items).
+        """
+        return self._count
+
+    def __repr__(self) -> str:
+        return f'BloomSeen(capacity={self._capacity}, ' \
+               f'error_rate={self._error_rate}, bits={self._m}, ' \
+               f'hashes={self._k})'
@@ -0,0 +1,257 @@
+from abc import abstractmethod
+from bisect import bisect_right
+from copy import copy
+from itertools import accumulate, chain
+from typing import Any, Callable, Iterable, Iterator, List, Optional, \
+    Sequence, TypeVar, Union, overload
+
+from ftoolz.adt.cache import MISSING, Cache
+from ftoolz.typing import Seq
+
+_A = TypeVar('_A')
+_B = TypeVar('_B')
+_E = TypeVar('_E')
+
+
+def sequence_eq(xs: Sequence[Any], other: object) -> Any:
+    """
+    Item-wise equality of sequence `xs` to `other` for `__eq__` of custom
+    sequences, i.e. a `bool` or `NotImplemented` for non-sequences and
+    strings.
+
+    >>> sequence_eq((1, 2), [1, 2]), sequence_eq((1, 2), [1])
+    (True, False)
+    >>> sequence_eq('ab', 'ab')
+    NotImplemented
+    """
+    if not isinstance(other, Sequence) or isinstance(other, str):
+        return NotImplemented
+    return len(xs) == len(other) and all(a == b for a, b in zip(xs, other))
+
+
+class IndexedView(Sequence[_E]):
+    """
+    Lazy immutable sequence whose items are computed on demand from their
+    index by :meth:`_at`. The view holds a `range` of underlying indices, so
+    slicing and reversing only transform the range and never copy items.
+
+    Views are equal to any non-string sequence with equal items (e.g. to
+    a `tuple` produced by the eager counterpart).
+    """
+
+    __slots__ = ('_indices',)
+
+    def __init__(self, size: int) -> None:
+        self._indices = range(size)
+
+    @abstractmethod
+    def _at(self, i: int) -> _E:
+        """
+        Compute the item at underlying index `i` (always a valid index).
+        """
+
+    @overload
+    def __getitem__(self, i: int) -> _E: ...
+
+    @overload
+    def __getitem__(self, s: slice) -> 'IndexedView[_E]': ...
+
+    def __getitem__(self, i: Union[int, slice]) -> Any:
+        if isinstance(i, slice):
+            view = copy(self)
+            view._indices = self._indices[i]
+            return view
+        return self._at(self._indices[i])
+
+    def __len__(self) -> int:
+        return len(self._indices)
+
+    def __iter__(self) -> Iterator[_E]:
+        return map(self._at, self._indices)
+
+    def __reversed__(self) -> Iterator[_E]:
+        return map(self._at, reversed(self._indices))
+
+    __eq__ = sequence_eq
+
+    __hash__ = None  # type: ignore
+
+    def materialize(self) -> Seq[_E]:
+        """
+        Compute all items of the view into a `tuple`.
+        """
+        return tuple(self)
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}(len={len(self)})'
+
+
+class CartesianView(IndexedView[_E]):
+    """
+    Lazy sequence of `f(a, b)` for all pairs of items of sequences `fa` and
+    `fb` in row-major order (i.e. `a` changes slowest). Item `i` is computed
+    from `fa[i // len(fb)]` and `fb[i % len(fb)]` and the view occupies
+    constant memory regardless of its length.
+
+    >>> view = CartesianView(lambda a, b: a * b, (1, 2, 3), 'xy')
+    >>> view
+    CartesianView(len=6)
+    >>> view[0], view[3], view[-1]
+    ('x', 'yy', 'yyy')
+    >>> tuple(view[1:5:2]), tuple(reversed(view[:2]))
+    (('y', 'yy'), ('y', 'x'))
+    >>> view == ('x', 'y', 'xx', 'yy', 'xxx', 'yyy')
+    True
+
+    **Warn**: Items are recomputed on every access and the underlying
+    sequences must not be modified while the view is in use.
+    """
+
+    __slots__ = ('_f', '_fa', '_fb', '_m')
+
+    def __init__(
+            self,
+            f: Callable[[_A, _B], _E],
+            fa: Seq[_A],
+            fb: Seq[_B]
+    ) -> None:
+        """
+        >>> len(CartesianView(pow, range(10_000), range(10_000)))
+        100000000
+        >>> len(CartesianView(pow, (1, 2), ()))
+        0
+        """
+        super().__init__(len(fa) * len(fb))
+        self._f = f
+        self._fa = fa
+        self._fb = fb
+        self._m = len(fb)
+
+    def _at(self, i: int) -> _E:
+        q, r = divmod(i, self._m)
+        return self._f(self._fa[q], self._fb[r])
+
+
+class ConcatView(IndexedView[_E]):
+    """
+    Lazy concatenation of sequences `seqs` without copying their items. The
+    view keeps prefix sums of lengths of the inner sequences, so `len` is
+    constant-time and random access takes `O(log k)` for `k` sequences.
+
+    >>> view = ConcatView([(1, 2), (), [3], range(4, 7)])
+    >>> view, len(view)
+    (ConcatView(len=6), 6)
+    >>> view[0], view[2], view[-1]
+    (1, 3, 6)
+    >>> tuple(view), tuple(reversed(view))
+    ((1, 2, 3, 4, 5, 6), (6, 5, 4, 3, 2, 1))
+
+    Slicing is zero-copy as well.
+
+    >>> view[1:5]
+    ConcatView(len=4)
+    >>> tuple(view[1:5]), view[::2] == (1, 3, 5)
+    ((2, 3, 4, 5), True)
+
+    Items can be copied on demand.
+
+    >>> view[:3].materialize()
+    (1, 2, 3)
+
+    **Warn**: The inner sequences must not be modified (resized) while the
+    view is in use.
+    """
+
+    __slots__ = ('_seqs', '_offsets')
+
+    def __init__(self, seqs: Iterable[Seq[_E]]) -> None:
+        """
+        >>> ConcatView([])
+        ConcatView(len=0)
+        """
+        self._seqs: Seq[Seq[_E]] = tuple(seqs)
+        self._offsets: List[int] = [0]
+        self._offsets.extend(accumulate(len(s) for s in self._seqs))
+        super().__init__(self._offsets[-1])
+
+    def _at(self, i: int) -> _E:
+        # Rightmost offset not greater than `i` skips empty sequences.
+        k = bisect_right(self._offsets, i) - 1
+        return self._seqs[k][i - self._offsets[k]]
+
+    def __iter__(self) -> Iterator[_E]:
+        if self._indices == range(self._offsets[-1]):
+            return chain.from_iterable(self._seqs)
+        return super().__iter__()
+
+
+class GeneratedView(IndexedView[_E]):
+    """
+    Lazy sequence of `f(i)` for `i` in range `series`. Slices of the view are
+    views of the correspondingly sliced range.
+
+    >>> view = GeneratedView(lambda i: i * i, range(0, 10**12, 2))
+    >>> len(view), view[3], view[-1]
+    (500000000000, 36, 999999999996000000000004)
+    >>> view[2:5], tuple(view[2:5])
+    (GeneratedView(series=range(4, 10, 2)), (16, 36, 64))
+
+    Items are computed on every access unless `memo` is set, either to
+    `True` to cache all computed items or to a maximum number of cached items
+    (least recently used are evicted). Sliced views share the cache.
+
+    >>> calls = []
+    >>> def f(i):
+    ...     calls.append(i)
+    ...     return -i
+    >>> view = GeneratedView(f, range(100), memo=2)
+    >>> view[1], view[1], view[1:][0], calls
+    (-1, -1, -1, [1])
+    >>> view.cache
+    Cache(size=1, weight=0)
+    """
+
+    __slots__ = ('_f', '_cache')
+
+    def __init__(
+            self,
+            f: Callable[[int], _E],
+            series: range,
+            memo: Union[bool, int] = False
+    ) -> None:
+        """
+        >>> GeneratedView(str, range(3), memo=0)
+        Traceback (most recent call last):
+        ...
+        ValueError: memo must be bool or positive integer
+        """
+        if memo is not True and memo is not False and memo < 1:
+            raise ValueError('memo must be bool or positive integer')
+        super().__init__(0)
+        self._indices = series
+        self._f = f
+        self._cache: Optional[Cache[_E]] = None
+        if memo is True:
+            self._cache = Cache()
+        elif memo is not False:
+            self._cache = Cache(maxsize=memo)
+
+    @property
+    def cache(self) -> Optional[Cache[_E]]:
+        """
+        Cache of computed items, `None` without memoization.
+        """
+        return self._cache
+
+    def _at(self, i: int) -> _E:
+        cache = self._cache
+        if cache is None:
+            return self._f(i)
+        e = cache.get(i)
+        if e is MISSING:
+            e = self._f(i)
+            cache.put(i, e)
+        return e
+
+    def __repr__(self) -> str:
+        return f'GeneratedView(series={self._indices})'
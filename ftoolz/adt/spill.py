@@ -0,0 +1,285 @@
+import pickle
+from collections import deque
+from tempfile import TemporaryFile
+from typing import IO, Deque, Generic, Iterable, Iterator, List, Optional, \
+    Sized, TypeVar
+
+_E = TypeVar('_E')
+
+
+class BufferOverflowError(RuntimeError):
+    pass
+
+
+class SpillBuffer(Generic[_E], Sized):
+    """
+    Replay buffer that makes a one-shot iterable `it` re-iterable. Up to
+    `maxsize` items are kept in memory, the rest is pickled into a temporary
+    file and read back on each iteration.
+
+    >>> buffer = SpillBuffer(iter(range(5)), maxsize=2)
+    >>> list(buffer), list(buffer)
+    ([0, 1, 2, 3, 4], [0, 1, 2, 3, 4])
+    >>> buffer
+    SpillBuffer(memory=2, spilled=3)
+
+    The source is consumed on the first iteration (or :func:`len`). Multiple
+    iterations may be interleaved, e.g. in nested loops.
+
+    >>> buffer = SpillBuffer('ab', maxsize=0)
+    >>> [x + y for x in buffer for y in buffer]
+    ['aa', 'ab', 'ba', 'bb']
+
+    Without `maxsize` all items are kept in memory. The temporary file is
+    removed on :meth:`close` (or garbage collection).
+
+    **Warn**: This implementation is **not** thread-safe.
+    """
+
+    __slots__ = (
+        '_source', '_memory', '_maxsize', '_dir', '_file', '_spilled',
+    )
+
+    def __init__(
+            self,
+            it: Iterable[_E],
+            maxsize: Optional[int] = None,
+            spill_dir: Optional[str] = None
+    ) -> None:
+        """
+        >>> SpillBuffer([], maxsize=-1)
+        Traceback (most recent call last):
+        ...
+        ValueError: maxsize must be non-negative integer
+        """
+        if maxsize is not None and maxsize < 0:
+            raise ValueError('maxsize must be non-negative integer')
+        super().__init__()
+        self._source: Optional[Iterable[_E]] = it
+        self._memory: List[_E] = []
+        self._maxsize = maxsize
+        self._dir = spill_dir
+        self._file: Optional[IO[bytes]] = None
+        self._spilled = 0
+
+    def _fill(self) -> None:
+        source, self._source = self._source, None
+        if source is None:
+            return
+        memory, maxsize = self._memory, self._maxsize
+        for e in source:
+            if maxsize is None or len(memory) < maxsize:
+                memory.append(e)
+                continue
+            if self._file is None:
+                self._file = TemporaryFile(dir=self._dir)
+            pickle.dump(e, self._file, pickle.HIGHEST_PROTOCOL)
+            self._spilled += 1
+
+    def __iter__(self) -> Iterator[_E]:
+        self._fill()
+        yield from self._memory
+        if not self._spilled:
+            return
+        file = self._file
+        assert file is not None
+        # Each iterator keeps its own position, so they can be interleaved.
+        position = 0
+        for _ in range(self._spilled):
+            file.seek(position)
+            e: _E = pickle.load(file)
+            position = file.tell()
+            yield e
+
+    def close(self) -> None:
+        """
+        Drop all items and remove the temporary file (if any).
+        """
+        self._source = None
+        self._memory.clear()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._spilled = 0
+
+    def __len__(self) -> int:
+        """
+        >>> len(SpillBuffer(iter('abc'), maxsize=1))
+        3
+        """
+        self._fill()
+        return len(self._memory) + self._spilled
+
+    def __repr__(self) -> str:
+        return f'SpillBuffer(memory={len(self._memory)}, ' \
+               f'spilled={self._spilled})'
+
+
+class SpillQueue(Generic[_E], Sized):
+    """
+    FIFO queue that holds up to `maxsize` items in memory. Items that do not
+    fit are either pickled into a temporary file (if `spill` is set) or
+    rejected by raising :class:`BufferOverflowError`.
+
+    >>> q = SpillQueue(maxsize=2, spill=True)
+    >>> for i in range(5):
+    ...     q.append(i)
+    >>> q
+    SpillQueue(memory=2, spilled=3)
+    >>> [q.popleft() for _ in range(len(q))]
+    [0, 1, 2, 3, 4]
+
+    Without spilling the memory bound is strict.
+
+    >>> q = SpillQueue(maxsize=1)
+    >>> q.append(1)
+    >>> q.append(2)
+    Traceback (most recent call last):
+    ...
+    ftoolz.adt.spill.BufferOverflowError: Buffer size 1 exceeded.
+
+    Spilled items must be picklable. The temporary file is created lazily on
+    first spill and removed on :meth:`close` (or garbage collection).
+
+    **Warn**: This implementation is **not** thread-safe.
+    """
+
+    __slots__ = (
+        '_memory', '_maxsize', '_spill', '_dir', '_file', '_read_pos',
+        '_write_pos', '_spilled',
+    )
+
+    def __init__(
+            self,
+            maxsize: Optional[int] = None,
+            spill: bool = False,
+            spill_dir: Optional[str] = None
+    ) -> None:
+        """
+        >>> SpillQueue()
+        SpillQueue(memory=0, spilled=0)
+        >>> SpillQueue(maxsize=-1)
+        Traceback (most recent call last):
+        ...
+        ValueError: maxsize must be non-negative integer
+        """
+        if maxsize is not None and maxsize < 0:
+            raise ValueError('maxsize must be non-negative integer')
+        super().__init__()
+        self._memory: Deque[_E] = deque()
+        self._maxsize = maxsize
+        self._spill = spill
+        self._dir = spill_dir
+        self._file: Optional[IO[bytes]] = None
+        self._read_pos = 0
+        self._write_pos = 0
+        self._spilled = 0
+
+    def append(self, e: _E) -> None:
+        """
+        Append `e` to the end of the queue.
+
+        >>> q = SpillQueue(maxsize=0, spill=True)
+        >>> q.append('a')
+        >>> q
+        SpillQueue(memory=0, spilled=1)
+        """
+        memory = self._memory
+        if not self._spilled and (
+                self._maxsize is None or len(memory) < self._maxsize
+        ):
+            memory.append(e)
+        elif self._spill:
+            self._dump(e)
+        else:
+            raise BufferOverflowError(f'Buffer size {self._maxsize} exceeded.')
+
+    def popleft(self) -> _E:
+        """
+        Remove and return the first item of the queue.
+
+        >>> q = SpillQueue()
+        >>> q.append(42)
+        >>> q.popleft()
+        42
+        >>> q.popleft()
+        Traceback (most recent call last):
+        ...
+        IndexError: pop from an empty queue
+        """
+        if self._memory:
+            return self._memory.popleft()
+        if self._spilled:
+            return self._load()
+        raise IndexError('pop from an empty queue')
+
+    @property
+    def spilled(self) -> int:
+        """
+        Number of items currently stored in the temporary file.
+
+        >>> SpillQueue().spilled
+        0
+        """
+        return self._spilled
+
+    def close(self) -> None:
+        """
+        Drop all items and remove the temporary file (if any).
+
+        >>> q = SpillQueue(maxsize=0, spill=True)
+        >>> q.append(1)
+        >>> q.close()
+        >>> len(q)
+        0
+        """
+        self._memory.clear()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._read_pos = self._write_pos = self._spilled = 0
+
+    def _dump(self, e: _E) -> None:
+        if self._file is None:
+            self._file = TemporaryFile(dir=self._dir)
+        file = self._file
+        file.seek(self._write_pos)
+        pickle.dump(e, file, pickle.HIGHEST_PROTOCOL)
+        self._write_pos = file.tell()
+        self._spilled += 1
+
+    def _load(self) -> _E:
+        file = self._file
+        assert file is not None
+        file.seek(self._read_pos)
+        e: _E = pickle.load(file)
+        self._spilled -= 1
+        if self._spilled:
+            self._read_pos = file.tell()
+        else:
+            # Everything was read back, so the file can be reused from start.
+            file.seek(0)
+            file.truncate()
+            self._read_pos = self._write_pos = 0
+        return e
+
+    def __len__(self) -> int:
+        """
+        >>> q = SpillQueue(maxsize=1, spill=True)
+        >>> q.append(1)
+        >>> q.append(2)
+        >>> len(q)
+        2
+        """
+        return len(self._memory) + self._spilled
+
+    def __bool__(self) -> bool:
+        """
+        >>> bool(SpillQueue())
+        False
+        """
+        return bool(self._memory) or self._spilled > 0
+
+    def __repr__(self) -> str:
+        return f'SpillQueue(memory={len(self._memory)}, ' \
+               f'spilled={self._spilled})'
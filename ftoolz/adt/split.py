@@ -0,0 +1,120 @@
+from typing import Callable, Dict, Generic, Iterable, Iterator, Optional, \
+    Tuple, TypeVar
+
+from ftoolz.adt.spill import BufferOverflowError, SpillQueue
+
+_E = TypeVar('_E')
+
+
+class _Split(Generic[_E]):
+    """
+    Shared state of both branches of a split. Item of the other branch that
+    did not fit its buffer is kept `pending`, so that no item is lost on
+    :class:`BufferOverflowError` and both branches remain usable.
+    """
+
+    __slots__ = ('source', 'pred', 'queues', 'closed', 'pending')
+
+    def __init__(
+            self,
+            source: Iterator[_E],
+            pred: Callable[[_E], bool],
+            maxsize: Optional[int],
+            spill: bool
+    ) -> None:
+        self.source = source
+        self.pred = pred
+        self.queues: Dict[bool, SpillQueue[_E]] = {
+            True: SpillQueue(maxsize, spill),
+            False: SpillQueue(maxsize, spill),
+        }
+        self.closed: Dict[bool, bool] = {True: False, False: False}
+        self.pending: Optional[Tuple[_E, bool]] = None
+
+    def next(self, flag: bool) -> _E:
+        if self.closed[flag]:
+            raise StopIteration
+        own = self.queues[flag]
+        if own:
+            return own.popleft()
+        # Own buffer is drained, so the pending item is next in order.
+        if self.pending is not None:
+            e, e_flag = self.pending
+            if e_flag is not flag:
+                self._push(e, e_flag)
+            self.pending = None
+            if e_flag is flag:
+                return e
+        for e in self.source:
+            e_flag = bool(self.pred(e))
+            if e_flag is flag:
+                return e
+            try:
+                self._push(e, e_flag)
+            except BufferOverflowError:
+                self.pending = e, e_flag
+                raise
+        raise StopIteration
+
+    def close(self, flag: bool) -> None:
+        self.closed[flag] = True
+        self.queues[flag].close()
+        if self.pending is not None and self.pending[1] is flag:
+            self.pending = None
+
+    def _push(self, e: _E, flag: bool) -> None:
+        # Items of a closed branch are never consumed, so they are dropped.
+        if not self.closed[flag]:
+            self.queues[flag].append(e)
+
+
+class SplitBranch(Iterator[_E]):  # pylint: disable=E0239
+    """
+    One of two branches of a lazy split of an iterable by a predicate, see
+    :func:`ftoolz.itertoolz.split_by_lazy`. Items of the other branch pulled
+    from the source are buffered until that branch consumes them.
+
+    >>> pos, neg = SplitBranch.pair(lambda x: x > 0, iter([-1, 2, -3, 4]))
+    >>> next(pos), list(neg), list(pos)
+    (2, [-1, -3], [4])
+
+    Closed branch yields no more items and the other branch stops buffering
+    them.
+
+    >>> pos, neg = SplitBranch.pair(lambda x: x > 0, iter([-1, 2, -3, 4]))
+    >>> neg.close()
+    >>> list(pos), list(neg)
+    ([2, 4], [])
+
+    **Warn**: This implementation is **not** thread-safe.
+    """
+
+    __slots__ = ('_split', '_flag')
+
+    def __init__(self, split: _Split[_E], flag: bool) -> None:
+        self._split = split
+        self._flag = flag
+
+    @staticmethod
+    def pair(
+            pred: Callable[[_E], bool],
+            it: Iterable[_E],
+            maxsize: Optional[int] = None,
+            spill: bool = False
+    ) -> Tuple['SplitBranch[_E]', 'SplitBranch[_E]']:
+        """
+        Split `it` into branches of (positives, negatives) of `pred`, each
+        buffering up to `maxsize` items of the lagging branch (optionally
+        spilled to a temporary file).
+        """
+        split = _Split(iter(it), pred, maxsize, spill)
+        return SplitBranch(split, True), SplitBranch(split, False)
+
+    def __next__(self) -> _E:
+        return self._split.next(self._flag)
+
+    def close(self) -> None:
+        """
+        Stop consuming this branch and drop its buffered items.
+        """
+        self._split.close(self._flag)
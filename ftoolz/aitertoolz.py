@@ -0,0 +1,102 @@
+from typing import AsyncIterable, Callable, Dict, List, Optional, TypeVar
+
+from ftoolz.typing import Map
+
+A = TypeVar('A')
+B = TypeVar('B')
+E = TypeVar('E')
+
+
+async def associate(
+        key: Callable[[B], A],
+        values: AsyncIterable[B]
+) -> Map[A, B]:
+    """
+    Collect values into a :class:`Map` using provided key function,
+    asynchronous counterpart of :func:`ftoolz.itertoolz.associate`.
+
+    Values are assumed to be unique with respect to the keys. Latter value is
+    kept on key collision.
+
+    >>> from asyncio import new_event_loop
+    >>> from ftoolz.functoolz.aiter import from_iterable
+    >>> loop = new_event_loop()
+    >>> values = from_iterable(['a', 'bb', 'c'])
+    >>> loop.run_until_complete(associate(len, values))
+    {1: 'c', 2: 'bb'}
+    >>> loop.close()
+    """
+    result: Dict[A, B] = {}
+    async for v in values:
+        result[key(v)] = v
+    return result
+
+
+async def find(
+        pred: Callable[[E], bool],
+        it: AsyncIterable[E]
+) -> Optional[E]:
+    """
+    Find first item from given async iterable that satisfies `predicate`.
+
+    This operation is terminal in provided iterable only up to the found item.
+
+    >>> from asyncio import new_event_loop
+    >>> from ftoolz.functoolz.aiter import from_iterable
+    >>> loop = new_event_loop()
+    >>> it = from_iterable([1, 2, 3])
+    >>> loop.run_until_complete(find(lambda x: x > 1, it))
+    2
+    >>> loop.run_until_complete(find(lambda x: x > 3, it))
+    >>> loop.close()
+    """
+    async for e in it:
+        if pred(e):
+            return e
+    return None
+
+
+async def make_str(
+        it: AsyncIterable[E],
+        key: Callable[[E], str] = str,
+        sep: str = ','
+) -> str:
+    """
+    Serialize objects selected by key from async iterable to a string using
+    separator.
+
+    >>> from asyncio import new_event_loop
+    >>> from ftoolz.functoolz.aiter import from_iterable
+    >>> loop = new_event_loop()
+    >>> loop.run_until_complete(make_str(from_iterable([1, 2, 3]), sep='|'))
+    '1|2|3'
+    >>> loop.close()
+    """
+    return sep.join([key(e) async for e in it])
+
+
+async def take(n: int, it: AsyncIterable[E]) -> List[E]:
+    """
+    Return first n items of the async iterable as a list. Remaining items
+    can still be consumed from `it`.
+
+    >>> from asyncio import new_event_loop
+    >>> from ftoolz.functoolz.aiter import from_iterable
+    >>> loop = new_event_loop()
+    >>> it = from_iterable([1, 2, 3])
+    >>> loop.run_until_complete(take(2, it))
+    [1, 2]
+    >>> loop.run_until_complete(take(5, it))
+    [3]
+    >>> loop.close()
+    """
+    if n < 0:
+        raise ValueError('n must be non-negative integer')
+    result: List[E] = []
+    ait = it.__aiter__()
+    while len(result) < n:
+        try:
+            result.append(await ait.__anext__())
+        except StopAsyncIteration:
+            break
+    return result
@@ -1,9 +1,16 @@
 import functools
-from typing import Any, Callable, Optional, Tuple, Type, TypeVar, Union
+import sys
+import threading
+import time
+from time import perf_counter
+from typing import Any, Callable, Hashable, Optional, Tuple, Type, TypeVar, \
+    Union
 
 from cytoolz import compose
 
-from ftoolz.typing import Map
+from ftoolz.adt.cache import MISSING, Cache
+from ftoolz.adt.guardstats import GuardStats
+from ftoolz.typing import Map, is_ufunc
 
 # Invariant
 A = TypeVar('A')
@@ -23,6 +30,9 @@ B_out = TypeVar('B_out', covariant=True)
 C_out = TypeVar('C_out', covariant=True)
 D_out = TypeVar('D_out', covariant=True)
 
+# Attribute marking functions that operate on whole arrays, see `vectorizable`.
+_VECTORIZABLE = '__ftoolz_vectorizable__'
+
 
 def attempt(
         e: Union[Type[Exception], Tuple[Type[Exception], ...]],
@@ -53,12 +63,11 @@ def attempt(
     ...
     KeyError: 'k'
     """
-
-    def none(*_args: Any, **_kwargs: Any) -> Optional[A]:
+    try:
+        return f(*args, **kwargs)
+    except e:
         return None
 
-    return try_except(e, f, none, *args, **kwargs)
-
 
 def chain(*fs: Callable) -> Callable:
     """
@@ -89,13 +98,233 @@ def chain(*fs: Callable) -> Callable:
     return g
 
 
+def guarded(
+        _f: Optional[Callable[..., A]] = None,
+        *,
+        error: Union[Type[Exception], Tuple[Type[Exception], ...]] = Exception,
+        fallback: Optional[Callable[..., A]] = None,
+        stats: bool = False
+) -> Callable[[Callable[..., A]], Callable[..., Optional[A]]]:
+    """
+    Decorator equivalent to `try_except(error, f, fallback, args, kwargs)`
+    (or `attempt` if there is no `fallback`) with the guard built once at
+    decoration time, so that calls of the decorated function do not go
+    through any additional frames.
+
+    >>> @guarded(error=ValueError, fallback=lambda s: s.upper())
+    ... def parse(s: str) -> Any:
+    ...     return int(s)
+
+    >>> parse('1'), parse('a')
+    (1, 'A')
+
+    Without `fallback` errors are turned into `None`.
+
+    >>> guarded(int)('a')
+
+    Errors that are not mentioned in `error` are propagated to outer scope.
+
+    >>> guarded(error=ValueError)(lambda d: d['k'])({'a': 1})
+    Traceback (most recent call last):
+    ...
+    KeyError: 'k'
+
+    With `stats` set the decorated function counts calls, silenced errors by
+    type and time spent in failed calls (including the fallback) in a
+    :class:`GuardStats` available as its `stats` attribute.
+
+    >>> @guarded(stats=True)
+    ... def parse_int(s: str) -> int:
+    ...     return int(s)
+
+    >>> [parse_int(s) for s in ('1', 'a', '3', None)]
+    [1, None, 3, None]
+    >>> parse_int.stats.calls, parse_int.stats.silenced
+    (4, 2)
+    >>> sorted(e.__name__ for e in parse_int.stats.errors)
+    ['TypeError', 'ValueError']
+    """
+
+    def decorator(f: Callable[..., A]) -> Callable[..., Optional[A]]:
+        if stats:
+            return _counted_guard(f, error, fallback)
+
+        if fallback is None:
+            @functools.wraps(f)
+            def wrapper(*args: Any, **kwargs: Any) -> Optional[A]:
+                try:
+                    return f(*args, **kwargs)
+                except error:
+                    return None
+        else:
+            g = fallback
+
+            @functools.wraps(f)
+            def wrapper(*args: Any, **kwargs: Any) -> Optional[A]:
+                try:
+                    return f(*args, **kwargs)
+                except error:
+                    return g(*args, **kwargs)
+
+        return wrapper
+
+    return decorator if _f is None else decorator(_f)  # type: ignore
+
+
+def _counted_guard(
+        f: Callable[..., A],
+        error: Union[Type[Exception], Tuple[Type[Exception], ...]],
+        fallback: Optional[Callable[..., A]]
+) -> Callable[..., Optional[A]]:
+    counters = GuardStats()
+    record_call = counters.record_call
+    record_error = counters.record_error
+
+    @functools.wraps(f)
+    def wrapper(*args: Any, **kwargs: Any) -> Optional[A]:
+        record_call()
+        start = perf_counter()
+        try:
+            return f(*args, **kwargs)
+        except error as ex:
+            result = None if fallback is None else fallback(*args, **kwargs)
+            record_error(type(ex), perf_counter() - start)
+            return result
+
+    wrapper.stats = counters  # type: ignore
+    return wrapper
+
+
+def is_vectorizable(f: Callable) -> bool:
+    """
+    Check whether `f` can be applied to whole NumPy arrays instead of their
+    items, i.e. it is a NumPy `ufunc` or it is marked by :func:`vectorizable`.
+
+    >>> is_vectorizable(abs)
+    False
+    >>> is_vectorizable(vectorizable(lambda x: x + 1))
+    True
+    """
+    return getattr(f, _VECTORIZABLE, False) or is_ufunc(f)
+
+
+def memoized(
+        _f: Optional[Callable[..., A]] = None,
+        *,
+        maxsize: Optional[int] = 128,
+        ttl: Optional[float] = None,
+        maxweight: Optional[int] = None,
+        weigh: Callable[[Any], int] = sys.getsizeof,
+        key: Optional[Callable[..., Hashable]] = None,
+        cache_none: bool = True,
+        thread_safe: bool = False,
+        clock: Callable[[], float] = time.monotonic
+) -> Callable[[Callable[..., A]], Callable[..., A]]:
+    """
+    Decorator that caches results of decorated function in a :class:`Cache`
+    with LRU eviction bounded by number of entries (`maxsize`, `None` for
+    unbounded) and/or total weight of results (`maxweight` as measured by
+    `weigh`, e.g. bytes). Results older than `ttl` seconds are recomputed.
+
+    >>> calls = []
+    >>> @memoized(maxsize=2)
+    ... def square(x: int) -> int:
+    ...     calls.append(x)
+    ...     return x * x
+
+    >>> [square(x) for x in (1, 2, 1, 3, 2)]
+    [1, 4, 1, 9, 4]
+    >>> calls
+    [1, 2, 3, 2]
+    >>> square.stats
+    CacheStats(hits=1, misses=4, evictions=2, expirations=0)
+
+    Arguments of the function make up the cache key, unhashable arguments
+    require a custom `key` function receiving the same arguments.
+
+    >>> @memoized(key=lambda xs, scale=1: (tuple(xs), scale))
+    ... def total(xs, scale=1):
+    ...     return sum(xs) * scale
+
+    >>> total([1, 2], scale=2), total([1, 2], scale=2), total.stats.hits
+    (6, 6, 1)
+
+    Composed with :func:`silenced`, `cache_none=False` makes silenced
+    failures retry on the next call instead of being cached.
+
+    >>> @memoized(cache_none=False)
+    ... @silenced
+    ... def parse(s: str) -> int:
+    ...     return int(s)
+
+    >>> parse('x'), parse('x'), parse.stats.misses, len(parse.cache)
+    (None, None, 2, 0)
+
+    The cache can be dropped by `cache_clear`.
+
+    >>> parse('1'), len(parse.cache)
+    (1, 1)
+    >>> parse.cache_clear()
+    >>> len(parse.cache)
+    0
+
+    With `thread_safe` all cache operations are guarded by a lock. The lock
+    is not held while the decorated function runs, so concurrent calls with
+    the same arguments may compute the result more than once.
+    """
+
+    def decorator(f: Callable[..., A]) -> Callable[..., A]:
+        cache: Cache[A] = Cache(maxsize, ttl, maxweight, weigh, clock)
+        make_key = _make_key if key is None else key
+        get, put = cache.get, cache.put
+        if thread_safe:
+            lock = threading.Lock()
+            get, put = _synchronized(lock, get), _synchronized(lock, put)
+
+        @functools.wraps(f)
+        def wrapper(*args: Any, **kwargs: Any) -> A:
+            k = make_key(*args, **kwargs)
+            result = get(k)
+            if result is MISSING:
+                result = f(*args, **kwargs)
+                if cache_none or result is not None:
+                    put(k, result)
+            return result
+
+        wrapper.cache = cache  # type: ignore
+        wrapper.stats = cache.stats  # type: ignore
+        wrapper.cache_clear = cache.clear  # type: ignore
+        return wrapper
+
+    return decorator if _f is None else decorator(_f)  # type: ignore
+
+
+_KWARGS_MARK = object()
+
+
+def _make_key(*args: Any, **kwargs: Any) -> Hashable:
+    if not kwargs:
+        return args
+    return args + (_KWARGS_MARK,) + tuple(kwargs.items())
+
+
+def _synchronized(lock: Any, f: Callable[..., A]) -> Callable[..., A]:
+    def locked(*args: Any) -> A:
+        with lock:
+            return f(*args)
+
+    return locked
+
+
 def silenced(
         _f: Optional[Callable[..., A]] = None,
         *,
-        error: Union[Type[Exception], Tuple[Type[Exception], ...]] = Exception
+        error: Union[Type[Exception], Tuple[Type[Exception], ...]] = Exception,
+        stats: bool = False
 ) -> Callable[[Callable[..., A]], Callable[..., Optional[A]]]:
     """
     Decorator that turns `errors` raised by decorated function into `None`.
+    See :func:`guarded` for the meaning of `stats`.
 
     >>> @silenced(error=ValueError)
     ... def f(x: int, y: str) -> int:
@@ -124,16 +353,17 @@ def silenced(
     ...     return d['k']
 
     >>> h({'a': 42})
-    """
 
-    def decorator(f: Callable[..., A]) -> Callable[..., Optional[A]]:
-        @functools.wraps(f)
-        def wrapper(*args: Any, **kwargs: Any) -> Optional[A]:
-            return attempt(error, f, *args, **kwargs)
+    Silenced errors can be counted.
 
-        return wrapper
+    >>> @silenced(stats=True)
+    ... def k(d: Map[str, Any]) -> Any:
+    ...     return d['k']
 
-    return decorator if _f is None else decorator(_f)  # type: ignore
+    >>> k({}), k({'k': 1}), k.stats.calls, k.stats.silenced
+    (None, 1, 2, 1)
+    """
+    return guarded(_f, error=error, stats=stats)
 
 
 def try_apply(f: Callable[..., A], *args: Any, **kwargs: Any) -> Optional[A]:
@@ -148,7 +378,10 @@ def try_apply(f: Callable[..., A], *args: Any, **kwargs: Any) -> Optional[A]:
     >>> try_apply(f, 1, y='x')
     >>> try_apply(lambda d: d['k'], {'a': 1})
     """
-    return attempt(Exception, f, *args, **kwargs)
+    try:
+        return f(*args, **kwargs)
+    except Exception:  # pylint: disable=broad-except
+        return None
 
 
 def try_except(
@@ -192,3 +425,21 @@ def try_except(
         return f(*args, **kwargs)
     except e:
         return g(*args, **kwargs)
+
+
+def vectorizable(f: Callable[..., A]) -> Callable[..., A]:
+    """
+    Mark `f` as a function that gives the same results applied to NumPy
+    arrays as applied to their items one by one (e.g. composed of arithmetic
+    operators and ufuncs), so that :mod:`ftoolz.functoolz.seq` can call it
+    on whole arrays. The function itself is returned unchanged.
+
+    >>> @vectorizable
+    ... def scale(x: float) -> float:
+    ...     return 2 * x + 1
+
+    >>> scale(1)
+    3
+    """
+    setattr(f, _VECTORIZABLE, True)
+    return f
@@ -0,0 +1,233 @@
+import asyncio
+from collections import deque
+from typing import Any, AsyncGenerator, AsyncIterable, AsyncIterator, \
+    Awaitable, Callable, Deque, Iterable, List, Set, Tuple
+
+from ftoolz.functoolz import A, A_in, A_out, B, B_in, B_out, C_out
+from ftoolz.functoolz import iter as fiter
+
+
+async def apply(
+        ff: AsyncIterable[Callable[[A_in], B_out]],
+        fa: AsyncIterable[A_in]
+) -> AsyncGenerator[B_out, None]:
+    """
+    Given a value and a function in the :class:`AsyncIterable` context,
+    applies the function to the value. Asynchronous counterpart of
+    :func:`ftoolz.functoolz.iter.apply`.
+
+    **Warn**: This operation is terminal in both given iterables and `fa` is
+    collected into memory before the first function is applied.
+    """
+    fas = [a async for a in fa]
+    async for f in ff:
+        for a in fas:
+            yield f(a)
+
+
+async def flatmap(
+        f: Callable[[A_in], AsyncIterable[B_out]],
+        fa: AsyncIterable[A_in]
+) -> AsyncGenerator[B_out, None]:
+    """
+    Apply `f` to each item of `fa` and concatenate resulting async iterables.
+    """
+    async for a in fa:
+        async for b in f(a):
+            yield b
+
+
+async def flatten(
+        ffa: AsyncIterable[AsyncIterable[A]]
+) -> AsyncGenerator[A, None]:
+    """
+    Flatten a nested `AsyncIterable` of `AsyncIterable` structure into
+    a single-layer `AsyncIterable` structure.
+    """
+    async for fa in ffa:
+        async for a in fa:
+            yield a
+
+
+async def fmap(
+        f: Callable[[A_in], B_out],
+        fa: AsyncIterable[A_in]
+) -> AsyncGenerator[B_out, None]:
+    """
+    Functor map for :class:`AsyncIterable` with synchronous `f`. Coroutine
+    functions are mapped by :func:`fmap_concurrent`.
+    """
+    async for a in fa:
+        yield f(a)
+
+
+async def fmap2(
+        f: Callable[[A_in, B_in], C_out],
+        fa: AsyncIterable[A_in],
+        fb: AsyncIterable[B_in]
+) -> AsyncGenerator[C_out, None]:
+    """
+    Bi-functor map for :class:`AsyncIterable`.
+
+    **Warn**: This operation is terminal in both arguments and `fb` is
+    collected into memory before the first item of `fa` is processed.
+    """
+    fbs = [b async for b in fb]
+    async for a in fa:
+        for b in fbs:
+            yield f(a, b)
+
+
+def fmap_concurrent(
+        f: Callable[[A_in], Awaitable[B_out]],
+        fa: AsyncIterable[A_in],
+        concurrency: int = 8,
+        ordered: bool = True
+) -> AsyncGenerator[B_out, None]:
+    """
+    Map coroutine function `f` over `fa` with up to `concurrency` calls
+    running at once. Results are yielded either in the order of `fa` or, if
+    not `ordered`, as soon as they are available.
+
+    New items of `fa` are pulled only when there is a free slot, and only as
+    the results are consumed, so a slow consumer (or source) bounds both the
+    number of running calls and buffered results (backpressure).
+
+    **Warn**: Calls still running when the resulting iterator is closed are
+    cancelled. Errors raised by `f` are propagated to the consumer.
+    """
+    if concurrency < 1:
+        raise ValueError('concurrency must be positive integer')
+    if ordered:
+        return _fmap_ordered(f, fa, concurrency)
+    return _fmap_unordered(f, fa, concurrency)
+
+
+async def _fmap_ordered(
+        f: Callable[[A_in], Awaitable[B_out]],
+        fa: AsyncIterable[A_in],
+        concurrency: int
+) -> AsyncGenerator[B_out, None]:
+    running: Deque['asyncio.Future[B_out]'] = deque()
+    try:
+        async for a in fa:
+            running.append(asyncio.ensure_future(f(a)))
+            if len(running) >= concurrency:
+                yield await running.popleft()
+        while running:
+            yield await running.popleft()
+    finally:
+        for task in running:
+            task.cancel()
+
+
+async def _fmap_unordered(
+        f: Callable[[A_in], Awaitable[B_out]],
+        fa: AsyncIterable[A_in],
+        concurrency: int
+) -> AsyncGenerator[B_out, None]:
+    running: Set['asyncio.Future[B_out]'] = set()
+    try:
+        async for a in fa:
+            running.add(asyncio.ensure_future(f(a)))
+            if len(running) >= concurrency:
+                done, running = await asyncio.wait(
+                    running, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    yield task.result()
+        while running:
+            done, running = await asyncio.wait(
+                running, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                yield task.result()
+    finally:
+        for task in running:
+            task.cancel()
+
+
+async def fproduct(
+        f: Callable[[A], B_out],
+        fa: AsyncIterable[A]
+) -> AsyncGenerator[Tuple[A, B_out], None]:
+    """
+    Tuple the values in fa with the result of applying a function with
+    the value.
+    """
+    async for a in fa:
+        yield a, f(a)
+
+
+async def from_iterable(it: Iterable[A]) -> AsyncGenerator[A, None]:
+    """
+    Turn a synchronous iterable into an :class:`AsyncIterable`.
+    """
+    for a in it:
+        yield a
+
+
+async def generate(
+        f: Callable[[int], A_out],
+        *args: Any,
+        **kwargs: Any
+) -> AsyncGenerator[A_out, None]:
+    """
+    Create an async iterable of elements generated by `f` given range
+    parameters, see :func:`ftoolz.functoolz.iter.generate`.
+    """
+    for a in fiter.generate(f, *args, **kwargs):
+        yield a
+
+
+def lift(
+        f: Callable[[A_in], B_out]
+) -> Callable[[AsyncIterable[A_in]], AsyncGenerator[B_out, None]]:
+    """
+    Lift a function f to operate on :class:`AsyncIterable`.
+    """
+    return lambda fa: fmap(f, fa)
+
+
+async def product(
+        fa: AsyncIterable[A],
+        fb: AsyncIterable[B]
+) -> AsyncGenerator[Tuple[A, B], None]:
+    """
+    Combine an `AsyncIterable[A]` and an `AsyncIterable[B]` into an
+    `AsyncIterable[(A, B)]`.
+
+    **Warn**: This operation is terminal in both arguments and `fb` is
+    collected into memory before the first item of `fa` is processed.
+    """
+    fbs = [b async for b in fb]
+    async for a in fa:
+        for b in fbs:
+            yield a, b
+
+
+async def unit(a: A) -> AsyncGenerator[A, None]:
+    """
+    Unit value for :class:`AsyncIterable`. Returns single item async
+    generator.
+    """
+    yield a
+
+
+async def zip_map(
+        f: Callable[..., A_out],
+        *fx: AsyncIterable[Any]
+) -> AsyncGenerator[A_out, None]:
+    """
+    Apply `f` to items of given async iterables taken in lockstep, stops
+    with the shortest one.
+    """
+    its: List[AsyncIterator[Any]] = [fa.__aiter__() for fa in fx]
+    if not its:
+        return
+    while True:
+        try:
+            args = [await it.__anext__() for it in its]
+        except StopAsyncIteration:
+            return
+        yield f(*args)
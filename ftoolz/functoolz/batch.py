@@ -0,0 +1,276 @@
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Generic, Hashable, \
+    Iterable, Iterator, List, Optional, TypeVar, Union
+
+from cytoolz.itertoolz import partition_all
+
+from ftoolz.typing import Map
+
+K = TypeVar('K', bound=Hashable)
+V = TypeVar('V')
+
+Bulk = Callable[[List[K]], Union[Map[K, V], Awaitable[Map[K, V]]]]
+
+
+class BatchStats:
+    """
+    Counters of a :class:`Coalescer`: number of per-item `calls`, number of
+    bulk calls (`batches`) and total number of `keys` passed to them.
+    Difference of `calls` and `keys` is the number of de-duplicated keys.
+
+    >>> BatchStats()
+    BatchStats(calls=0, batches=0, keys=0)
+    """
+
+    __slots__ = ('calls', 'batches', 'keys')
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.batches = 0
+        self.keys = 0
+
+    def __repr__(self) -> str:
+        return f'BatchStats(calls={self.calls}, batches={self.batches}, ' \
+               f'keys={self.keys})'
+
+
+class _Keys:
+    # Keys collected for single bulk call shared by all its callers. Dict is
+    # used as an insertion-ordered set when keys are de-duplicated.
+    __slots__ = ('keys',)
+
+    def __init__(self, dedupe: bool) -> None:
+        self.keys: Union[Dict[Any, None], List[Any]] = {} if dedupe else []
+
+    def add(self, k: Any) -> int:
+        keys = self.keys
+        if isinstance(keys, dict):
+            keys[k] = None
+        else:
+            keys.append(k)
+        return len(keys)
+
+
+class _Batch(_Keys):
+    __slots__ = ('full', 'done', 'results', 'error')
+
+    def __init__(self, dedupe: bool) -> None:
+        super().__init__(dedupe)
+        self.full = threading.Event()
+        self.done = threading.Event()
+        self.results: Map[Any, Any] = {}
+        self.error: Optional[BaseException] = None
+
+
+class _AsyncBatch(_Keys):
+    __slots__ = ('future', 'timer')
+
+    def __init__(self, dedupe: bool, future: 'asyncio.Future[Any]') -> None:
+        super().__init__(dedupe)
+        self.future = future
+        self.timer: Optional[asyncio.Handle] = None
+
+
+class Coalescer(Generic[K, V]):
+    """
+    Per-item function backed by a `bulk` function from list of keys to mapping
+    of keys to values. Calls are collected into batches of at most
+    `max_batch_size` keys (de-duplicated if `dedupe` is set) and each batch
+    results in a single bulk call. Keys missing in the bulk result map to
+    `default`.
+
+    Batch of items known upfront is loaded by :meth:`map`.
+
+    >>> def bulk(keys):
+    ...     print('bulk', keys)
+    ...     return {k: k.upper() for k in keys if k != 'x'}
+
+    >>> loader = Coalescer(bulk, max_batch_size=3)
+    >>> list(loader.map(['a', 'b', 'a', 'c', 'x']))
+    bulk ['a', 'b']
+    bulk ['c', 'x']
+    ['A', 'B', 'A', 'C', None]
+
+    Independent calls from multiple threads (or async tasks, see
+    :meth:`load_async`) are coalesced. The first caller of a batch waits up
+    to `max_wait` seconds (or until the batch is full) and then calls `bulk`
+    on behalf of all callers of that batch. Called from a single thread each
+    call makes a single batch after `max_wait`.
+
+    >>> loader('a')
+    bulk ['a']
+    'A'
+    >>> loader.stats
+    BatchStats(calls=6, batches=3, keys=5)
+
+    Errors raised by `bulk` are propagated to all callers of the batch.
+    """
+
+    __slots__ = (
+        '_bulk', '_max_batch_size', '_max_wait', '_dedupe', '_default',
+        '_lock', '_pending', '_async_pending', 'stats',
+    )
+
+    def __init__(
+            self,
+            bulk: Bulk[K, V],
+            max_batch_size: int = 100,
+            max_wait: float = 0.005,
+            dedupe: bool = True,
+            default: Optional[V] = None
+    ) -> None:
+        """
+        >>> Coalescer(dict, max_batch_size=0)
+        Traceback (most recent call last):
+        ...
+        ValueError: max_batch_size must be positive integer
+        """
+        if max_batch_size < 1:
+            raise ValueError('max_batch_size must be positive integer')
+        if max_wait < 0:
+            raise ValueError('max_wait must be non-negative number')
+        self._bulk = bulk
+        self._max_batch_size = max_batch_size
+        self._max_wait = max_wait
+        self._dedupe = dedupe
+        self._default = default
+        self._lock = threading.Lock()
+        self._pending: Optional[_Batch] = None
+        self._async_pending: Optional[_AsyncBatch] = None
+        self.stats = BatchStats()
+
+    def map(self, keys: Iterable[K]) -> Iterator[Optional[V]]:
+        """
+        Lazily load values of `keys` in batches of at most `max_batch_size`
+        consecutive keys.
+
+        >>> loader = Coalescer(lambda ks: {k: -k for k in ks})
+        >>> list(loader.map(range(3)))
+        [0, -1, -2]
+        """
+        default = self._default
+        for chunk in partition_all(self._max_batch_size, keys):
+            self.stats.calls += len(chunk)
+            unique = list(dict.fromkeys(chunk) if self._dedupe else chunk)
+            results = self._call(unique)
+            yield from (results.get(k, default) for k in chunk)
+
+    def __call__(self, k: K) -> Optional[V]:
+        with self._lock:
+            self.stats.calls += 1
+            batch = self._pending
+            leader = batch is None
+            if batch is None:
+                batch = self._pending = _Batch(self._dedupe)
+            if batch.add(k) >= self._max_batch_size:
+                self._pending = None
+                batch.full.set()
+
+        if leader:
+            batch.full.wait(self._max_wait)
+            with self._lock:
+                if self._pending is batch:
+                    self._pending = None
+            try:
+                batch.results = self._call(list(batch.keys))
+            except Exception as e:  # pylint: disable=broad-except
+                batch.error = e
+            except BaseException:
+                # E.g. `KeyboardInterrupt` propagates from the leader only.
+                batch.error = RuntimeError('Bulk call was interrupted.')
+                raise
+            finally:
+                batch.done.set()
+        else:
+            batch.done.wait()
+
+        if batch.error is not None:
+            raise batch.error
+        value: Optional[V] = batch.results.get(k, self._default)
+        return value
+
+    async def load_async(self, k: K) -> Optional[V]:
+        """
+        Asynchronously load value of `k`. Keys requested within `max_wait`
+        seconds are loaded by a single bulk call that is either awaited (for
+        coroutine `bulk`) or run in the default executor of the event loop.
+
+        **Warn**: All calls of `load_async` must share a single event loop.
+        """
+        loop = asyncio.get_event_loop()
+        self.stats.calls += 1
+        batch = self._async_pending
+        if batch is None:
+            batch = self._async_pending = \
+                _AsyncBatch(self._dedupe, loop.create_future())
+            batch.timer = loop.call_later(
+                self._max_wait, self._flush_async, batch
+            )
+        if batch.add(k) >= self._max_batch_size:
+            self._flush_async(batch)
+
+        # Shielded, so that a cancelled caller does not cancel the batch.
+        results: Map[K, V] = await asyncio.shield(batch.future)
+        return results.get(k, self._default)
+
+    def _flush_async(self, batch: _AsyncBatch) -> None:
+        if self._async_pending is not batch:
+            return
+        self._async_pending = None
+        if batch.timer is not None:
+            batch.timer.cancel()
+        asyncio.ensure_future(self._run_async(batch))
+
+    async def _run_async(self, batch: _AsyncBatch) -> None:
+        keys = list(batch.keys)
+        self.stats.batches += 1
+        self.stats.keys += len(keys)
+        try:
+            if asyncio.iscoroutinefunction(self._bulk):
+                results = await self._bulk(keys)
+            else:
+                loop = asyncio.get_event_loop()
+                results = await loop.run_in_executor(None, self._bulk, keys)
+        except Exception as e:  # pylint: disable=broad-except
+            if not batch.future.done():
+                batch.future.set_exception(e)
+        else:
+            if not batch.future.done():
+                batch.future.set_result(results)
+
+    def _call(self, keys: List[K]) -> Map[K, V]:
+        self.stats.batches += 1
+        self.stats.keys += len(keys)
+        results: Map[K, V] = self._bulk(keys)  # type: ignore
+        return results
+
+    def __repr__(self) -> str:
+        return f'Coalescer(max_batch_size={self._max_batch_size}, ' \
+               f'max_wait={self._max_wait})'
+
+
+def coalesced(
+        _f: Optional[Bulk[K, V]] = None,
+        *,
+        max_batch_size: int = 100,
+        max_wait: float = 0.005,
+        dedupe: bool = True,
+        default: Optional[V] = None
+) -> Any:
+    """
+    Decorator that turns bulk function from list of keys to mapping of keys
+    to values into a per-item :class:`Coalescer`.
+
+    >>> @coalesced(max_batch_size=2)
+    ... def lengths(keys):
+    ...     return {k: len(k) for k in keys}
+
+    >>> list(lengths.map(['a', 'bb', 'ccc'])), lengths.stats.batches
+    ([1, 2, 3], 2)
+    """
+
+    def decorator(f: Bulk[K, V]) -> Coalescer[K, V]:
+        return Coalescer(f, max_batch_size, max_wait, dedupe, default)
+
+    return decorator if _f is None else decorator(_f)
@@ -1,14 +1,33 @@
 from itertools import starmap
-from typing import Any, Callable, Iterable, Tuple
+from typing import Any, Callable, Iterable, Optional, Tuple
 
 from cytoolz.itertoolz import identity, mapcat
 
+from ftoolz.adt.reiterable import Reiterable
+from ftoolz.adt.spill import SpillBuffer
 from ftoolz.functoolz import A, A_in, A_out, B, B_in, B_out, C_out
+from ftoolz.typing import Seq
+
+
+# Sequences that cannot change after the call, so they need not be copied.
+_IMMUTABLE_SEQUENCES = (tuple, str, bytes, range)
+
+
+def _replayable(it: Iterable[A], spill: Optional[int]) -> Iterable[A]:
+    # Arguments traversed repeatedly are collected unless they already can
+    # be iterated multiple times. Mutable sequences are copied, so that the
+    # lazy result does not observe their later modifications.
+    if isinstance(it, (_IMMUTABLE_SEQUENCES, Reiterable, SpillBuffer)):
+        return it
+    if spill is not None and not isinstance(it, Seq):
+        return SpillBuffer(it, maxsize=spill)
+    return list(it)
 
 
 def apply(
         ff: Iterable[Callable[[A_in], B_out]],
-        fa: Iterable[A_in]
+        fa: Iterable[A_in],
+        spill: Optional[int] = None
 ) -> Iterable[B_out]:
     """
     Given a value and a function in the :class:`Iterable` context,
@@ -48,8 +67,25 @@ def apply(
     Traceback (most recent call last):
     ...
     StopIteration
+
+    Iterable `fa` is collected into a list unless it is an immutable
+    sequence (`tuple`, `str`, `bytes`, `range`) or another re-iterable
+    (:class:`ftoolz.adt.reiterable.Reiterable`). Mutable sequences are
+    copied, so modifying them after the call does not affect the lazy
+    result. Given `spill` threshold, only that many items of other iterables
+    are kept in memory and the rest is spilled to a temporary file
+    (:class:`ftoolz.adt.spill.SpillBuffer`).
+
+    >>> fs = [1, 2]
+    >>> result = apply([str], fs)
+    >>> fs.append(3)
+    >>> list(result)
+    ['1', '2']
+
+    >>> list(apply([str, abs], iter([-1, -2]), spill=1))
+    ['-1', '-2', 1, 2]
     """
-    fas = list(fa)
+    fas = _replayable(fa, spill)
     return flatmap(lambda f: fmap(f, fas), ff)
 
 
@@ -84,7 +120,8 @@ fmap = map
 def fmap2(
         f: Callable[[A_in, B_in], C_out],
         fa: Iterable[A_in],
-        fb: Iterable[B_in]
+        fb: Iterable[B_in],
+        spill: Optional[int] = None
 ) -> Iterable[C_out]:
     """
     Bi-functor map for :class:`Iterable`.
@@ -119,8 +156,11 @@ def fmap2(
     Traceback (most recent call last):
     ...
     StopIteration
+
+    Iterable `fb` is traversed repeatedly, see :func:`apply` for meaning of
+    `spill` and handling of re-iterables.
     """
-    fbs = list(fb)
+    fbs = _replayable(fb, spill)
 
     def ff(a: A_in) -> Iterable[C_out]:
         return fmap(lambda b: f(a, b), fbs)
@@ -219,7 +259,11 @@ def lift(
     return lambda fa: fmap(f, fa)
 
 
-def product(fa: Iterable[A], fb: Iterable[B]) -> Iterable[Tuple[A, B]]:
+def product(
+        fa: Iterable[A],
+        fb: Iterable[B],
+        spill: Optional[int] = None
+) -> Iterable[Tuple[A, B]]:
     """
     Combine an `Iterable[A]` and an `Iterable[B]` into an `Iterable[(A, B)]`
     that maintains the effects of both `fa` and `fb`.
@@ -251,8 +295,16 @@ def product(fa: Iterable[A], fb: Iterable[B]) -> Iterable[Tuple[A, B]]:
     Traceback (most recent call last):
     ...
     StopIteration
+
+    Iterable `fb` is traversed repeatedly, see :func:`apply` for meaning of
+    `spill` and handling of re-iterables. Product of two file streams thus
+    runs in bounded memory, e.g.
+    `product(fa, Reiterable(lambda: open(path)))`.
+
+    >>> list(product('ab', iter([1, 2]), spill=0))
+    [('a', 1), ('a', 2), ('b', 1), ('b', 2)]
     """
-    fbs = list(fb)
+    fbs = _replayable(fb, spill)
 
     # Because pylint does not allow `lambda a: fmap(lambda b: (a, b), fbs)`.
     def ff(a: A) -> Iterable[Tuple[A, B]]:
@@ -1,6 +1,39 @@
-from typing import Callable, Iterable, overload
+from typing import Any, Callable, Iterable, Optional, Tuple, overload
 
-from ftoolz.functoolz import A_out
+from ftoolz.functoolz import A, A_in, A_out, B, B_in, B_out, C_out
+
+
+def apply(
+        ff: Iterable[Callable[[A_in], B_out]],
+        fa: Iterable[A_in],
+        spill: Optional[int] = None
+) -> Iterable[B_out]: ...
+
+
+def flatmap(
+        f: Callable[[A_in], Iterable[B_out]],
+        fa: Iterable[A_in]
+) -> Iterable[B_out]: ...
+
+
+def flatten(ffa: Iterable[Iterable[A]]) -> Iterable[A]: ...
+
+
+def fmap(f: Callable[[A_in], B_out], fa: Iterable[A_in]) -> Iterable[B_out]: ...
+
+
+def fmap2(
+        f: Callable[[A_in, B_in], C_out],
+        fa: Iterable[A_in],
+        fb: Iterable[B_in],
+        spill: Optional[int] = None
+) -> Iterable[C_out]: ...
+
+
+def fproduct(
+        f: Callable[[A], B_out],
+        fa: Iterable[A]
+) -> Iterable[Tuple[A, B_out]]: ...
 
 
 @overload
@@ -17,3 +50,21 @@ def generate(
         stop: int,
         step: int = 1
 ) -> Iterable[A_out]: ...
+
+
+def lift(
+        f: Callable[[A_in], B_out]
+) -> Callable[[Iterable[A_in]], Iterable[B_out]]: ...
+
+
+def product(
+        fa: Iterable[A],
+        fb: Iterable[B],
+        spill: Optional[int] = None
+) -> Iterable[Tuple[A, B]]: ...
+
+
+def unit(a: A) -> Iterable[A]: ...
+
+
+def zip_map(f: Callable[..., A_out], *fx: Iterable[Any]) -> Iterable[A_out]: ...
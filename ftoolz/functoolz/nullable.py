@@ -0,0 +1,138 @@
+import sys
+from typing import Any, Callable, List, Optional
+
+from ftoolz.adt.column import Column, bitmap_and
+from ftoolz.functoolz import A_in, A_out, B_in, B_out, C_out, is_vectorizable
+from ftoolz.typing import is_ndarray
+
+
+def applyN(
+        ff: Optional[Callable[..., A_out]],
+        *cols: Any
+) -> Any:
+    """
+    Column-wise :func:`ftoolz.functoolz.opt.applyN`, i.e. apply optional
+    function `ff` to rows where all `cols` are present. Missing `ff` results
+    in a column of nulls.
+
+    >>> applyN(lambda x, y: f'{x}{y}', Column.of([4, None]), Column.of('22'))
+    Column(['42', None])
+    >>> applyN(None, Column.of([4, None]))
+    Column([None, None])
+    """
+    if ff is not None:
+        return fmapN(ff, *cols)
+    if cols and _is_masked(cols[0]):
+        ma = sys.modules['numpy'].ma
+        return ma.masked_all(len(cols[0]))
+    n = len(cols[0]) if cols else 0
+    return Column([None] * n, bytes((n + 7) // 8))
+
+
+def fmap(f: Callable[[A_in], B_out], col: Any) -> Any:
+    """
+    Column-wise :func:`ftoolz.functoolz.opt.fmap`, i.e. apply `f` to present
+    rows of the column, null rows stay null.
+
+    >>> fmap(lambda x: x + 1, Column.of([1, None, 3]))
+    Column([2, None, 4])
+    """
+    return fmapN(f, col)
+
+
+def fmap2(
+        f: Callable[[A_in, B_in], C_out],
+        ca: Any,
+        cb: Any
+) -> Any:
+    """
+    Column-wise :func:`ftoolz.functoolz.opt.fmap2`, i.e. apply `f` to rows
+    where both columns are present.
+
+    >>> fmap2(lambda a, b: b * a, Column.of([1, None, 3]), Column.of('ab'))
+    Traceback (most recent call last):
+    ...
+    ValueError: columns must have equal length
+    >>> fmap2(lambda a, b: b * a, Column.of([1, None, 3]), Column.of('abc'))
+    Column(['a', None, 'ccc'])
+    """
+    return fmapN(f, ca, cb)
+
+
+def fmapN(f: Callable[..., A_out], *cols: Any) -> Any:
+    """
+    Column-wise :func:`ftoolz.functoolz.opt.fmapN`, i.e. apply `f` to rows
+    where all `cols` are present. The resulting validity bitmap is the
+    intersection of validity bitmaps of `cols`.
+
+    >>> a = Column.of([1, None, 3, 4])
+    >>> b = Column.of([10, 20, None, 40])
+    >>> c = fmapN(lambda x, y: x + y, a, b)
+    >>> c, c.validity
+    (Column([11, None, None, 44]), b'\\t')
+
+    Columns backed by NumPy arrays and a vectorizable `f` (a `ufunc` or
+    function marked by :func:`ftoolz.functoolz.vectorizable`) are computed
+    at once on whole arrays. NumPy masked arrays are supported as well and
+    result in a masked array. As NumPy is optional, columns are typed `Any`.
+
+    **Warn**: Vectorized `f` is applied to placeholder values of null rows
+    too, so it must not fail on them (results of such rows are masked).
+    """
+    if not cols:
+        raise ValueError('at least one column expected')
+    n = len(cols[0])
+    if any(len(c) != n for c in cols):
+        raise ValueError('columns must have equal length')
+
+    if all(_is_masked(c) for c in cols):
+        return _fmap_masked(f, cols)
+
+    columns: List[Column] = [_column(c) for c in cols]
+    validity = bitmap_and((c.validity for c in columns), n)
+    values = [c.values for c in columns]
+
+    if is_vectorizable(f) and all(is_ndarray(v) for v in values):
+        result: Any = f(*values)
+        return Column(result, validity)
+
+    if validity is None:
+        return Column([f(*row) for row in zip(*values)])
+    return Column([
+        f(*row) if validity[i >> 3] >> (i & 7) & 1 else None
+        for i, row in enumerate(zip(*values))
+    ], validity)
+
+
+def _column(col: Any) -> Column:
+    if isinstance(col, Column):
+        return col
+    if _is_masked(col):
+        np = sys.modules['numpy']
+        mask = np.ma.getmaskarray(col)
+        bits = np.packbits(~mask, bitorder='little').tobytes()
+        return Column(col.data, bits)
+    raise TypeError(f'Nullable column expected, {type(col).__name__} given.')
+
+
+def _fmap_masked(f: Callable[..., Any], cols: Any) -> Any:
+    np = sys.modules['numpy']
+    ma = np.ma
+    mask = ma.getmaskarray(cols[0])
+    for col in cols[1:]:
+        mask = mask | ma.getmaskarray(col)
+    data = [col.data for col in cols]
+    if is_vectorizable(f):
+        return ma.masked_array(f(*data), mask=mask)
+    # Compute present rows only and scatter them into a dense array.
+    present = np.asarray([
+        f(*row) for m, row in zip(mask, zip(*data)) if not m
+    ])
+    values = np.zeros(len(mask), dtype=present.dtype)
+    values[~mask] = present
+    return ma.masked_array(values, mask=mask)
+
+
+def _is_masked(col: Any) -> bool:
+    np = sys.modules.get('numpy')
+    return np is not None and isinstance(col, np.ma.MaskedArray)
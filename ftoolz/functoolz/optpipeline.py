@@ -0,0 +1,236 @@
+from enum import Enum
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple, \
+    Union
+
+
+class OptionalStageKind(Enum):
+    MAP = 'map'
+    FILTER = 'filter'
+    FLATMAP = 'flatmap'
+    FMAPN = 'fmapN'
+
+
+class OptionalStage(NamedTuple):
+    """
+    Single step of an :class:`OptionalPipeline`. Stages of kind `FMAPN`
+    compute arguments of `f` by functions `args` of the current value, see
+    :meth:`OptionalPipeline.fmapN`.
+    """
+    kind: OptionalStageKind
+    f: Callable[..., Any]
+    args: Tuple[Callable[[Any], Any], ...] = ()
+
+
+class CompiledOptional:
+    """
+    Optional pipeline compiled into a function from :class:`Optional` to
+    :class:`Optional` that returns `None` as soon as any step does.
+    """
+
+    __slots__ = ('_run', 'stages', 'source')
+
+    def __init__(
+            self,
+            run: Callable[[Optional[Any]], Optional[Any]],
+            stages: int,
+            source: str
+    ) -> None:
+        self._run = run
+        self.stages = stages
+        self.source = source
+
+    def __call__(self, fa: Optional[Any]) -> Optional[Any]:
+        return self._run(fa)
+
+    def __repr__(self) -> str:
+        return f'CompiledOptional(stages={self.stages})'
+
+
+class OptionalPipeline:
+    """
+    Immutable description of a chain of :class:`Optional` steps compiled
+    into a single function with early exit, i.e. equivalent of nested
+    :func:`ftoolz.functoolz.opt.flatmap` and :func:`ftoolz.functoolz.opt.fmap`
+    calls without intermediate closures and frames.
+
+    >>> p = OptionalPipeline().map(str.strip).filter(bool) \\
+    ...     .flatmap(lambda s: int(s) if s.isdigit() else None).map(abs)
+    >>> p
+    OptionalPipeline(stages=4)
+
+    >>> f = p.compile()
+    >>> f(' 42 '), f('  '), f('x'), f(None)
+    (42, None, None, None)
+
+    Plain callables passed to the constructor are treated as flatmap stages
+    (Kleisli composition), nested pipelines are flattened.
+
+    >>> half = lambda x: x // 2 if x % 2 == 0 else None
+    >>> g = OptionalPipeline(half, half, OptionalPipeline().map(str)).compile()
+    >>> g(8), g(6), g(None)
+    ('2', None, None)
+    """
+
+    __slots__ = ('_stages',)
+
+    def __init__(
+            self,
+            *parts: Union['OptionalPipeline', OptionalStage, Callable]
+    ) -> None:
+        """
+        >>> OptionalPipeline()
+        OptionalPipeline(stages=0)
+        >>> OptionalPipeline(OptionalStage(OptionalStageKind.MAP, str), len)
+        OptionalPipeline(stages=2)
+        """
+        stages: List[OptionalStage] = []
+        for part in parts:
+            if isinstance(part, OptionalPipeline):
+                stages.extend(part.stages)
+            elif isinstance(part, OptionalStage):
+                stages.append(part)
+            else:
+                stages.append(
+                    OptionalStage(OptionalStageKind.FLATMAP, part)
+                )
+        self._stages: Tuple[OptionalStage, ...] = tuple(stages)
+
+    @property
+    def stages(self) -> Tuple[OptionalStage, ...]:
+        return self._stages
+
+    def filter(self, f: Callable[[Any], bool]) -> 'OptionalPipeline':
+        """
+        Append a stage that turns values not satisfying predicate `f` into
+        `None`.
+
+        >>> f = OptionalPipeline().filter(bool).compile()
+        >>> f(0), f(1)
+        (None, 1)
+        """
+        return OptionalPipeline(
+            self, OptionalStage(OptionalStageKind.FILTER, f)
+        )
+
+    def flatmap(self, f: Callable[[Any], Optional[Any]]) -> 'OptionalPipeline':
+        """
+        Append a stage that applies `Optional`-returning function `f`.
+
+        >>> f = OptionalPipeline().flatmap({1: 'a'}.get).compile()
+        >>> f(1), f(2)
+        ('a', None)
+        """
+        return OptionalPipeline(
+            self, OptionalStage(OptionalStageKind.FLATMAP, f)
+        )
+
+    def fmapN(
+            self,
+            f: Callable[..., Any],
+            *fx: Callable[[Any], Optional[Any]]
+    ) -> 'OptionalPipeline':
+        """
+        Append a stage computing `f(*(g(x) for g in fx))` from the current
+        value `x` if all arguments are present, i.e. equivalent of
+        :func:`ftoolz.functoolz.opt.fmapN` over values derived from `x`.
+        Arguments are computed lazily, the stage exits on the first missing
+        one.
+
+        >>> full_name = OptionalPipeline().fmapN(
+        ...     lambda first, last: f'{first} {last}',
+        ...     lambda r: r.get('first'),
+        ...     lambda r: r.get('last'),
+        ... ).compile()
+        >>> full_name({'first': 'Jane', 'last': 'Doe'})
+        'Jane Doe'
+        >>> full_name({'first': 'Jane'})
+        """
+        return OptionalPipeline(
+            self, OptionalStage(OptionalStageKind.FMAPN, f, tuple(fx))
+        )
+
+    def map(self, f: Callable[[Any], Any]) -> 'OptionalPipeline':
+        """
+        Append a stage that applies `f` to present value, i.e. equivalent of
+        :func:`ftoolz.functoolz.opt.fmap`. Following stages are skipped if
+        `f` returns `None`.
+
+        >>> OptionalPipeline().map(str).compile()(1)
+        '1'
+        >>> OptionalPipeline().map({'a': 1}.get).map(str).compile()('b')
+        """
+        return OptionalPipeline(
+            self, OptionalStage(OptionalStageKind.MAP, f)
+        )
+
+    def compile(self) -> CompiledOptional:
+        """
+        Compile this pipeline into a single function. Empty pipeline compiles
+        to an identity.
+
+        >>> f = OptionalPipeline().compile()
+        >>> f(1), f(None), f
+        (1, None, CompiledOptional(stages=0))
+        """
+        run, source = _compile(list(self._stages))
+        return CompiledOptional(run, len(self._stages), source)
+
+    def __len__(self) -> int:
+        return len(self._stages)
+
+    def __repr__(self) -> str:
+        return f'OptionalPipeline(stages={len(self._stages)})'
+
+
+def _compile(
+        stages: List[OptionalStage]
+) -> Tuple[Callable[[Optional[Any]], Optional[Any]], str]:
+    """
+    Generate source of a single function running all the given stages. Each
+    stage but filter stores its result into `_x` followed by a `None` check
+    that returns early (the check is skipped for the last stage).
+    """
+    names: List[str] = []
+    values: List[Callable[..., Any]] = []
+
+    def bind(f: Callable[..., Any], name: str) -> str:
+        names.append(name)
+        values.append(f)
+        return name
+
+    body = ['        if _x is None:', '            return None']
+    result = '_x'
+    for i, stage in enumerate(stages):
+        name = bind(stage.f, f'_f{i}')
+        if stage.kind is OptionalStageKind.FILTER:
+            body.append(f'        if not {name}(_x):')
+            body.append('            return None')
+            continue
+        if stage.kind is OptionalStageKind.FMAPN:
+            args = []
+            for j, g in enumerate(stage.args):
+                arg = f'_x{i}_{j}'
+                body.append(f'        {arg} = {bind(g, f"_g{i}_{j}")}(_x)')
+                body.append(f'        if {arg} is None:')
+                body.append('            return None')
+                args.append(arg)
+            call = f'{name}({", ".join(args)})'
+        else:
+            call = f'{name}(_x)'
+        if i == len(stages) - 1:
+            result = call
+            break
+        body.append(f'        _x = {call}')
+        body.append('        if _x is None:')
+        body.append('            return None')
+    body.append(f'        return {result}')
+
+    source = '\n'.join([
+        f'def _make({", ".join(names)}):',
+        '    def compiled(_x):',
+        *body,
+        '    return compiled',
+    ])
+    namespace: Dict[str, Any] = {}
+    exec(source, namespace)  # pylint: disable=exec-used
+    return namespace['_make'](*values), source
@@ -0,0 +1,238 @@
+import math
+import os
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, \
+    ProcessPoolExecutor, ThreadPoolExecutor, wait
+from functools import partial
+from itertools import islice
+from typing import Any, Callable, Deque, Generator, Iterable, Iterator, List, \
+    Optional, Set, Sized, Tuple, Union
+
+from ftoolz.functoolz import A, A_in, B_out
+
+PoolSpec = Union[str, Executor]
+
+_EXECUTORS = ('thread', 'process')
+
+# Chunk size used when the input size is unknown (e.g. unbounded streams).
+_STREAM_CHUNKSIZE = 16
+
+
+def flatmap(
+        f: Callable[[A_in], Iterable[B_out]],
+        fa: Iterable[A_in],
+        executor: PoolSpec = 'thread',
+        workers: Optional[int] = None,
+        chunksize: Optional[int] = None,
+        ordered: bool = True,
+        window: Optional[int] = None
+) -> Generator[B_out, None, None]:
+    """
+    Parallel :func:`ftoolz.functoolz.iter.flatmap`, see :func:`fmap` for
+    the meaning of parameters.
+
+    >>> list(flatmap(range, [1, 2, 3], workers=2))
+    [0, 0, 1, 0, 1, 2]
+    """
+    return _run(partial(_flatmap_chunk, f), fa, executor, workers, chunksize,
+                ordered, window)
+
+
+def fmap(
+        f: Callable[[A_in], B_out],
+        fa: Iterable[A_in],
+        executor: PoolSpec = 'thread',
+        workers: Optional[int] = None,
+        chunksize: Optional[int] = None,
+        ordered: bool = True,
+        window: Optional[int] = None
+) -> Generator[B_out, None, None]:
+    """
+    Parallel :func:`ftoolz.functoolz.iter.fmap` running `f` on a pool of
+    `workers` threads or processes. Given `executor` is either `'thread'`,
+    `'process'` or an existing :class:`Executor` (which is then reused and
+    not shut down).
+
+    >>> list(fmap(abs, [-1, 2, -3], workers=2))
+    [1, 2, 3]
+
+    Items are sent to workers in chunks of `chunksize` items to amortize
+    scheduling (and for processes pickling) overhead. By default the size is
+    derived from the length of sized inputs (about 4 chunks per worker) and
+    is fixed otherwise.
+
+    >>> list(fmap(str, range(10), workers=3, chunksize=4))
+    ['0', '1', '2', '3', '4', '5', '6', '7', '8', '9']
+
+    Results are yielded lazily either in the order of `fa` or, if not
+    `ordered`, chunk by chunk as they are completed. At most `window` chunks
+    (2 per worker by default) are in flight at once, so unbounded iterables
+    are consumed as a stream with bounded memory.
+
+    >>> from itertools import count
+    >>> it = fmap(lambda x: x * x, count(), workers=2, chunksize=1)
+    >>> [next(it) for _ in range(3)]
+    [0, 1, 4]
+
+    Pool created for given `executor` name is shut down when the result is
+    exhausted or closed.
+
+    >>> it.close()
+
+    **Warn**: Process pools require `f` and items to be picklable, i.e. `f`
+    must be defined at module level (no lambdas).
+    """
+    return _run(partial(_map_chunk, f), fa, executor, workers, chunksize,
+                ordered, window)
+
+
+def fproduct(
+        f: Callable[[A], B_out],
+        fa: Iterable[A],
+        executor: PoolSpec = 'thread',
+        workers: Optional[int] = None,
+        chunksize: Optional[int] = None,
+        ordered: bool = True,
+        window: Optional[int] = None
+) -> Generator[Tuple[A, B_out], None, None]:
+    """
+    Parallel :func:`ftoolz.functoolz.iter.fproduct`, see :func:`fmap` for
+    the meaning of parameters.
+
+    >>> list(fproduct(str, [1, 2], workers=2))
+    [(1, '1'), (2, '2')]
+    """
+    return _run(partial(_fproduct_chunk, f), fa, executor, workers,
+                chunksize, ordered, window)
+
+
+def zip_map(
+        f: Callable[..., B_out],
+        *fx: Iterable[Any],
+        executor: PoolSpec = 'thread',
+        workers: Optional[int] = None,
+        chunksize: Optional[int] = None,
+        ordered: bool = True,
+        window: Optional[int] = None
+) -> Generator[B_out, None, None]:
+    """
+    Parallel :func:`ftoolz.functoolz.iter.zip_map`, see :func:`fmap` for
+    the meaning of parameters.
+
+    >>> list(zip_map(lambda a, b: b * a, [1, 2, 3], 'ab', workers=2))
+    ['a', 'bb']
+    """
+    n: Optional[int] = None
+    if fx and all(isinstance(x, Sized) for x in fx):
+        n = min(len(x) for x in fx)  # type: ignore
+    return _run(partial(_starmap_chunk, f), zip(*fx), executor, workers,
+                chunksize, ordered, window, n)
+
+
+def _map_chunk(f: Callable[[Any], Any], chunk: List[Any]) -> List[Any]:
+    return [f(a) for a in chunk]
+
+
+def _flatmap_chunk(f: Callable[[Any], Any], chunk: List[Any]) -> List[Any]:
+    return [b for a in chunk for b in f(a)]
+
+
+def _fproduct_chunk(f: Callable[[Any], Any], chunk: List[Any]) -> List[Any]:
+    return [(a, f(a)) for a in chunk]
+
+
+def _starmap_chunk(f: Callable[..., Any], chunk: List[Any]) -> List[Any]:
+    return [f(*args) for args in chunk]
+
+
+def _run(
+        task: Callable[[List[Any]], List[Any]],
+        fa: Iterable[Any],
+        executor: PoolSpec,
+        workers: Optional[int],
+        chunksize: Optional[int],
+        ordered: bool,
+        window: Optional[int],
+        n: Optional[int] = None
+) -> Generator[Any, None, None]:
+    # Validate eagerly, the work itself starts on first `next`.
+    if isinstance(executor, str) and executor not in _EXECUTORS:
+        raise ValueError(f'Unknown executor {executor!r}.')
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError('workers must be positive integer')
+    if n is None and isinstance(fa, Sized):
+        n = len(fa)
+    if chunksize is None:
+        chunksize = _STREAM_CHUNKSIZE if n is None else \
+            max(1, math.ceil(n / (workers * 4)))
+    if chunksize < 1:
+        raise ValueError('chunksize must be positive integer')
+    if window is None:
+        window = 2 * workers
+    if window < 1:
+        raise ValueError('window must be positive integer')
+
+    it = iter(fa)
+    chunks = iter(lambda: list(islice(it, chunksize)), [])
+    stream = _ordered if ordered else _unordered
+    return _pooled(executor, workers, lambda pool: stream(
+        pool, task, chunks, window
+    ))
+
+
+def _pooled(
+        executor: PoolSpec,
+        workers: int,
+        run: Callable[[Executor], Iterator[Any]]
+) -> Generator[Any, None, None]:
+    if not isinstance(executor, str):
+        yield from run(executor)
+        return
+    pool: Executor = ThreadPoolExecutor(workers) if executor == 'thread' \
+        else ProcessPoolExecutor(workers)
+    with pool:
+        yield from run(pool)
+
+
+def _ordered(
+        pool: Executor,
+        task: Callable[[List[Any]], List[Any]],
+        chunks: Iterator[List[Any]],
+        window: int
+) -> Generator[Any, None, None]:
+    running: Deque['Future[List[Any]]'] = deque()
+    try:
+        for chunk in chunks:
+            running.append(pool.submit(task, chunk))
+            if len(running) >= window:
+                yield from running.popleft().result()
+        while running:
+            yield from running.popleft().result()
+    finally:
+        for future in running:
+            future.cancel()
+
+
+def _unordered(
+        pool: Executor,
+        task: Callable[[List[Any]], List[Any]],
+        chunks: Iterator[List[Any]],
+        window: int
+) -> Generator[Any, None, None]:
+    running: Set['Future[List[Any]]'] = set()
+    try:
+        for chunk in chunks:
+            running.add(pool.submit(task, chunk))
+            if len(running) >= window:
+                done, running = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from future.result()
+        while running:
+            done, running = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield from future.result()
+    finally:
+        for future in running:
+            future.cancel()
@@ -0,0 +1,240 @@
+from enum import Enum
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Tuple, \
+    Union
+
+
+class StageKind(Enum):
+    MAP = 'map'
+    FILTER = 'filter'
+    FLATMAP = 'flatmap'
+    APPLY = 'apply'
+
+
+class Stage(NamedTuple):
+    """
+    Single step of a :class:`Pipeline`. Stages of kind `APPLY` transform the
+    whole iterable and thus cannot be fused with their neighbours.
+    """
+    kind: StageKind
+    f: Callable[..., Any]
+
+
+class CompiledPipeline:
+    """
+    Pipeline compiled into a function from :class:`Iterable` to
+    :class:`Iterable`. Runs of map/filter/flatmap stages are fused into
+    a single generated loop each.
+    """
+
+    __slots__ = ('_run', 'stages_before', 'stages_after', 'source')
+
+    def __init__(
+            self,
+            run: Callable[[Iterable[Any]], Iterable[Any]],
+            stages_before: int,
+            stages_after: int,
+            source: str
+    ) -> None:
+        self._run = run
+        self.stages_before = stages_before
+        self.stages_after = stages_after
+        self.source = source
+
+    def __call__(self, it: Iterable[Any]) -> Iterable[Any]:
+        return self._run(it)
+
+    def __repr__(self) -> str:
+        return f'CompiledPipeline(stages_before={self.stages_before}, ' \
+               f'stages_after={self.stages_after})'
+
+
+class Pipeline:
+    """
+    Immutable description of a lazy transformation of an :class:`Iterable`
+    that is compiled into a single fused loop.
+
+    >>> p = Pipeline().map(lambda x: x + 1).filter(lambda x: x % 2 == 0) \\
+    ...     .flatmap(lambda x: (x, -x)).map(str)
+    >>> p
+    Pipeline(stages=4)
+
+    >>> f = p.compile()
+    >>> list(f(range(5)))
+    ['2', '-2', '4', '-4']
+
+    Compiled pipeline reports how many stages (i.e. nested generators) the
+    fusion saved.
+
+    >>> f
+    CompiledPipeline(stages_before=4, stages_after=1)
+
+    Nested pipelines are flattened. Stages transforming the whole iterable
+    (`apply`) split the pipeline into separately fused segments.
+
+    >>> q = Pipeline(p, Pipeline().apply(sorted), Pipeline().map(int))
+    >>> g = q.compile()
+    >>> list(g(range(5))), g
+    ([-2, -4, 2, 4], CompiledPipeline(stages_before=6, stages_after=3))
+
+    Plain callables passed to the constructor are treated as map stages.
+
+    >>> list(Pipeline(abs, str).compile()([-1, 2]))
+    ['1', '2']
+    """
+
+    __slots__ = ('_stages',)
+
+    def __init__(self, *parts: Union['Pipeline', Stage, Callable]) -> None:
+        """
+        >>> Pipeline()
+        Pipeline(stages=0)
+        >>> Pipeline(Stage(StageKind.FILTER, bool), str)
+        Pipeline(stages=2)
+        """
+        stages: List[Stage] = []
+        for part in parts:
+            if isinstance(part, Pipeline):
+                stages.extend(part.stages)
+            elif isinstance(part, Stage):
+                stages.append(part)
+            else:
+                stages.append(Stage(StageKind.MAP, part))
+        self._stages: Tuple[Stage, ...] = tuple(stages)
+
+    @property
+    def stages(self) -> Tuple[Stage, ...]:
+        return self._stages
+
+    def apply(self, f: Callable[[Iterable[Any]], Iterable[Any]]) -> 'Pipeline':
+        """
+        Append a transformation of the whole iterable.
+
+        >>> list(Pipeline().apply(reversed).compile()([1, 2, 3]))
+        [3, 2, 1]
+        """
+        return Pipeline(self, Stage(StageKind.APPLY, f))
+
+    def filter(self, f: Callable[[Any], bool]) -> 'Pipeline':
+        """
+        Append a stage that keeps only items satisfying predicate `f`.
+
+        >>> list(Pipeline().filter(bool).compile()([0, 1, 2]))
+        [1, 2]
+        """
+        return Pipeline(self, Stage(StageKind.FILTER, f))
+
+    def flatmap(self, f: Callable[[Any], Iterable[Any]]) -> 'Pipeline':
+        """
+        Append a stage that replaces each item by items of `f(item)`.
+
+        >>> list(Pipeline().flatmap(range).compile()([1, 2]))
+        [0, 0, 1]
+        """
+        return Pipeline(self, Stage(StageKind.FLATMAP, f))
+
+    def map(self, f: Callable[[Any], Any]) -> 'Pipeline':
+        """
+        Append a stage that applies `f` to each item.
+
+        >>> list(Pipeline().map(str).compile()([1, 2]))
+        ['1', '2']
+        """
+        return Pipeline(self, Stage(StageKind.MAP, f))
+
+    def compile(self) -> CompiledPipeline:
+        """
+        Compile this pipeline into a single function. Empty pipeline compiles
+        to an identity.
+
+        >>> f = Pipeline().compile()
+        >>> list(f([1, 2])), f.stages_after
+        ([1, 2], 0)
+        """
+        segments: List[Callable[[Iterable[Any]], Iterable[Any]]] = []
+        sources: List[str] = []
+        run: List[Stage] = []
+
+        for stage in self._stages + (Stage(StageKind.APPLY, _identity),):
+            if stage.kind is not StageKind.APPLY:
+                run.append(stage)
+                continue
+            if run:
+                fused, source = _fuse(run)
+                segments.append(fused)
+                sources.append(source)
+                run = []
+            if stage.f is not _identity:
+                segments.append(stage.f)
+
+        return CompiledPipeline(
+            _sequential(segments),
+            stages_before=len(self._stages),
+            stages_after=len(segments),
+            source='\n'.join(sources),
+        )
+
+    def __len__(self) -> int:
+        return len(self._stages)
+
+    def __repr__(self) -> str:
+        return f'Pipeline(stages={len(self._stages)})'
+
+
+def _identity(it: Iterable[Any]) -> Iterable[Any]:
+    return it
+
+
+def _sequential(
+        segments: List[Callable[[Iterable[Any]], Iterable[Any]]]
+) -> Callable[[Iterable[Any]], Iterable[Any]]:
+    if not segments:
+        return _identity
+    if len(segments) == 1:
+        return segments[0]
+
+    def run(it: Iterable[Any]) -> Iterable[Any]:
+        for segment in segments:
+            it = segment(it)
+        return it
+
+    return run
+
+
+def _fuse(
+        stages: List[Stage]
+) -> Tuple[Callable[[Iterable[Any]], Iterable[Any]], str]:
+    """
+    Generate source of a single generator function running all the given
+    map/filter/flatmap stages. Consecutive maps are composed into a single
+    expression, flatmaps open nested loops and filters `continue` the
+    innermost one.
+    """
+    names = [f'_f{i}' for i in range(len(stages))]
+    body = ['        for _x in it:']
+    depth = 3
+    expr = '_x'
+    for i, (stage, name) in enumerate(zip(stages, names)):
+        pad = '    ' * depth
+        if stage.kind is StageKind.MAP:
+            expr = f'{name}({expr})'
+        elif stage.kind is StageKind.FILTER:
+            if expr.endswith(')'):
+                body.append(f'{pad}_x{i} = {expr}')
+                expr = f'_x{i}'
+            body.append(f'{pad}if not {name}({expr}):')
+            body.append(f'{pad}    continue')
+        else:
+            body.append(f'{pad}for _x{i} in {name}({expr}):')
+            expr = f'_x{i}'
+            depth += 1
+    body.append(f'{"    " * depth}yield {expr}')
+
+    source = '\n'.join([
+        f'def _make({", ".join(names)}):',
+        '    def fused(it):',
+        *body,
+        '    return fused',
+    ])
+    namespace: Dict[str, Any] = {}
+    exec(source, namespace)  # pylint: disable=exec-used
+    return namespace['_make'](*(s.f for s in stages)), source
@@ -1,10 +1,17 @@
+import sys
 from itertools import starmap
-from typing import Any, Callable, Tuple
+from typing import Any, Callable, Tuple, Union
 
 from cytoolz.itertoolz import identity, mapcat
 
-from ftoolz.functoolz import A, A_in, A_out, B, B_in, B_out, C_out
-from ftoolz.typing import Seq, seq
+from ftoolz.adt.seqview import CartesianView, ConcatView, GeneratedView
+from ftoolz.functoolz import A, A_in, A_out, B, B_in, B_out, C_out, \
+    is_vectorizable
+from ftoolz.typing import Seq, is_ndarray, seq
+
+
+def _is_vector(a: Any) -> bool:
+    return is_ndarray(a) and a.ndim == 1
 
 
 def apply(ff: Seq[Callable[[A_in], B_out]], fa: Seq[A_in]) -> Seq[B_out]:
@@ -36,6 +43,27 @@ def apply(ff: Seq[Callable[[A_in], B_out]], fa: Seq[A_in]) -> Seq[B_out]:
     return flatmap(lambda f: fmap(f, fa), ff)
 
 
+def apply_view(
+        ff: Seq[Callable[[A_in], B_out]],
+        fa: Seq[A_in]
+) -> Seq[B_out]:
+    """
+    Lazy :func:`apply` returning a constant-memory view that computes each
+    item on access.
+
+    >>> view = apply_view((str, lambda x: x + 1), (1, 2))
+    >>> view[1], view[-1], len(view)
+    ('2', 3, 4)
+    >>> view == apply((str, lambda x: x + 1), (1, 2))
+    True
+    """
+    return CartesianView(_call, ff, fa)
+
+
+def _call(f: Callable[[A_in], B_out], a: A_in) -> B_out:
+    return f(a)
+
+
 def flatmap(f: Callable[[A_in], Seq[B_out]], fa: Seq[A_in]) -> Seq[B_out]:
     """
     Feed value in context `(Seq[A])` into a function that takes a normal
@@ -52,6 +80,21 @@ def flatmap(f: Callable[[A_in], Seq[B_out]], fa: Seq[A_in]) -> Seq[B_out]:
     return seq(mapcat(f, fa))
 
 
+def flatmap_view(
+        f: Callable[[A_in], Seq[B_out]],
+        fa: Seq[A_in]
+) -> Seq[B_out]:
+    """
+    Lazy :func:`flatmap` returning a view over sequences returned by `f`
+    instead of copying their items into a new `tuple`.
+
+    >>> view = flatmap_view(lambda x: (x, -x), (1, 2, 3))
+    >>> view[3], len(view), view == flatmap(lambda x: (x, -x), (1, 2, 3))
+    (-2, 6, True)
+    """
+    return ConcatView(f(a) for a in fa)
+
+
 def flatten(ffa: Seq[Seq[A]]) -> Seq[A]:
     """
     Flatten a nested `Seq` of `Seq` structure into a single-layer
@@ -65,6 +108,19 @@ def flatten(ffa: Seq[Seq[A]]) -> Seq[A]:
     return flatmap(identity, ffa)
 
 
+def flatten_view(ffa: Seq[Seq[A]]) -> Seq[A]:
+    """
+    Lazy :func:`flatten` returning a view over given sequences, items are not
+    copied unless the view is materialized.
+
+    >>> chunks = [tuple(range(i, i + 1000)) for i in range(0, 10_000, 1000)]
+    >>> view = flatten_view(chunks)
+    >>> len(view), view[4321], tuple(view[998:1002])
+    (10000, 4321, (998, 999, 1000, 1001))
+    """
+    return ConcatView(ffa)
+
+
 def fmap(f: Callable[[A_in], B_out], fa: Seq[A_in]) -> Seq[B_out]:
     """
     Functor map for :class:`Seq`.
@@ -76,7 +132,13 @@ def fmap(f: Callable[[A_in], B_out], fa: Seq[A_in]) -> Seq[B_out]:
     ()
     >>> fmap(f, (1, 2, 3))
     ('1', '2', '3')
+
+    NumPy array mapped by a vectorizable function (a `ufunc` or function
+    marked by :func:`ftoolz.functoolz.vectorizable`) is mapped at once and
+    the result is an array.
     """
+    if is_ndarray(fa) and is_vectorizable(f):
+        return f(fa)  # type: ignore
     return tuple(f(a) for a in fa)
 
 
@@ -104,12 +166,38 @@ def fmap2(
 
     >>> fmap2(f, (1, 2, 3), ('a', 'b'))
     ('a', 'b', 'aa', 'bb', 'aaa', 'bbb')
+
+    Two one-dimensional NumPy arrays combined by a vectorizable function are
+    broadcast against each other, the result is a flat array in the same
+    order.
     """
+    if _is_vector(fa) and _is_vector(fb) and is_vectorizable(f):
+        return f(fa[:, None], fb[None, :]).ravel()  # type: ignore
 
     def ff(a: A_in) -> Seq[C_out]:
         return fmap(lambda b: f(a, b), fb)
 
-    return seq() if not fb else flatmap(ff, fa)
+    return seq() if len(fb) == 0 else flatmap(ff, fa)
+
+
+def fmap2_view(
+        f: Callable[[A_in, B_in], C_out],
+        fa: Seq[A_in],
+        fb: Seq[B_in]
+) -> Seq[C_out]:
+    """
+    Lazy :func:`fmap2` returning a constant-memory view that computes each
+    item on access, e.g. to slice a large cartesian product.
+
+    >>> view = fmap2_view(lambda a, b: a * b, range(10_000), range(10_000))
+    >>> len(view), view[-1]
+    (100000000, 99980001)
+    >>> tuple(view[10_001:10_004])
+    (1, 2, 3)
+    >>> fmap2_view(lambda a, b: b * a, (1, 2), ('a', 'b'))[::-1]
+    CartesianView(len=4)
+    """
+    return CartesianView(f, fa, fb)
 
 
 def fproduct(f: Callable[[A], B_out], fa: Seq[A]) -> Seq[Tuple[A, B_out]]:
@@ -157,18 +245,46 @@ def generate(
 
     >>> generate(f, -1)
     ()
+
+    Result is always a `tuple`. To compute a vectorizable `f` on whole NumPy
+    arrays, map it over an array instead, e.g. `fmap(f, np.arange(n))`.
     """
+    return seq(f(i) for i in _series(*args, **kwargs))
+
+
+def generate_view(
+        f: Callable[[int], A_out],
+        *args: Any,
+        memo: Union[bool, int] = False,
+        **kwargs: Any
+) -> Seq[A_out]:
+    """
+    Lazy :func:`generate` returning a view that computes `f(i)` only when
+    the item is accessed, optionally memoized (see
+    :class:`ftoolz.adt.seqview.GeneratedView`).
+
+    >>> view = generate_view(lambda i: float(i) ** 2, 4, stop=10**9, step=2)
+    >>> len(view), view[1], tuple(view[:3])
+    (499999998, 36.0, (16.0, 36.0, 64.0))
+
+    Slicing maps back to range arithmetic.
 
+    >>> view[10:20:5]
+    GeneratedView(series=range(24, 44, 10))
+    >>> generate_view(str, 3, memo=True) == generate(str, 3)
+    True
+    """
+    return GeneratedView(f, _series(*args, **kwargs), memo)
+
+
+def _series(*args: Any, **kwargs: Any) -> range:
     if len(args) + len(kwargs) == 1:
         stop = args[0] if args else kwargs['stop']
-        series = range(stop)
-    else:
-        start = args[0] if args else kwargs['start']
-        stop = args[1] if len(args) > 1 else kwargs['stop']
-        step = args[2] if len(args) > 2 else kwargs.get('step', 1)
-        series = range(start, stop, step)
-
-    return seq(f(i) for i in series)
+        return range(stop)
+    start = args[0] if args else kwargs['start']
+    stop = args[1] if len(args) > 1 else kwargs['stop']
+    step = args[2] if len(args) > 2 else kwargs.get('step', 1)
+    return range(start, stop, step)
 
 
 def lift(f: Callable[[A_in], B_out]) -> Callable[[Seq[A_in]], Seq[B_out]]:
@@ -206,7 +322,17 @@ def product(fa: Seq[A], fb: Seq[B]) -> Seq[Tuple[A, B]]:
 
     >>> product((1, 2, 3), ('a', 'b'))
     ((1, 'a'), (1, 'b'), (2, 'a'), (2, 'b'), (3, 'a'), (3, 'b'))
+
+    Product of two one-dimensional NumPy arrays of the same dtype is
+    a two-column array of pairs. Arrays of different dtypes produce a `tuple`
+    of pairs, so that no values are cast.
     """
+    if _is_vector(fa) and _is_vector(fb) and \
+            fa.dtype == fb.dtype:  # type: ignore
+        np = sys.modules['numpy']
+        return np.column_stack((  # type: ignore
+            np.repeat(fa, len(fb)), np.tile(fb, len(fa))
+        ))
 
     # Because pylint does not allow `lambda a: fmap(lambda b: (a, b), fbs)`.
     def ff(a: A) -> Seq[Tuple[A, B]]:
@@ -215,6 +341,24 @@ def product(fa: Seq[A], fb: Seq[B]) -> Seq[Tuple[A, B]]:
     return flatmap(ff, fa)
 
 
+def product_view(fa: Seq[A], fb: Seq[B]) -> Seq[Tuple[A, B]]:
+    """
+    Lazy :func:`product` returning a constant-memory view that computes each
+    pair on access.
+
+    >>> view = product_view(range(10_000), 'ab')
+    >>> len(view), view[3], tuple(reversed(view))[:2]
+    (20000, (1, 'b'), ((9999, 'b'), (9999, 'a')))
+    >>> product_view((1, 2), 'ab') == product((1, 2), 'ab')
+    True
+    """
+    return CartesianView(_pair, fa, fb)
+
+
+def _pair(a: A, b: B) -> Tuple[A, B]:
+    return a, b
+
+
 def unit(a: A) -> Seq[A]:
     """
     Unit value for :class:`Seq`. Returns 1-tuple.
@@ -243,5 +387,11 @@ def zip_map(f: Callable[..., A_out], *fx: Seq[Any]) -> Seq[A_out]:
 
     >>> zip_map(f, (1, 2, 3, 4), ('a', 'b', 'c'))
     ('a', 'bb', 'ccc')
+
+    NumPy arrays zipped by a vectorizable function (see :func:`fmap`) are
+    truncated to the shortest one and mapped at once, the result is an array.
     """
+    if fx and all(is_ndarray(x) for x in fx) and is_vectorizable(f):
+        n = min(len(x) for x in fx)
+        return f(*(x[:n] for x in fx))  # type: ignore
     return seq(starmap(f, zip(*fx)))
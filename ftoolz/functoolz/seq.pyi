@@ -1,9 +1,53 @@
-from typing import Callable, overload
+from typing import Any, Callable, Tuple, Union, overload
 
-from ftoolz.functoolz import A_out
+from ftoolz.functoolz import A, A_in, A_out, B, B_in, B_out, C_out
 from ftoolz.typing import Seq
 
 
+def apply(ff: Seq[Callable[[A_in], B_out]], fa: Seq[A_in]) -> Seq[B_out]: ...
+
+
+def apply_view(
+        ff: Seq[Callable[[A_in], B_out]],
+        fa: Seq[A_in]
+) -> Seq[B_out]: ...
+
+
+def flatmap(f: Callable[[A_in], Seq[B_out]], fa: Seq[A_in]) -> Seq[B_out]: ...
+
+
+def flatmap_view(
+        f: Callable[[A_in], Seq[B_out]],
+        fa: Seq[A_in]
+) -> Seq[B_out]: ...
+
+
+def flatten(ffa: Seq[Seq[A]]) -> Seq[A]: ...
+
+
+def flatten_view(ffa: Seq[Seq[A]]) -> Seq[A]: ...
+
+
+def fmap(f: Callable[[A_in], B_out], fa: Seq[A_in]) -> Seq[B_out]: ...
+
+
+def fmap2(
+        f: Callable[[A_in, B_in], C_out],
+        fa: Seq[A_in],
+        fb: Seq[B_in]
+) -> Seq[C_out]: ...
+
+
+def fmap2_view(
+        f: Callable[[A_in, B_in], C_out],
+        fa: Seq[A_in],
+        fb: Seq[B_in]
+) -> Seq[C_out]: ...
+
+
+def fproduct(f: Callable[[A], B_out], fa: Seq[A]) -> Seq[Tuple[A, B_out]]: ...
+
+
 @overload
 def generate(
         f: Callable[[int], A_out],
@@ -18,3 +62,38 @@ def generate(
         stop: int,
         step: int = 1
 ) -> Seq[A_out]: ...
+
+
+@overload
+def generate_view(
+        f: Callable[[int], A_out],
+        stop: int,
+        *,
+        memo: Union[bool, int] = False
+) -> Seq[A_out]: ...
+
+
+@overload
+def generate_view(
+        f: Callable[[int], A_out],
+        start: int,
+        stop: int,
+        step: int = 1,
+        *,
+        memo: Union[bool, int] = False
+) -> Seq[A_out]: ...
+
+
+def lift(f: Callable[[A_in], B_out]) -> Callable[[Seq[A_in]], Seq[B_out]]: ...
+
+
+def product(fa: Seq[A], fb: Seq[B]) -> Seq[Tuple[A, B]]: ...
+
+
+def product_view(fa: Seq[A], fb: Seq[B]) -> Seq[Tuple[A, B]]: ...
+
+
+def unit(a: A) -> Seq[A]: ...
+
+
+def zip_map(f: Callable[..., A_out], *fx: Seq[Any]) -> Seq[A_out]: ...
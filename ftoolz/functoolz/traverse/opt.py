@@ -1,11 +1,7 @@
-from typing import Callable, Iterable, Optional
-
-from cytoolz.itertoolz import cons, identity
+from typing import Callable, Iterable, List, Optional
 
 from ftoolz.functoolz import A, A_in, B
-from ftoolz.functoolz.opt import fmap, fmap2
-from ftoolz.itertoolz import fold_right
-from ftoolz.typing import Seq, seq
+from ftoolz.typing import Seq
 
 
 def sequence_iter(gfa: Iterable[Optional[A]]) -> Optional[Iterable[A]]:
@@ -35,7 +31,13 @@ def sequence_iter(gfa: Iterable[Optional[A]]) -> Optional[Iterable[A]]:
     ()
 
     """
-    return traverse_iter(identity, gfa)
+    result: List[A] = []
+    append = result.append
+    for a in gfa:
+        if a is None:
+            return None
+        append(a)
+    return result
 
 
 def sequence_seq(gfa: Seq[Optional[A]]) -> Optional[Seq[A]]:
@@ -53,8 +55,17 @@ def sequence_seq(gfa: Seq[Optional[A]]) -> Optional[Seq[A]]:
 
     >>> sequence_seq(tuple())
     ()
+
+    Given `tuple` is returned as is when it contains no `None`.
+
+    >>> gfa = (1, 2, 3)
+    >>> sequence_seq(gfa) is gfa
+    True
     """
-    return fmap(seq, traverse_iter(identity, gfa))
+    for a in gfa:
+        if a is None:
+            return None
+    return gfa if isinstance(gfa, tuple) else tuple(gfa)  # type: ignore
 
 
 def traverse_iter(
@@ -66,15 +77,31 @@ def traverse_iter(
     through the running of this function on all the values in `Iterable`,
     returning an `Iterable[B]` in a `Optional` context.
 
+    >>> def f(x: int) -> Optional[str]:
+    ...     return str(x) if x > 0 else None
+
+    >>> tuple(traverse_iter(f, iter([1, 2, 3])))
+    ('1', '2', '3')
+
+    Function `f` is applied in order of the input and the traversal stops on
+    the first `None`, i.e. neither `f` nor the rest of input are evaluated.
+
+    >>> fa = iter([1, 0, 2])
+    >>> traverse_iter(f, fa)
+    >>> next(fa)
+    2
+
     **Warn**: This operation is terminal in input iterable and thus not a pure
     function.
     """
-
-    def op(a: A_in, acc: Optional[Iterable[B]]) -> Optional[Iterable[B]]:
-        return fmap2(cons, f(a), acc)  # type: ignore
-
-    empty: Optional[Iterable[B]] = iter([])
-    return fold_right(op, fa, empty)
+    result: List[B] = []
+    append = result.append
+    for a in fa:
+        b = f(a)
+        if b is None:
+            return None
+        append(b)
+    return result
 
 
 def traverse_seq(
@@ -97,4 +124,5 @@ def traverse_seq(
     >>> traverse_seq(f, tuple())
     ()
     """
-    return fmap(seq, traverse_iter(f, fa))  # type: ignore
+    result = traverse_iter(f, fa)
+    return None if result is None else tuple(result)
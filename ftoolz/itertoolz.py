@@ -1,14 +1,22 @@
-from functools import reduce
+import errno
+from array import array
+from collections import deque
+from enum import Enum
+from functools import partial, reduce
 from itertools import islice
-from typing import Callable, Hashable, Iterable, List, Optional, Reversible, \
-    Tuple, TypeVar
+from typing import IO, Any, Callable, Dict, Hashable, Iterable, List, \
+    NamedTuple, Optional, Reversible, Tuple, TypeVar
 
-from cytoolz.functoolz import complement, compose
-from cytoolz.itertoolz import drop, identity, last as clast, peek, reduceby, \
-    unique
+from cytoolz.functoolz import compose
+from cytoolz.itertoolz import identity, last as clast, unique
 
-from ftoolz.adt.mutiter import MutIter
-from ftoolz.typing import Map, Seq
+from ftoolz.adt.keyindex import KeyIndex
+from ftoolz.adt.lookahead import Lookahead
+from ftoolz.adt.peekable import Peekable
+from ftoolz.adt.positionindex import PositionIndex
+from ftoolz.adt.seen import Seen
+from ftoolz.adt.split import SplitBranch
+from ftoolz.typing import Map, Seq, is_ndarray
 
 A = TypeVar('A')
 B = TypeVar('B')
@@ -18,6 +26,49 @@ K = TypeVar('K')
 
 _H = TypeVar('_H', bound=Hashable)
 
+# Per-type caches of ABC checks, so that hot paths can cheaply recognize
+# concrete sequences and route them to indexed implementations.
+_SEQUENCE_TYPES: Dict[type, bool] = {
+    t: True for t in (list, tuple, range, str, deque, array)
+}
+_REVERSIBLE_TYPES: Dict[type, bool] = dict(_SEQUENCE_TYPES)
+# Sequences sliced in C, deque does not support slicing at all.
+_SLICEABLE_TYPES = frozenset((tuple, range, str, array))
+
+
+def _is_sequence(xs: Iterable[Any]) -> bool:
+    t = type(xs)
+    r = _SEQUENCE_TYPES.get(t)
+    if r is None:
+        r = _SEQUENCE_TYPES[t] = isinstance(xs, Seq)
+    return r
+
+
+def _is_reversible(xs: Iterable[Any]) -> bool:
+    t = type(xs)
+    r = _REVERSIBLE_TYPES.get(t)
+    if r is None:
+        r = _REVERSIBLE_TYPES[t] = isinstance(xs, Reversible)
+    return r
+
+
+class Collision(Enum):
+    """
+    Strategy of resolving key collisions in :func:`associate_many`.
+    """
+    FIRST = 'first'
+    LAST = 'last'
+    GROUP = 'group'
+
+
+class Association(NamedTuple):
+    """
+    Specification of a single index built by :func:`associate_many`.
+    """
+    key: Callable[[Any], Any]
+    value: Callable[[Any], Any] = identity
+    collision: Collision = Collision.LAST
+
 
 def associate(key: Callable[[B], A], values: Iterable[B]) -> Map[A, B]:
     """
@@ -84,6 +135,152 @@ def associate_to(
     return {key(v): value(v) for v in values}
 
 
+def associate_many(
+        specs: Seq[Association],
+        values: Iterable[Any]
+) -> Tuple[Map[Any, Any], ...]:
+    """
+    Collect values into multiple :class:`Map`s in a single pass, one for each
+    given :class:`Association` spec.
+
+    >>> values = iter([('a', 1), ('b', 2), ('a', 3)])
+    >>> by_key, first, groups = associate_many([
+    ...     Association(key=lambda x: x[0]),
+    ...     Association(key=lambda x: x[0], value=lambda x: x[1],
+    ...                 collision=Collision.FIRST),
+    ...     Association(key=lambda x: x[1] % 2, value=lambda x: x[0],
+    ...                 collision=Collision.GROUP),
+    ... ], values)
+
+    Latter value is kept on key collision by default (same as `associate`).
+
+    >>> by_key
+    {'a': ('a', 3), 'b': ('b', 2)}
+
+    Alternatively, the first value can be kept or all the values can be
+    grouped into lists (in order of occurrence).
+
+    >>> first
+    {'a': 1, 'b': 2}
+    >>> groups
+    {1: ['a', 'a'], 0: ['b']}
+
+    This operation is terminal in values.
+
+    >>> next(values)
+    Traceback (most recent call last):
+    ...
+    StopIteration
+
+    >>> associate_many([], iter([1, 2]))
+    ()
+    """
+    indexes: Tuple[Dict[Any, Any], ...] = tuple({} for _ in specs)
+    plan = [
+        (spec.key, None if spec.value is identity else spec.value,
+         spec.collision, index)
+        for spec, index in zip(specs, indexes)
+    ]
+
+    for v in values:
+        for key, value, collision, index in plan:
+            k = key(v)
+            if collision is Collision.LAST:
+                index[k] = v if value is None else value(v)
+            elif collision is Collision.FIRST:
+                if k not in index:
+                    index[k] = v if value is None else value(v)
+            else:
+                group = index.get(k)
+                if group is None:
+                    group = index[k] = []
+                group.append(v if value is None else value(v))
+
+    return indexes
+
+
+def batched(
+        n: int,
+        it: Iterable[E],
+        reuse: bool = False,
+        typecode: Optional[str] = None
+) -> Iterable[Seq[E]]:
+    """
+    Lazily split given iterable into batches of size `n` in a single pass.
+    The last batch contains the remaining items and might be shorter.
+
+    >>> list(batched(2, iter([1, 2, 3, 4, 5])))
+    [[1, 2], [3, 4], [5]]
+    >>> list(batched(2, iter([])))
+    []
+
+    Numeric items can be collected into typed arrays given `typecode`.
+
+    >>> list(batched(2, range(3), typecode='q'))
+    [array('q', [0, 1]), array('q', [2])]
+
+    In the `reuse` mode the very same (list or array) buffer is allocated
+    once, refilled and yielded for every batch. Consumers must process (or
+    copy) each batch before requesting the next one. The mode saves
+    allocations, not time, filling the buffer item by item is slower than
+    building a new batch.
+
+    >>> batches = [tuple(b) for b in batched(2, range(5), reuse=True)]
+    >>> batches
+    [(0, 1), (2, 3), (4,)]
+
+    >>> it = batched(3, range(4), reuse=True)
+    >>> b1 = next(it)
+    >>> b1
+    [0, 1, 2]
+    >>> b2 = next(it)
+    >>> b1 is b2, b1
+    (True, [3])
+
+    >>> list(batched(0, [1]))
+    Traceback (most recent call last):
+    ...
+    ValueError: n must be positive integer
+    """
+    if n < 1:
+        raise ValueError('n must be positive integer')
+    return _batched(n, iter(it), reuse, typecode)
+
+
+def _batched(
+        n: int,
+        source: Iterable[E],
+        reuse: bool,
+        typecode: Optional[str]
+) -> Iterable[Seq[E]]:
+    make: Callable[[Iterable[E]], Any] = \
+        list if typecode is None else partial(array, typecode)
+
+    if not reuse:
+        while True:
+            batch = make(islice(source, n))
+            if not batch:
+                return
+            yield batch
+
+    # Buffer is allocated once and filled by index, it is truncated only for
+    # the last partial batch.
+    buffer: Any = [None] * n if typecode is None else \
+        array(typecode, bytes(array(typecode).itemsize * n))
+    indices = range(n)
+    while True:
+        i = -1
+        # Indices go first, so no item is pulled beyond the batch.
+        for i, e in zip(indices, source):
+            buffer[i] = e
+        if i < n - 1:
+            if i >= 0:
+                del buffer[i + 1:]
+                yield buffer
+            return
+        yield buffer
+
+
 def collect(items: Iterable[E]) -> Seq[E]:
     """
     Collect given `items` into a sequence (list). If the input iterable already
@@ -105,7 +302,7 @@ def collect(items: Iterable[E]) -> Seq[E]:
     >>> out_seq is in_seq
     True
     """
-    return items if isinstance(items, Seq) else list(items)
+    return items if _is_sequence(items) else list(items)  # type: ignore
 
 
 def empty(it: Iterable[E]) -> Tuple[bool, Iterable[E]]:
@@ -123,12 +320,26 @@ def empty(it: Iterable[E]) -> Tuple[bool, Iterable[E]]:
     >>> is_empty, it_empty = empty(iter([]))
     >>> is_empty, list(it_empty)
     (True, [])
+
+    Sequences are not modified and returned as they are.
+
+    >>> xs = [1, 2]
+    >>> is_empty, ys = empty(xs)
+    >>> is_empty, ys is xs
+    (False, True)
+
+    Other iterables are returned as :class:`ftoolz.adt.peekable.Peekable`,
+    which is reused when checked repeatedly.
+
+    >>> is_empty, it_new = empty(iter([1, 2]))
+    >>> _, it_again = empty(it_new)
+    >>> it_again is it_new
+    True
     """
-    try:
-        _, it = peek(it)
-        return False, it
-    except StopIteration:
-        return True, iter([])
+    if _is_sequence(it):
+        return not it, it
+    items = Peekable.of(it)
+    return not items, items
 
 
 def enumerate_with_final(it: Iterable[E]) -> Iterable[Tuple[E, bool, int]]:
@@ -145,9 +356,9 @@ def enumerate_with_final(it: Iterable[E]) -> Iterable[Tuple[E, bool, int]]:
     >>> list(enumerate_with_final(iter([])))
     []
     """
-    it_final = iter_with_final(it)
-    for i, (item, final) in enumerate(it_final):
-        yield item, final, i
+    items = Lookahead(it)
+    for item in items:
+        yield item, items.is_last, items.index
 
 
 def filter_not_none(it: Iterable[Optional[E]]) -> Iterable[E]:
@@ -192,6 +403,82 @@ def find(pred: Callable[[E], bool], it: Iterable[E]) -> Optional[E]:
     return try_take_first(e for e in it if pred(e))
 
 
+def find_many(
+        preds: Seq[Callable[[E], bool]],
+        it: Iterable[E],
+        vectorized: bool = False
+) -> Seq[Optional[E]]:
+    """
+    Find first item satisfying each of given predicates in a single pass.
+
+    >>> even = lambda x: x % 2 == 0
+    >>> big = lambda x: x > 5
+    >>> find_many([even, big, lambda x: x < 0], iter([1, 5, 4, 7, 2]))
+    (4, 7, None)
+    >>> find_many([even, big], iter([]))
+    (None, None)
+
+    The iteration stops as soon as all predicates are satisfied.
+
+    >>> it = iter([1, 4, 7, 2])
+    >>> find_many([even, big], it)
+    (4, 7)
+    >>> next(it)
+    2
+
+    No predicates are trivially satisfied, so the input is not consumed.
+
+    >>> it = iter([1, 2])
+    >>> find_many([], it), next(it)
+    ((), 1)
+
+    Given `vectorized` flag and a NumPy array, predicates are applied to
+    the whole array at once and must return a boolean mask. Other inputs
+    are searched item by item. See :func:`find_vectorized`.
+    """
+    if not preds:
+        return ()
+    if vectorized and is_ndarray(it):
+        return tuple(find_vectorized(pred, it) for pred in preds)
+
+    found: List[Optional[E]] = [None] * len(preds)
+    pending = list(enumerate(preds))
+    for e in it:
+        done = [i for i, pred in pending if pred(e)]
+        if done:
+            for i in done:
+                found[i] = e
+            pending = [(i, pred) for i, pred in pending if i not in done]
+            if not pending:
+                break
+    return tuple(found)
+
+
+def find_vectorized(
+        pred: Callable[[Any], Any],
+        xs: Iterable[E]
+) -> Optional[E]:
+    """
+    Find first item of given one-dimensional NumPy array that satisfies
+    vectorized predicate `pred`, i.e. a function that maps the array to a
+    boolean mask. The search runs in NumPy without a Python loop.
+
+    Inputs that are not one-dimensional arrays are searched by :func:`find`
+    and thus `pred` has to work on individual items as well.
+
+    >>> find_vectorized(lambda x: x % 2 == 0, iter([1, 5, 4, 7, 2]))
+    4
+    >>> find_vectorized(lambda x: x > 10, [1, 2])
+    """
+    if not is_ndarray(xs) or xs.ndim != 1:  # type: ignore
+        return find(pred, xs)
+    if not len(xs):  # type: ignore
+        return None
+    mask = pred(xs)
+    idx = int(mask.argmax())
+    return xs[idx] if mask[idx] else None  # type: ignore
+
+
 def first(seq: Seq[E]) -> Optional[E]:
     """
     Return first element of a sequence or `None` if empty.
@@ -227,7 +514,7 @@ def fold_right(op: Callable[[A, B], B], xs: Iterable[A], z: B) -> B:
     >>> fold_right(op, iter([]), '42')
     '42'
     """
-    seq: Reversible[A] = xs if isinstance(xs, Reversible) else list(xs)
+    seq: Reversible[A] = xs if _is_reversible(xs) else list(xs)  # type: ignore
     return reduce(lambda right, left: op(left, right), reversed(seq), z)
 
 
@@ -249,9 +536,17 @@ def head_tail(it: Iterable[E]) -> Tuple[E, Iterable[E]]:
     Traceback (most recent call last):
     ...
     StopIteration
+
+    The tail is a :class:`ftoolz.adt.peekable.Peekable` (reused if given),
+    so repeated splitting does not nest iterators.
+
+    >>> head, tail = head_tail(iter([1, 2, 3]))
+    >>> head, tail = head_tail(tail)
+    >>> head, tail.peek(), list(tail)
+    (2, 3, [3])
     """
-    head, seq = peek(it)
-    tail = drop(1, seq)
+    tail = Peekable.of(it)
+    head = next(tail)
     return head, tail
 
 
@@ -286,19 +581,12 @@ def iter_with_final(it: Iterable[E]) -> Iterable[Tuple[E, bool]]:
 
     >>> list(iter_with_final(iter([])))
     []
-    """
 
-    is_empty, iterable = empty(it)
-    if is_empty:
-        return iter([])
-
-    it = iter(iterable)
-    buffer = [next(it)]
-    for i in it:
-        buffer.append(i)
-        item, buffer = head_tail_list(buffer)
-        yield item, False
-    yield buffer[0], True
+    For more general lookahead see :class:`ftoolz.adt.lookahead.Lookahead`.
+    """
+    items = Lookahead(it)
+    for item in items:
+        yield item, items.is_last
 
 
 def last(seq: Seq[E]) -> Optional[E]:
@@ -337,6 +625,9 @@ def make_str(
     Traceback (most recent call last):
     ...
     StopIteration
+
+    To serialize large iterables without building the whole string in memory
+    use :func:`write_str`.
     """
     tokens = map(key, it)
     return sep.join(tokens)
@@ -378,11 +669,11 @@ def order_by(
     Traceback (most recent call last):
     ...
     StopIteration
-    """
-    groups = reduceby(key, MutIter.add, it, init=MutIter)
 
-    for item in by:
-        yield next(groups.get(item, MutIter()), None)
+    To answer multiple queries over the same entities build
+    :class:`ftoolz.adt.keyindex.KeyIndex` once instead.
+    """
+    yield from KeyIndex(it, key).order_by(by, consume=True)
 
 
 def positions(it: Seq[_H]) -> Map[_H, Tuple[int, ...]]:
@@ -402,22 +693,11 @@ def positions(it: Seq[_H]) -> Map[_H, Tuple[int, ...]]:
     {('a', True): (0,), ('b', False): (1,), ('c', True): (2,)}
     >>> positions([('a', True), ('b', False), ('a', True)])
     {('a', True): (0, 2), ('b', False): (1,)}
-    """
 
-    def item(idx_item: Tuple[int, _H]) -> _H:
-        _, item_ = idx_item
-        return item_
-
-    def collect_idx(
-            acc: Tuple[int, ...], idx_item: Tuple[int, _H]
-    ) -> Tuple[int, ...]:
-        idx, _ = idx_item
-        return (*acc, idx)
-
-    def _empty() -> Tuple[int, ...]:
-        return tuple()
-
-    return reduceby(item, collect_idx, enumerate(it), init=_empty)
+    Positions are collected in linear time, for a compact array-backed index
+    use :class:`ftoolz.adt.positionindex.PositionIndex` directly.
+    """
+    return PositionIndex(it).to_map()
 
 
 def split_by(
@@ -449,9 +729,73 @@ def split_by(
     ...
     StopIteration
     """
-    items = collect(it)
-    rest = complement(pred)
-    return filter(pred, items), filter(rest, items)
+    pos: List[E] = []
+    neg: List[E] = []
+    add_pos, add_neg = pos.append, neg.append
+    for e in it:
+        if pred(e):
+            add_pos(e)
+        else:
+            add_neg(e)
+    return iter(pos), iter(neg)
+
+
+def split_by_lazy(
+        pred: Callable[[E], bool],
+        it: Iterable[E],
+        maxsize: Optional[int] = None,
+        spill: bool = False
+) -> Tuple[SplitBranch[E], SplitBranch[E]]:
+    """
+    Lazily split given items by a predicate into (positives, negatives).
+
+    >>> even = lambda x: x % 2 == 0
+    >>> pos, neg = split_by_lazy(even, iter([1, 5, 4, 7, 2]))
+    >>> list(pos), list(neg)
+    ([4, 2], [1, 5, 7])
+
+    Contrary to :func:`split_by` items are pulled from `it` only as branches
+    are consumed and predicate is evaluated exactly once per item. Items that
+    belong to the other branch are buffered until that branch consumes them.
+
+    >>> it = iter([1, 2, 3, 4])
+    >>> pos, neg = split_by_lazy(even, it)
+    >>> next(pos)
+    2
+    >>> next(it)
+    3
+    >>> list(neg), list(pos)
+    ([1], [4])
+
+    Number of buffered items of the lagging branch can be bounded by
+    `maxsize`. Exceeding the bound raises
+    :class:`ftoolz.adt.spill.BufferOverflowError` in the consumed branch.
+    No item is lost, so both branches can be consumed further.
+
+    >>> pos, neg = split_by_lazy(even, iter([1, 3, 5, 2, 4]), maxsize=2)
+    >>> list(pos)
+    Traceback (most recent call last):
+    ...
+    ftoolz.adt.spill.BufferOverflowError: Buffer size 2 exceeded.
+    >>> list(neg), list(pos)
+    ([1, 3, 5], [2, 4])
+
+    Closed branch is no longer buffered.
+
+    >>> pos, neg = split_by_lazy(even, iter([1, 2, 4, 6, 3]), maxsize=1)
+    >>> pos.close()
+    >>> list(neg)
+    [1, 3]
+
+    Alternatively, items over the bound can be spilled to a temporary file
+    (items have to be picklable in that case).
+
+    >>> it = iter([1, 3, 5, 2])
+    >>> pos, neg = split_by_lazy(even, it, maxsize=2, spill=True)
+    >>> list(pos), list(neg)
+    ([2], [1, 3, 5])
+    """
+    return SplitBranch.pair(pred, it, maxsize, spill)
 
 
 def take(n: int, it: Iterable[E]) -> Seq[E]:
@@ -469,13 +813,24 @@ def take(n: int, it: Iterable[E]) -> Seq[E]:
     >>> take(0, [1, 2, 3])
     []
 
+    Built-in sequences are sliced instead of iterated.
+
+    >>> take(2, range(5)), take(2, (1, 2, 3)), take(3, 'ab')
+    ([0, 1], [1, 2], ['a', 'b'])
+
     >>> take(-1, [])
     Traceback (most recent call last):
     ...
     ValueError: n must be non-negative integer
+
+    To split whole iterable into batches use :func:`batched`.
     """
     if n < 0:
         raise ValueError('n must be non-negative integer')
+    if type(it) is list:
+        return it[:n]
+    if type(it) in _SLICEABLE_TYPES:
+        return list(it[:n])  # type: ignore
     return list(islice(it, n))
 
 
@@ -525,6 +880,12 @@ def try_take_last(seq: Iterable[E]) -> Optional[E]:
     This operation is terminal.
 
     >>> try_take_last(it)
+
+    Sequences are indexed directly without iterating them.
+
+    >>> try_take_last(range(10 ** 9))
+    999999999
+    >>> try_take_last([])
     """
     try:
         return clast(seq)
@@ -532,6 +893,186 @@ def try_take_last(seq: Iterable[E]) -> Optional[E]:
         return None
 
 
+def unique_with(
+        seen: Seen,
+        it: Iterable[E],
+        key: Optional[Callable[[E], Hashable]] = None
+) -> Iterable[E]:
+    """
+    Lazily yield items of `it` which are reported unseen by given record.
+    Optionally, items are distinguished by their `key`.
+
+    >>> from ftoolz.adt.seen import BloomSeen, HashSeen, WindowSeen
+
+    >>> list(unique_with(HashSeen(), iter([1, 2, 1, 3, 2])))
+    [1, 2, 3]
+    >>> list(unique_with(HashSeen(), iter(['a', 'B', 'A']), key=str.lower))
+    ['a', 'B']
+
+    Choice of the record determines memory footprint of de-duplication,
+    e.g. window of recently seen items bounds the memory but lets through
+    duplicates that are too far apart.
+
+    >>> list(unique_with(WindowSeen(size=2), iter([1, 2, 1, 3, 2, 1])))
+    [1, 2, 3, 2, 1]
+
+    Given record can be inspected after (or during) the iteration.
+
+    >>> seen = BloomSeen(capacity=1000, error_rate=0.001)
+    >>> list(unique_with(seen, iter('abcabc')))
+    ['a', 'b', 'c']
+    >>> len(seen), seen.nbytes()
+    (3, 1798)
+    """
+    add = seen.add
+    if key is None:
+        for e in it:
+            if add(e):
+                yield e
+    else:
+        for e in it:
+            if add(key(e)):
+                yield e
+
+
+def write_str(
+        it: Iterable[E],
+        sink: IO[Any],
+        key: Callable[[E], str] = str,
+        sep: str = ',',
+        encoding: Optional[str] = None,
+        buffer_size: int = 1 << 16,
+        buffer: Optional[bytearray] = None
+) -> int:
+    """
+    Streaming variant of :func:`make_str` that writes serialized tokens into
+    a file-like `sink` in chunks of about `buffer_size` and returns number of
+    characters written.
+
+    >>> from io import BytesIO, StringIO
+
+    >>> sink = StringIO()
+    >>> write_str(iter([1, 2, 3]), sink, sep='; ')
+    7
+    >>> sink.getvalue()
+    '1; 2; 3'
+
+    Given `encoding` the tokens are encoded into a `bytearray` buffer of
+    `buffer_size` bytes and written into a binary `sink`, the number of
+    written bytes is returned. Partial writes of raw (unbuffered) sinks are
+    repeated until each chunk is written whole. The sink must be blocking,
+    a sink accepting no bytes raises :class:`BlockingIOError` with
+    `characters_written` set to the number of bytes written so far.
+
+    >>> sink = BytesIO()
+    >>> write_str(iter(['a', 'č']), sink, encoding='utf-8')
+    4
+    >>> sink.getvalue().decode('utf-8')
+    'a,č'
+
+    The buffer can be reused among multiple calls. It is grown to
+    `buffer_size` bytes once and keeps its size (its content is scratch).
+
+    >>> buffer = bytearray()
+    >>> write_str(iter('ab'), BytesIO(), encoding='ascii', buffer=buffer)
+    3
+    >>> write_str(iter('abc'), BytesIO(), encoding='ascii', buffer=buffer)
+    5
+    >>> len(buffer)
+    65536
+
+    This operation is terminal in the iterable.
+    """
+    tokens = map(key, it)
+    first = next(tokens, None)
+    if first is None:
+        return 0
+
+    if encoding is None:
+        return _write_text(first, tokens, sink, sep, buffer_size)
+
+    return _write_encoded(first, tokens, sink, sep, encoding, buffer_size,
+                          buffer)
+
+
+def _write_bytes(sink: IO[bytes], data: Any, written: int) -> int:
+    # Raw (unbuffered) sinks may write only a part of the chunk.
+    pos = 0
+    with memoryview(data) as view:
+        while pos < len(view):
+            n = sink.write(view[pos:])
+            if not n:
+                # `None` of a non-blocking sink (or 0) means no progress.
+                raise BlockingIOError(
+                    errno.EAGAIN, 'Sink accepted no bytes.', written + pos
+                )
+            pos += n
+    return written + pos
+
+
+def _write_encoded(
+        first: str,
+        tokens: Iterable[str],
+        sink: IO[bytes],
+        sep: str,
+        encoding: str,
+        buffer_size: int,
+        buffer: Optional[bytearray]
+) -> int:
+    buf = bytearray() if buffer is None else buffer
+    if len(buf) < buffer_size:
+        buf.extend(bytes(buffer_size - len(buf)))
+    capacity = len(buf)
+    sep_bytes = sep.encode(encoding)
+    size = written = 0
+
+    with memoryview(buf) as view:
+        def put(data: bytes) -> None:
+            nonlocal size, written
+            m = len(data)
+            if size + m > capacity:
+                written = _write_bytes(sink, view[:size], written)
+                size = 0
+                if m > capacity:
+                    written = _write_bytes(sink, data, written)
+                    return
+            # Same-length slice assignment never reallocates the buffer.
+            view[size:size + m] = data
+            size += m
+
+        put(first.encode(encoding))
+        for token in tokens:
+            put(sep_bytes)
+            put(token.encode(encoding))
+        return _write_bytes(sink, view[:size], written)
+
+
+def _write_text(
+        first: str,
+        tokens: Iterable[str],
+        sink: IO[str],
+        sep: str,
+        buffer_size: int
+) -> int:
+    parts = [first]
+    size = len(first)
+    written = 0
+    for token in tokens:
+        if size >= buffer_size:
+            chunk = sep.join(parts)
+            sink.write(chunk)
+            sink.write(sep)
+            written += len(chunk) + len(sep)
+            parts.clear()
+            size = 0
+        parts.append(token)
+        size += len(token) + len(sep)
+
+    chunk = sep.join(parts)
+    sink.write(chunk)
+    return written + len(chunk)
+
+
 # Common composition of extracting unique items followed by list
 unique_list: Callable[[Iterable[E]], Seq[E]] = compose(collect, unique)
 
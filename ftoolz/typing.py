@@ -1,4 +1,5 @@
-from typing import Iterable, Mapping, Optional, Sequence, TypeVar
+import sys
+from typing import Any, Iterable, Mapping, Optional, Sequence, TypeVar
 
 A = TypeVar('A')
 B = TypeVar('B')
@@ -27,6 +28,32 @@ def assert_some(a: Optional[A]) -> A:
     return a
 
 
+def is_ndarray(a: Any) -> bool:
+    """
+    Check whether given object is a NumPy `ndarray` (or its subclass).
+
+    NumPy is an optional dependency, so it is never imported by this check.
+    If it has not been imported by anyone, the object cannot be an array.
+
+    >>> is_ndarray([1, 2, 3])
+    False
+    """
+    np = sys.modules.get('numpy')
+    return np is not None and isinstance(a, np.ndarray)
+
+
+def is_ufunc(f: Any) -> bool:
+    """
+    Check whether given object is a NumPy universal function (`ufunc`).
+    Like :func:`is_ndarray`, this check never imports NumPy.
+
+    >>> is_ufunc(abs)
+    False
+    """
+    np = sys.modules.get('numpy')
+    return np is not None and isinstance(f, np.ufunc)
+
+
 def seq(it: Iterable[A] = ()) -> Seq[A]:
     """
     Type constructor for immutable :class:`Seq`.
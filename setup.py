@@ -23,13 +23,17 @@ dev_requirements = [
     'twine==3.1.0',
 ]
 
+numpy_requirements = [
+    'numpy==1.17.4',
+]
+
 test_requirements = [
     'coverage==4.5.4',
     'flake8==3.7.9',
     'mypy==0.740',
     'nose==1.3.7',
     'pylint==2.4.4',
-]
+] + numpy_requirements
 
 
 setup(
@@ -61,7 +65,11 @@ setup(
     zip_safe=False,
     python_requires='>=3.6',
     install_requires=requirements,
-    extras_require={'dev': dev_requirements, 'test': test_requirements},
+    extras_require={
+        'dev': dev_requirements,
+        'numpy': numpy_requirements,
+        'test': test_requirements,
+    },
     test_suite='tests',
     tests_require=requirements + test_requirements,
 )
@@ -0,0 +1,37 @@
+from unittest import TestCase
+
+from ftoolz.aitertoolz import associate, find, make_str, take
+from ftoolz.functoolz.aiter import from_iterable
+from tests.test_functoolz.test_aiter import collect, run
+
+
+class AsyncIterToolzTest(TestCase):
+
+    def test_take(self) -> None:
+        it = from_iterable([1, 2, 3])
+        self.assertListEqual([1, 2], run(take(2, it)))
+        self.assertListEqual([3], run(collect(it)))
+        self.assertListEqual([], run(take(2, from_iterable([]))))
+
+        with self.assertRaises(ValueError):
+            run(take(-1, from_iterable([])))
+
+    def test_find(self) -> None:
+        def even(x: int) -> bool:
+            return x % 2 == 0
+
+        self.assertEqual(4, run(find(even, from_iterable([1, 5, 4, 7, 2]))))
+        self.assertIsNone(run(find(even, from_iterable([1, 3]))))
+
+    def test_associate(self) -> None:
+        values = from_iterable([('a', 1), ('b', 2), ('a', 3)])
+        self.assertDictEqual(
+            {'a': ('a', 3), 'b': ('b', 2)},
+            run(associate(lambda x: x[0], values))
+        )
+
+    def test_make_str(self) -> None:
+        self.assertEqual('1,2,3', run(make_str(from_iterable([1, 2, 3]))))
+        self.assertEqual(
+            'A-B', run(make_str(from_iterable('ab'), key=str.upper, sep='-'))
+        )
@@ -0,0 +1,148 @@
+import asyncio
+import random
+from typing import Any, AsyncIterable, Awaitable, Callable, List, Tuple
+from unittest import TestCase
+
+from ftoolz.functoolz import aiter
+from ftoolz.functoolz.aiter import from_iterable
+
+
+def run(aw: Awaitable[Any]) -> Any:
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(aw)
+    finally:
+        loop.close()
+
+
+async def collect(it: AsyncIterable[Any]) -> List[Any]:
+    return [x async for x in it]
+
+
+class AsyncIterTest(TestCase):
+
+    def test_functor(self) -> None:
+        def f(x: int) -> str:
+            return str(x)
+
+        cases: List[Tuple[AsyncIterable[Any], List[Any]]] = [
+            (aiter.fmap(f, from_iterable([1, 2])), ['1', '2']),
+            (aiter.lift(f)(from_iterable([])), []),
+            (aiter.fproduct(f, from_iterable([1])), [(1, '1')]),
+            (aiter.generate(f, 1, 6, 2), ['1', '3', '5']),
+            (aiter.unit(42), [42]),
+        ]
+
+        for actual, expected in cases:
+            with self.subTest(expected=expected):
+                self.assertListEqual(expected, run(collect(actual)))
+
+    def test_monad(self) -> None:
+        def f(x: int) -> AsyncIterable[int]:
+            return from_iterable(range(x))
+
+        nested = from_iterable([from_iterable([1]), from_iterable([2, 3])])
+
+        cases: List[Tuple[AsyncIterable[Any], List[Any]]] = [
+            (aiter.flatmap(f, from_iterable([1, 2])), [0, 0, 1]),
+            (aiter.flatten(nested), [1, 2, 3]),
+        ]
+
+        for actual, expected in cases:
+            with self.subTest(expected=expected):
+                self.assertListEqual(expected, run(collect(actual)))
+
+    def test_applicative(self) -> None:
+        fa = [1, 2]
+        fb = ['a', 'b']
+        ff: List[Callable[[int], Any]] = [str, lambda x: x + 1]
+
+        cases: List[Tuple[AsyncIterable[Any], List[Any]]] = [
+            (
+                aiter.apply(from_iterable(ff), from_iterable(fa)),
+                ['1', '2', 2, 3]
+            ),
+            (
+                aiter.fmap2(
+                    lambda a, b: b * a, from_iterable(fa), from_iterable(fb)
+                ),
+                ['a', 'b', 'aa', 'bb']
+            ),
+            (
+                aiter.product(from_iterable(fa), from_iterable(fb)),
+                [(1, 'a'), (1, 'b'), (2, 'a'), (2, 'b')]
+            ),
+            (
+                aiter.zip_map(
+                    lambda a, b: b * a,
+                    from_iterable([1, 2, 3]), from_iterable(fb)
+                ),
+                ['a', 'bb']
+            ),
+            (aiter.zip_map(str), []),
+        ]
+
+        for actual, expected in cases:
+            with self.subTest(expected=expected):
+                self.assertListEqual(expected, run(collect(actual)))
+
+    def test_fmap_concurrent(self) -> None:
+        running = 0
+        peak = 0
+
+        async def f(x: int) -> int:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(random.random() / 100)
+            running -= 1
+            return x * 2
+
+        xs = list(range(20))
+
+        ordered = aiter.fmap_concurrent(f, from_iterable(xs), concurrency=4)
+        self.assertListEqual([x * 2 for x in xs], run(collect(ordered)))
+        self.assertEqual(4, peak)
+
+        peak = 0
+        unordered = aiter.fmap_concurrent(
+            f, from_iterable(xs), concurrency=3, ordered=False
+        )
+        self.assertListEqual(
+            [x * 2 for x in xs], sorted(run(collect(unordered)))
+        )
+        self.assertEqual(3, peak)
+
+    def test_fmap_concurrent_backpressure(self) -> None:
+        pulled = []
+
+        async def source() -> AsyncIterable[int]:
+            for i in range(100):
+                pulled.append(i)
+                yield i
+
+        async def f(x: int) -> int:
+            await asyncio.sleep(0)
+            return x
+
+        async def main() -> List[int]:
+            it = aiter.fmap_concurrent(f, source(), concurrency=5)
+            first = [await it.__anext__() for _ in range(2)]
+            await it.aclose()
+            return first
+
+        self.assertListEqual([0, 1], run(main()))
+        self.assertLessEqual(len(pulled), 6)
+
+    def test_fmap_concurrent_error(self) -> None:
+        async def f(x: int) -> int:
+            if x == 3:
+                raise ValueError(x)
+            return x
+
+        it = aiter.fmap_concurrent(f, from_iterable(range(10)))
+        with self.assertRaises(ValueError):
+            run(collect(it))
+
+        with self.assertRaises(ValueError):
+            aiter.fmap_concurrent(f, from_iterable([]), concurrency=0)
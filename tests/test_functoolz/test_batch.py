@@ -0,0 +1,138 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+from unittest import TestCase
+
+from ftoolz.functoolz.batch import Coalescer
+
+
+class CoalescerTest(TestCase):
+
+    def setUp(self) -> None:
+        self.batches: List[List[int]] = []
+        self.lock = threading.Lock()
+
+    def bulk(self, keys: List[int]) -> Dict[int, int]:
+        with self.lock:
+            self.batches.append(keys)
+        return {k: k * 10 for k in keys if k >= 0}
+
+    def test_threads_coalesced(self) -> None:
+        loader = Coalescer(self.bulk, max_batch_size=8, max_wait=0.5)
+        keys = [1, 2, 3, 1, 2, 3, -1, 4]
+
+        with ThreadPoolExecutor(len(keys)) as pool:
+            actual = list(pool.map(loader, keys))
+
+        self.assertListEqual([10, 20, 30, 10, 20, 30, None, 40], actual)
+        self.assertEqual(1, len(self.batches))
+        self.assertListEqual([-1, 1, 2, 3, 4], sorted(self.batches[0]))
+        self.assertEqual(8, loader.stats.calls)
+
+    def test_threads_max_batch_size(self) -> None:
+        loader = Coalescer(self.bulk, max_batch_size=2, max_wait=0.5)
+
+        with ThreadPoolExecutor(6) as pool:
+            actual = list(pool.map(loader, range(6)))
+
+        self.assertListEqual([0, 10, 20, 30, 40, 50], actual)
+        self.assertTrue(all(len(b) <= 2 for b in self.batches))
+        self.assertEqual(6, sum(len(b) for b in self.batches))
+
+    def test_threads_error(self) -> None:
+        def bulk(keys: List[int]) -> Dict[int, int]:
+            raise ConnectionError('backend down')
+
+        loader = Coalescer(bulk, max_wait=0.01)
+
+        with self.assertRaises(ConnectionError):
+            loader(1)
+
+    def test_threads_interrupted(self) -> None:
+        class Interrupt(BaseException):
+            pass
+
+        started = threading.Event()
+
+        def bulk(keys: List[int]) -> Dict[int, int]:
+            started.wait(1)
+            raise Interrupt()
+
+        loader = Coalescer(bulk, max_wait=0.5)
+
+        def follow() -> None:
+            started.set()
+            loader(2)
+
+        with ThreadPoolExecutor(2) as pool:
+            leader = pool.submit(loader, 1)
+            while loader._pending is None:
+                pass
+            follower = pool.submit(follow)
+            with self.assertRaises(Interrupt):
+                leader.result(5)
+            with self.assertRaises(RuntimeError):
+                follower.result(5)
+
+    def test_load_async(self) -> None:
+        loader = Coalescer(self.bulk, max_batch_size=3, max_wait=0.01)
+
+        async def main() -> List[object]:
+            keys = [1, 2, 1, 3, 4, -1]
+            return list(await asyncio.gather(
+                *(loader.load_async(k) for k in keys)
+            ))
+
+        loop = asyncio.new_event_loop()
+        try:
+            actual = loop.run_until_complete(main())
+        finally:
+            loop.close()
+
+        self.assertListEqual([10, 20, 10, 30, 40, None], actual)
+        self.assertListEqual([[1, 2, 3], [4, -1]], self.batches)
+
+    def test_load_async_coroutine_bulk(self) -> None:
+        async def bulk(keys: List[int]) -> Dict[int, int]:
+            await asyncio.sleep(0)
+            return self.bulk(keys)
+
+        loader = Coalescer(bulk, max_wait=0.01)
+
+        async def main() -> List[object]:
+            return list(await asyncio.gather(
+                loader.load_async(1), loader.load_async(2)
+            ))
+
+        loop = asyncio.new_event_loop()
+        try:
+            actual = loop.run_until_complete(main())
+        finally:
+            loop.close()
+
+        self.assertListEqual([10, 20], actual)
+        self.assertListEqual([[1, 2]], self.batches)
+
+    def test_load_async_cancelled_caller(self) -> None:
+        loader = Coalescer(self.bulk, max_wait=0.01)
+
+        async def main() -> object:
+            first = asyncio.ensure_future(loader.load_async(1))
+            second = asyncio.ensure_future(loader.load_async(2))
+            await asyncio.sleep(0)
+            first.cancel()
+            return await second
+
+        loop = asyncio.new_event_loop()
+        errors: List[object] = []
+        loop.set_exception_handler(lambda _, context: errors.append(context))
+        try:
+            actual = loop.run_until_complete(main())
+            loop.run_until_complete(asyncio.sleep(0.02))
+        finally:
+            loop.close()
+
+        self.assertEqual(20, actual)
+        self.assertListEqual([[1, 2]], self.batches)
+        self.assertListEqual([], errors)
@@ -0,0 +1,47 @@
+import os
+from tempfile import TemporaryDirectory
+from typing import Iterator
+from unittest import TestCase
+
+from ftoolz.adt.reiterable import Reiterable
+from ftoolz.adt.spill import SpillBuffer
+from ftoolz.functoolz import iter as fiter
+
+
+class ReplayTest(TestCase):
+
+    def test_product_of_file_streams(self) -> None:
+        with TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'b.txt')
+            with open(path, 'w') as f:
+                f.write('x\ny\nz\n')
+
+            opened = []
+
+            def lines() -> Iterator[str]:
+                opened.append(path)
+                with open(path) as f:
+                    yield from (line.strip() for line in f)
+
+            actual = list(fiter.product(iter([1, 2]), Reiterable(lines)))
+
+        expected = [(a, b) for a in (1, 2) for b in 'xyz']
+        self.assertListEqual(expected, actual)
+        self.assertEqual(2, len(opened))
+
+    def test_spill_threshold(self) -> None:
+        fb = SpillBuffer(iter(range(1000)), maxsize=10)
+
+        actual = list(fiter.fmap2(lambda a, b: a * b, iter([1, -1]), fb))
+
+        self.assertListEqual(
+            list(range(1000)) + [-b for b in range(1000)], actual
+        )
+        self.assertEqual('SpillBuffer(memory=10, spilled=990)', repr(fb))
+        fb.close()
+
+    def test_spill_argument(self) -> None:
+        fb = (str(i) for i in range(100))
+        actual = list(fiter.product(iter('ab'), fb, spill=5))
+        self.assertEqual(200, len(actual))
+        self.assertTupleEqual(('b', '99'), actual[-1])
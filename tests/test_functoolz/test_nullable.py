@@ -0,0 +1,93 @@
+from typing import Any
+from unittest import TestCase, skipUnless
+
+from ftoolz.adt.column import Column
+from ftoolz.functoolz import nullable, vectorizable
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None  # type: ignore
+
+# Masked arrays are passed where lists are expected, so NumPy is used untyped.
+np: Any = numpy
+
+
+class NullableTest(TestCase):
+
+    def test_fmap_all_present(self) -> None:
+        col = nullable.fmap(str, Column([1, 2]))
+        self.assertEqual(['1', '2'], col)
+        self.assertIsNone(col.validity)
+
+    def test_fmap_skips_nulls(self) -> None:
+        calls = []
+
+        def f(x: int) -> int:
+            calls.append(x)
+            return -x
+
+        col = nullable.fmap(f, Column([1, 0, 3], b'\x05'))
+        self.assertEqual([-1, None, -3], col)
+        self.assertListEqual([1, 3], calls)
+
+    def test_fmapN(self) -> None:
+        a = Column.of([1, None, 3, 4, 5, 6, 7, 8, 9])
+        b = Column.of([1, 2, 3, 4, 5, 6, 7, 8, None])
+        c = Column.of([1] * 9)
+        col = nullable.fmapN(lambda x, y, z: x + y + z, a, b, c)
+        self.assertEqual([3, None, 7, 9, 11, 13, 15, 17, None], col)
+        self.assertEqual(2, col.null_count)
+
+    def test_fmapN_errors(self) -> None:
+        with self.assertRaises(ValueError):
+            nullable.fmapN(str)
+        with self.assertRaises(ValueError):
+            nullable.fmap2(max, Column.of([1]), Column.of([1, 2]))
+        with self.assertRaises(TypeError):
+            nullable.fmap(str, [1, 2])
+
+    def test_applyN(self) -> None:
+        self.assertEqual(
+            [None] * 9, nullable.applyN(None, Column.of(range(9)))
+        )
+        self.assertEqual([0, None], nullable.applyN(abs, Column.of([0, None])))
+
+
+@skipUnless(np is not None, 'requires numpy')
+class VectorizedNullableTest(TestCase):
+
+    def test_column_vectorized(self) -> None:
+        a = Column(np.array([1, 2, 3]), b'\x05')
+        b = Column(np.array([10, 20, 30]))
+        col = nullable.fmap2(np.add, a, b)
+        self.assertIsInstance(col.values, np.ndarray)
+        self.assertEqual([11, None, 33], col)
+        self.assertEqual(b'\x05', col.validity)
+
+    def test_column_scalar_fallback(self) -> None:
+        col = nullable.fmap(str, Column(np.array([1, 2]), b'\x02'))
+        self.assertEqual([None, '2'], col)
+
+    def test_masked(self) -> None:
+        a = np.ma.masked_array([1.0, 4.0, 9.0], mask=[0, 1, 0])
+        b = np.ma.masked_array([1.0, 1.0, 1.0], mask=[0, 0, 1])
+
+        add = vectorizable(lambda x, y: x + y)
+        for f in (np.add, add, lambda x, y: x + y):
+            with self.subTest(f=f):
+                result = nullable.fmap2(f, a, b)
+                self.assertIsInstance(result, np.ma.MaskedArray)
+                np.testing.assert_array_equal(
+                    [False, True, True], np.ma.getmaskarray(result)
+                )
+                self.assertEqual(2.0, result[0])
+
+    def test_masked_applyN(self) -> None:
+        a = np.ma.masked_array([1, 2])
+        self.assertTrue(np.ma.getmaskarray(nullable.applyN(None, a)).all())
+
+    def test_masked_with_column(self) -> None:
+        a = np.ma.masked_array([1, 2, 3], mask=[1, 0, 0])
+        col = nullable.fmap2(np.multiply, a, Column(np.array([2, 2, 2])))
+        self.assertEqual([None, 4, 6], col)
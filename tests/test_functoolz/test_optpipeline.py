@@ -0,0 +1,77 @@
+from typing import Optional
+from unittest import TestCase
+
+from ftoolz.functoolz import opt
+from ftoolz.functoolz.optpipeline import OptionalPipeline, OptionalStageKind
+
+
+def parse_int(s: str) -> Optional[int]:
+    return int(s) if s.isdigit() else None
+
+
+class OptionalPipelineTest(TestCase):
+
+    def test_matches_nested_opt(self) -> None:
+        f = OptionalPipeline().map(str.strip).flatmap(parse_int) \
+            .filter(lambda x: x > 0).map(str).compile()
+
+        def nested(s: Optional[str]) -> Optional[str]:
+            x = opt.flatmap(parse_int, opt.fmap(str.strip, s))
+            return opt.fmap(str, opt.flatmap(lambda v: v if v > 0 else None,
+                                             x))
+
+        for s in (None, '', ' 7 ', '0', 'x', '12'):
+            with self.subTest(s=s):
+                self.assertEqual(nested(s), f(s))
+
+    def test_stage_kinds(self) -> None:
+        p = OptionalPipeline(parse_int).map(str).filter(bool) \
+            .fmapN(len, str.strip)
+        self.assertListEqual(
+            [OptionalStageKind.FLATMAP, OptionalStageKind.MAP,
+             OptionalStageKind.FILTER, OptionalStageKind.FMAPN],
+            [stage.kind for stage in p.stages]
+        )
+
+    def test_early_exit(self) -> None:
+        calls = []
+
+        def track(x: int) -> int:
+            calls.append(x)
+            return x
+
+        f = OptionalPipeline(lambda x: None, track).map(track).compile()
+        self.assertIsNone(f(1))
+        self.assertListEqual([], calls)
+
+    def test_fmapN_lazy_arguments(self) -> None:
+        calls = []
+
+        def second(r: dict) -> Optional[int]:
+            calls.append(r)
+            return r.get('b')
+
+        f = OptionalPipeline().fmapN(
+            lambda a, b: a + b, lambda r: r.get('a'), second
+        ).map(str).compile()
+
+        self.assertEqual('3', f({'a': 1, 'b': 2}))
+        self.assertIsNone(f({'a': 1}))
+        self.assertIsNone(f({'b': 2}))
+        self.assertEqual(2, len(calls))
+
+    def test_nested_pipelines(self) -> None:
+        inner = OptionalPipeline().map(abs)
+        f = OptionalPipeline(inner, inner.map(str)).compile()
+        self.assertEqual('1', f(-1))
+        self.assertEqual(3, f.stages)
+
+    def test_map_returning_none(self) -> None:
+        d = {'a': 1}
+        f = OptionalPipeline().map(d.get).map(str).compile()
+        self.assertEqual(opt.fmap(str, opt.fmap(d.get, 'b')), f('b'))
+        self.assertEqual('1', f('a'))
+
+        g = OptionalPipeline().map(d.get).filter(lambda x: x > 0).compile()
+        self.assertIsNone(g('b'))
+        self.assertEqual(1, g('a'))
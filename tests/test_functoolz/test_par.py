@@ -0,0 +1,87 @@
+from concurrent.futures import ThreadPoolExecutor
+from itertools import count
+from typing import Iterator, List
+from unittest import TestCase
+
+from ftoolz.functoolz import par
+
+
+def square(x: int) -> int:
+    return x * x
+
+
+def pair(x: int) -> List[int]:
+    return [x, -x]
+
+
+def add(a: int, b: int) -> int:
+    return a + b
+
+
+class ParallelTest(TestCase):
+
+    def test_executors(self) -> None:
+        xs = list(range(50))
+
+        for executor in ('thread', 'process'):
+            with self.subTest(executor=executor):
+                self.assertListEqual(
+                    [x * x for x in xs],
+                    list(par.fmap(square, xs, executor, workers=2))
+                )
+                self.assertListEqual(
+                    [y for x in xs for y in (x, -x)],
+                    list(par.flatmap(pair, xs, executor, workers=2))
+                )
+                self.assertListEqual(
+                    [(x, x * x) for x in xs],
+                    list(par.fproduct(square, xs, executor, workers=2))
+                )
+                self.assertListEqual(
+                    [2 * x for x in xs],
+                    list(par.zip_map(add, xs, iter(xs), executor=executor,
+                                     workers=2))
+                )
+
+    def test_unordered(self) -> None:
+        xs = range(100)
+        actual = par.fmap(square, xs, workers=4, chunksize=3, ordered=False)
+        self.assertListEqual([x * x for x in xs], sorted(actual))
+
+    def test_shared_executor(self) -> None:
+        with ThreadPoolExecutor(2) as pool:
+            first = list(par.fmap(square, range(5), pool))
+            second = list(par.fmap(square, range(5), pool, ordered=False))
+        self.assertListEqual([0, 1, 4, 9, 16], first)
+        self.assertListEqual([0, 1, 4, 9, 16], sorted(second))
+
+    def test_window(self) -> None:
+        pulled = []
+
+        def source() -> Iterator[int]:
+            for i in count():
+                pulled.append(i)
+                yield i
+
+        it = par.fmap(square, source(), workers=2, chunksize=2, window=3)
+        self.assertListEqual([0, 1, 4], [next(it) for _ in range(3)])
+        it.close()
+        self.assertLessEqual(len(pulled), 2 * 4)
+
+    def test_errors(self) -> None:
+        def fail(x: int) -> int:
+            raise KeyError(x)
+
+        with self.assertRaises(KeyError):
+            list(par.fmap(fail, [1, 2]))
+
+        invalid = [
+            dict(executor='gpu'),
+            dict(workers=0),
+            dict(chunksize=0),
+            dict(window=0),
+        ]
+        for kwargs in invalid:
+            with self.subTest(kwargs=kwargs):
+                with self.assertRaises(ValueError):
+                    par.fmap(square, [1], **kwargs)  # type: ignore
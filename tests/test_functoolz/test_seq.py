@@ -0,0 +1,69 @@
+from typing import Any
+from unittest import TestCase, skipUnless
+
+from ftoolz.functoolz import seq, vectorizable
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None  # type: ignore
+
+# Arrays are passed where sequences are expected, so NumPy is used untyped.
+np: Any = numpy
+
+
+@skipUnless(np is not None, 'requires numpy')
+class VectorizedSeqTest(TestCase):
+
+    def assertArrayEqual(self, expected: object, actual: object) -> None:
+        self.assertIsInstance(actual, np.ndarray)
+        np.testing.assert_array_equal(expected, actual)
+
+    def test_fmap(self) -> None:
+        xs = np.array([1.0, 4.0, 9.0])
+
+        self.assertArrayEqual([1.0, 2.0, 3.0], seq.fmap(np.sqrt, xs))
+        self.assertArrayEqual(
+            [3.0, 9.0, 19.0], seq.fmap(vectorizable(lambda x: 2 * x + 1), xs)
+        )
+        self.assertArrayEqual([], seq.fmap(np.sqrt, np.array([])))
+
+    def test_fmap_scalar_fallback(self) -> None:
+        xs = np.array([1, 2])
+        self.assertEqual(('1', '2'), seq.fmap(str, xs))
+        self.assertEqual((1.0, 2.0), seq.fmap(np.sqrt, (1, 4)))
+
+    def test_zip_map(self) -> None:
+        xs = np.array([1, 2, 3, 4])
+        ys = np.array([10, 20, 30])
+
+        self.assertArrayEqual([11, 22, 33], seq.zip_map(np.add, xs, ys))
+        self.assertEqual((11, 22, 33), seq.zip_map(np.add, xs, list(ys)))
+
+    def test_fmap2(self) -> None:
+        xs = np.array([1, 2])
+        ys = np.array([10, 20, 30])
+
+        self.assertArrayEqual(
+            [11, 21, 31, 12, 22, 32], seq.fmap2(np.add, xs, ys)
+        )
+        self.assertArrayEqual([], seq.fmap2(np.add, xs, np.array([])))
+
+    def test_product(self) -> None:
+        xs = np.array([1, 2])
+        ys = np.array([10, 20])
+
+        self.assertArrayEqual(
+            [[1, 10], [1, 20], [2, 10], [2, 20]], seq.product(xs, ys)
+        )
+
+    def test_product_mixed_dtypes(self) -> None:
+        xs = np.array([1, 2])
+        ys = np.array(['a', 'b'])
+
+        self.assertEqual(
+            ((1, 'a'), (1, 'b'), (2, 'a'), (2, 'b')), seq.product(xs, ys)
+        )
+
+    def test_generate_stays_tuple(self) -> None:
+        self.assertEqual((0, 1, 4, 9), seq.generate(np.square, 4))
@@ -0,0 +1,150 @@
+from io import BytesIO
+from typing import Any
+from unittest import TestCase, skipUnless
+
+from ftoolz.adt.spill import BufferOverflowError
+from ftoolz.itertoolz import find_many, find_vectorized, split_by_lazy, \
+    write_str
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None  # type: ignore
+
+# Predicates return NumPy booleans and masks, so NumPy is used untyped.
+np: Any = numpy
+
+
+@skipUnless(np is not None, 'requires numpy')
+class FindVectorizedTest(TestCase):
+
+    def test_find_vectorized(self) -> None:
+        xs = np.array([1, 5, 4, 7, 2])
+
+        cases = [
+            (lambda x: x % 2 == 0, 4),
+            (lambda x: x > 5, 7),
+            (lambda x: x < 0, None),
+        ]
+
+        for pred, expected in cases:
+            with self.subTest(expected=expected):
+                self.assertEqual(expected, find_vectorized(pred, xs))
+
+    def test_find_vectorized_empty(self) -> None:
+        xs = np.array([], dtype=int)
+        self.assertIsNone(find_vectorized(lambda x: x > 0, xs))
+
+    def test_find_vectorized_fallback(self) -> None:
+        xs = np.array([[1, 2], [3, 4]])
+        row = find_vectorized(lambda r: r.sum() > 5, xs)
+        self.assertListEqual([3, 4], np.asarray(row).tolist())
+
+    def test_find_many_vectorized(self) -> None:
+        calls = []
+
+        def even(x: Any) -> Any:
+            calls.append(x)
+            return x % 2 == 0
+
+        xs = np.arange(1, 10)
+        found = find_many([even, lambda x: x > 7], xs, vectorized=True)
+
+        self.assertEqual((2, 8), found)
+        self.assertEqual(1, len(calls))
+        self.assertIs(xs, calls[0])
+
+    def test_find_many_not_vectorized(self) -> None:
+        xs = np.arange(1, 10)
+        found = find_many([lambda x: x > 3, lambda x: x > 7], xs)
+        self.assertEqual((4, 8), found)
+
+
+def even(x: int) -> bool:
+    return x % 2 == 0
+
+
+class FindManyTest(TestCase):
+
+    def test_find_many_no_preds(self) -> None:
+        it = iter([1, 2])
+        self.assertEqual((), find_many([], it))
+        self.assertEqual(1, next(it))
+
+
+class SplitByLazyTest(TestCase):
+
+    def test_overflow_keeps_items(self) -> None:
+        pos, neg = split_by_lazy(even, iter([1, 3, 5, 7, 2]), maxsize=2)
+        for _ in range(2):
+            with self.assertRaises(BufferOverflowError):
+                next(pos)
+        self.assertEqual(1, next(neg))
+        with self.assertRaises(BufferOverflowError):
+            next(pos)
+        self.assertListEqual([3, 5, 7], list(neg))
+        self.assertListEqual([2], list(pos))
+
+    def test_close_stops_buffering(self) -> None:
+        pos, neg = split_by_lazy(even, iter(range(10)), maxsize=0)
+        neg.close()
+        self.assertListEqual([0, 2, 4, 6, 8], list(pos))
+        self.assertListEqual([], list(neg))
+
+    def test_closed_branch_is_exhausted(self) -> None:
+        pos, neg = split_by_lazy(even, iter(range(10)))
+        pos.close()
+        self.assertListEqual([], list(pos))
+        self.assertListEqual([1, 3, 5, 7, 9], list(neg))
+
+
+class _PartialSink(BytesIO):
+    """
+    Raw-like sink accepting at most 3 bytes per write.
+    """
+
+    def write(self, b: Any) -> int:
+        return super().write(bytes(b[:3]))
+
+
+class _BlockingSink(BytesIO):
+    """
+    Non-blocking-like sink that accepts nothing on every other write.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls = 0
+
+    def write(self, b: Any) -> Any:
+        self.calls += 1
+        return None if self.calls % 2 == 0 else super().write(b)
+
+
+class WriteStrTest(TestCase):
+
+    def test_partial_writes(self) -> None:
+        sink = _PartialSink()
+        tokens = [str(i) for i in range(100)]
+        written = write_str(iter(tokens), sink, encoding='ascii',
+                            buffer_size=8)
+        self.assertEqual(','.join(tokens).encode(), sink.getvalue())
+        self.assertEqual(len(sink.getvalue()), written)
+
+    def test_buffer_reused(self) -> None:
+        buffer = bytearray()
+        tokens = ['x' * 5, 'y' * 20, 'z']
+        sink = BytesIO()
+        written = write_str(iter(tokens), sink, encoding='ascii',
+                            buffer_size=8, buffer=buffer)
+        self.assertEqual(','.join(tokens).encode(), sink.getvalue())
+        self.assertEqual(len(sink.getvalue()), written)
+        self.assertEqual(8, len(buffer))
+
+    def test_sink_without_progress(self) -> None:
+        sink = _BlockingSink()
+        with self.assertRaises(BlockingIOError) as ctx:
+            write_str(iter(['abc'] * 5), sink, encoding='ascii',
+                      buffer_size=4)
+        self.assertEqual(len(sink.getvalue()),
+                         ctx.exception.characters_written)